@@ -1,8 +1,11 @@
 from base import function_ai, parameters_func, property_param
 import os
+import sys
 import json
+import types
 import base64
 import tempfile
+import functools
 import subprocess
 from typing import Dict, List, Optional
 
@@ -160,8 +163,231 @@ tools = [
     __EXPORT_DIAGRAM_FUNCTION__
 ]
 
+# 映射表
+# Spaces and dashes are not valid in Mermaid node ids
+_NODE_ID_TABLE = str.maketrans(' -', '__')
+
+# Map component types to Mermaid shapes
+_COMPONENT_SHAPES = {
+    'database': '[(Database)]',
+    'service': '([Service])',
+    'api': '[[API]]',
+    'queue': '>Queue]',
+    'storage': '[(Storage)]',
+    'loadbalancer': '{{Load Balancer}}',
+    'cache': '[(Cache)]',
+    'component': '[Component]'
+}
+
+# Map connection types to Mermaid arrows
+_CONNECTION_ARROWS = {
+    'http': '-->',
+    'https': '==>',
+    'grpc': '-.->',
+    'message': '-.->',
+    'database': '--->',
+    'async': '-.->',
+    'sync': '-->'
+}
+
+# Map flowchart step types to Mermaid shapes
+_STEP_SHAPES = {
+    'start': '([Start])',
+    'end': '([End])',
+    'process': '[Process]',
+    'decision': '{Decision}',
+    'input': '[/Input/]',
+    'output': '[\\\\Output\\\\]',
+    'predefined': '[Predefined Process]',
+    'storage': '[(Database)]',
+    'document': '[(Document)]',
+    'manual': '[(Manual)]',
+    'delay': '[(Delay)]'
+}
+
 # 工具函数实现
 
+class _RenderError(Exception):
+    '''Raised by the cached renderers; the message is returned to the caller as-is.'''
+
+
+# mermaid.ink rejects request URLs much beyond ~4 KB, so larger diagrams
+# are rendered locally (or refused) without a round-trip
+MERMAID_INK_MAX_ENCODED_LENGTH = 4000
+
+
+def _encode_mermaid(mermaid_code: str) -> str:
+    '''
+    Percent-encode Mermaid code for use in a mermaid.ink URL path.
+
+    :param mermaid_code: Stripped Mermaid syntax code
+    :type mermaid_code: str
+    :return: URL-encoded code
+    :rtype: str
+    '''
+    import urllib.parse
+
+    # ASCII payloads (the common case) skip the UTF-8 codec and
+    # quote_from_bytes avoids the str round-trip
+    if mermaid_code.isascii():
+        code_bytes = mermaid_code.encode("ascii")
+    else:
+        code_bytes = mermaid_code.encode("utf-8")
+    return urllib.parse.quote_from_bytes(code_bytes, safe=b"")
+
+
+def _mermaid_url(encoded_code: str, output_format: str) -> str:
+    '''
+    Build the mermaid.ink URL for already encoded code and an image format.
+
+    :param encoded_code: URL-encoded Mermaid code
+    :type encoded_code: str
+    :param output_format: Normalized image format: 'png' or 'svg'
+    :type output_format: str
+    :return: mermaid.ink URL
+    :rtype: str
+    '''
+    if output_format == "svg":
+        return f"https://mermaid.ink/svg/{encoded_code}"
+    return f"https://mermaid.ink/img/{encoded_code}"
+
+
+# Multiple of 3 so no chunk but the last one carries base64 padding
+_B64_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def _file_data_url(path: str, output_format: str) -> str:
+    '''
+    Read an image file and return it as a base64 data URL.
+
+    The file is encoded chunk by chunk into a preallocated buffer, so the
+    raw image and its encoding are never both held in full.
+
+    :param path: Path of the image file
+    :type path: str
+    :param output_format: Normalized image format: 'png' or 'svg'
+    :type output_format: str
+    :return: data URL of the image
+    :rtype: str
+    '''
+    prefix = f"data:image/{output_format};base64,".encode('ascii')
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        out = bytearray(len(prefix) + (size + 2) // 3 * 4)
+        out[:len(prefix)] = prefix
+        pos = len(prefix)
+        while True:
+            chunk = f.read(_B64_CHUNK_SIZE)
+            if not chunk:
+                break
+            encoded = base64.b64encode(chunk)
+            out[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+    del out[pos:]
+    return out.decode('ascii')
+
+
+def _render_with_mmdc_or_error(mermaid_code: str, output_format: str, output_path: str = None) -> str:
+    '''
+    Render Mermaid code with a local mermaid-cli (mmdc) installation.
+
+    Used for diagrams too large for mermaid.ink. Returns an error message
+    without running anything when mmdc is not on PATH.
+
+    :param mermaid_code: Stripped Mermaid syntax code
+    :type mermaid_code: str
+    :param output_format: Normalized image format: 'png' or 'svg'
+    :type output_format: str
+    :param output_path: Path to save the diagram file. If not provided, returns base64 encoded image.
+    :type output_path: str
+    :return: Base64 encoded image, success message or error message
+    :rtype: str
+    '''
+    import shutil
+
+    mmdc = shutil.which("mmdc")
+    if not mmdc:
+        return (f"Error: Mermaid code is too large for mermaid.ink (encoded length exceeds "
+                f"{MERMAID_INK_MAX_ENCODED_LENGTH}). Install mermaid-cli with "
+                f"'npm install -g @mermaid-js/mermaid-cli' to render it locally.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, "diagram.mmd")
+        with open(input_path, 'w', encoding='utf-8') as f:
+            f.write(mermaid_code)
+        target_path = output_path or os.path.join(tmp_dir, f"diagram.{output_format}")
+
+        try:
+            result = subprocess.run(
+                [mmdc, "-i", input_path, "-o", target_path],
+                capture_output=True, text=True, timeout=60
+            )
+        except subprocess.TimeoutExpired:
+            return "Error: mmdc timed out while rendering mermaid diagram"
+        if result.returncode != 0:
+            return f"Error: mmdc failed to render mermaid diagram: {result.stderr.strip()}"
+
+        if output_path:
+            return f"Success: Diagram saved to {output_path}"
+        return _file_data_url(target_path, output_format)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_mermaid(encoded_code: str, output_format: str) -> bytes:
+    '''
+    Render Mermaid code to image bytes via the mermaid.ink API.
+
+    Results are memoized per (code, format) for the lifetime of the process,
+    so repeated renders of the same diagram skip the network round-trip.
+    The code is stripped before it is encoded, so diagrams differing only
+    in surrounding whitespace share an entry. Failures raise and are
+    therefore never cached.
+
+    :param encoded_code: URL-encoded Mermaid code
+    :type encoded_code: str
+    :param output_format: Normalized image format: 'png' or 'svg'
+    :type output_format: str
+    :return: Raw image bytes
+    :rtype: bytes
+    '''
+    import requests
+
+    # Download the image
+    response = requests.get(_mermaid_url(encoded_code, output_format), timeout=30)
+    if response.status_code != 200:
+        raise _RenderError(f"Error: Failed to generate diagram from mermaid.ink. Status: {response.status_code}")
+    return response.content
+
+
+def _stream_mermaid(encoded_code: str, output_format: str, output_path: str) -> None:
+    '''
+    Render Mermaid code via mermaid.ink and stream the image straight to disk.
+
+    The response body is copied to the file in 64 KiB chunks, so the image is
+    never held in memory as a single bytes object.
+
+    :param encoded_code: URL-encoded Mermaid code
+    :type encoded_code: str
+    :param output_format: Normalized image format: 'png' or 'svg'
+    :type output_format: str
+    :param output_path: Path to save the diagram file
+    :type output_path: str
+    '''
+    import shutil
+    import requests
+
+    with requests.get(_mermaid_url(encoded_code, output_format), stream=True, timeout=30) as response:
+        if response.status_code != 200:
+            raise _RenderError(f"Error: Failed to generate diagram from mermaid.ink. Status: {response.status_code}")
+        # Let urllib3 undo any Content-Encoding while we copy the raw stream
+        response.raw.decode_content = True
+        try:
+            with open(output_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=64 * 1024)
+        except Exception as e:
+            raise _RenderError(f"Error: Failed to save diagram to {output_path}: {str(e)}")
+
+
 def generate_mermaid_diagram(mermaid_code: str, output_format: str = "png", output_path: str = None) -> str:
     '''
     Generate diagram from Mermaid syntax code.
@@ -181,7 +407,8 @@ def generate_mermaid_diagram(mermaid_code: str, output_format: str = "png", outp
         if not mermaid_code:
             return "Error: Mermaid code cannot be empty"
         
-        if output_format.lower() == "txt" or output_format.lower() == "mermaid":
+        output_format = output_format.lower()
+        if output_format == "txt" or output_format == "mermaid":
             # Just return the mermaid code
             if output_path:
                 try:
@@ -192,47 +419,82 @@ def generate_mermaid_diagram(mermaid_code: str, output_format: str = "png", outp
                     return f"Error: Failed to save mermaid code to {output_path}: {str(e)}"
             return mermaid_code
         
-        # For image formats, use mermaid.ink API
-        import requests
-        
-        # Encode mermaid code for URL
-        import urllib.parse
-        encoded_code = urllib.parse.quote(mermaid_code)
-        
-        # Use mermaid.ink API
-        url = f"https://mermaid.ink/img/{encoded_code}"
-        
-        # Set appropriate extension based on format
-        if output_format.lower() == "svg":
-            url = f"https://mermaid.ink/svg/{encoded_code}"
-        elif output_format.lower() == "pdf":
+        if output_format == "pdf":
             # mermaid.ink doesn't support PDF directly, return SVG instead
-            url = f"https://mermaid.ink/svg/{encoded_code}"
             output_format = "svg"
         
-        # Download the image
-        response = requests.get(url, timeout=30)
-        if response.status_code != 200:
-            return f"Error: Failed to generate diagram from mermaid.ink. Status: {response.status_code}"
+        # Requests over the mermaid.ink URL limit are guaranteed to fail,
+        # so skip the round-trip and render locally if possible
+        encoded_code = _encode_mermaid(mermaid_code)
+        if len(encoded_code) > MERMAID_INK_MAX_ENCODED_LENGTH:
+            return _render_with_mmdc_or_error(mermaid_code, output_format, output_path)
         
-        if output_path:
-            try:
-                with open(output_path, 'wb') as f:
-                    f.write(response.content)
+        # For image formats, use mermaid.ink API
+        try:
+            if output_path:
+                # Stream the response to disk instead of buffering it
+                _stream_mermaid(encoded_code, output_format, output_path)
                 return f"Success: Diagram saved to {output_path}"
-            except Exception as e:
-                return f"Error: Failed to save diagram to {output_path}: {str(e)}"
-        else:
-            # Return base64 encoded image
-            import base64
-            encoded_image = base64.b64encode(response.content).decode('utf-8')
-            return f"data:image/{output_format};base64,{encoded_image}"
+            # Cached per code/format
+            image_data = _render_mermaid(encoded_code, output_format)
+        except _RenderError as e:
+            return str(e)
+        
+        # Return base64 encoded image
+        encoded_image = base64.b64encode(image_data).decode('utf-8')
+        return f"data:image/{output_format};base64,{encoded_image}"
             
     except ImportError:
         return "Error: 'requests' library not installed. Please install it with 'pip install requests'"
     except Exception as e:
         return f"Error: Unexpected error when generating mermaid diagram: {str(e)}"
 
+def _render_dot(dot_code: str, output_format: str) -> bytes:
+    '''
+    Render Graphviz DOT code to image bytes.
+
+    The code is stripped before it becomes the cache key, so graphs that
+    differ only in surrounding whitespace share one rendering.
+
+    :param dot_code: DOT syntax code
+    :type dot_code: str
+    :param output_format: Normalized image format: 'png', 'svg' or 'pdf'
+    :type output_format: str
+    :return: Raw image bytes
+    :rtype: bytes
+    '''
+    return _render_dot_cached(dot_code.strip(), output_format)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_dot_cached(dot_code: str, output_format: str) -> bytes:
+    '''
+    Render stripped Graphviz DOT code to image bytes.
+
+    Results are memoized per (code, format) for the lifetime of the process,
+    so repeated renders of the same graph skip the Graphviz subprocess.
+
+    :param dot_code: Stripped DOT syntax code
+    :type dot_code: str
+    :param output_format: Normalized image format: 'png', 'svg' or 'pdf'
+    :type output_format: str
+    :return: Raw image bytes
+    :rtype: bytes
+    '''
+    from graphviz import Source
+    
+    # All intermediate files live in one temporary directory, which is
+    # removed in a single recursive cleanup
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Use graphviz Source to render
+        src = Source(dot_code, format=output_format)
+        
+        # Render to temporary file (the DOT source is cleaned up by graphviz)
+        temp_output = src.render(filename=os.path.join(tmp_dir, "diagram"), cleanup=True)
+        
+        with open(temp_output, 'rb') as f:
+            return f.read()
+
 def generate_dot_diagram(dot_code: str, output_format: str = "png", output_path: str = None) -> str:
     '''
     Generate diagram from Graphviz DOT syntax code.
@@ -274,51 +536,25 @@ def generate_dot_diagram(dot_code: str, output_format: str = "png", output_path:
             # Return DOT code with instructions
             return f"Error: Graphviz not installed. Please install with 'pip install graphviz' and ensure Graphviz binaries are installed on system.\\n\\nDOT code:\\n{dot_code}"
         
-        # Create graph from DOT code
-        import graphviz
-        from graphviz import Source
+        # Render the graph
+        format_map = {
+            'png': 'png',
+            'svg': 'svg',
+            'pdf': 'pdf'
+        }
         
-        # Create temporary file for DOT code
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dot', delete=False) as tmp:
-            tmp.write(dot_code)
-            tmp_path = tmp.name
+        fmt = format_map.get(output_format.lower(), 'png')
+        image_data = _render_dot(dot_code, fmt)
         
-        try:
-            # Render the graph
-            format_map = {
-                'png': 'png',
-                'svg': 'svg',
-                'pdf': 'pdf'
-            }
-            
-            fmt = format_map.get(output_format.lower(), 'png')
-            
-            # Use graphviz Source to render
-            src = Source(dot_code, format=fmt)
-            
-            if output_path:
-                # Render to file
-                src.render(filename=output_path.replace(f'.{fmt}', ''), cleanup=True)
-                return f"Success: Diagram saved to {output_path}"
-            else:
-                # Render to temporary file and read as base64
-                temp_output = src.render(filename=tempfile.mktemp(), cleanup=False)
-                
-                with open(temp_output, 'rb') as f:
-                    image_data = f.read()
-                
-                # Clean up
-                os.unlink(temp_output)
-                
-                # Return base64 encoded image
-                import base64
-                encoded_image = base64.b64encode(image_data).decode('utf-8')
-                return f"data:image/{fmt};base64,{encoded_image}"
-                
-        finally:
-            # Clean up temporary DOT file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        if output_path:
+            # Save to file
+            with open(output_path, 'wb') as f:
+                f.write(image_data)
+            return f"Success: Diagram saved to {output_path}"
+        else:
+            # Return base64 encoded image
+            encoded_image = base64.b64encode(image_data).decode('utf-8')
+            return f"data:image/{fmt};base64,{encoded_image}"
                 
     except Exception as e:
         return f"Error: Unexpected error when generating DOT diagram: {str(e)}"
@@ -368,44 +604,24 @@ def create_architecture_diagram(components: str, connections: str = None, title:
         
         # Add components as nodes
         for comp in comp_list:
-            node_id = comp.get('id', comp.get('name', '')).replace(' ', '_').replace('-', '_')
-            node_label = comp.get('label', comp.get('name', 'Node'))
-            node_type = comp.get('type', 'component').lower()
+            get = comp.get
+            name = get('name', '')
+            node_id = get('id', name).translate(_NODE_ID_TABLE)
+            node_label = get('label', name if 'name' in comp else 'Node')
+            node_type = get('type', 'component').lower()
             
-            # Map component types to Mermaid shapes
-            shape_map = {
-                'database': '[(Database)]',
-                'service': '([Service])',
-                'api': '[[API]]',
-                'queue': '>Queue]',
-                'storage': '[(Storage)]',
-                'loadbalancer': '{{Load Balancer}}',
-                'cache': '[(Cache)]',
-                'component': '[Component]'
-            }
-            
-            shape = shape_map.get(node_type, '[Component]')
+            shape = _COMPONENT_SHAPES.get(node_type, '[Component]')
             mermaid_code += f"    {node_id}{shape}{node_label}\\n"
         
         # Add connections
         for conn in conn_list:
-            from_node = conn.get('from', '').replace(' ', '_').replace('-', '_')
-            to_node = conn.get('to', '').replace(' ', '_').replace('-', '_')
-            conn_type = conn.get('type', '-->').lower()
-            
-            # Map connection types to Mermaid arrows
-            arrow_map = {
-                'http': '-->',
-                'https': '==>',
-                'grpc': '-.->',
-                'message': '-.->',
-                'database': '--->',
-                'async': '-.->',
-                'sync': '-->'
-            }
+            get = conn.get
+            from_node = get('from', '').translate(_NODE_ID_TABLE)
+            to_node = get('to', '').translate(_NODE_ID_TABLE)
+            conn_type = get('type', '-->').lower()
             
-            arrow = arrow_map.get(conn_type, '-->')
-            label = conn.get('label', '')
+            arrow = _CONNECTION_ARROWS.get(conn_type, '-->')
+            label = get('label', '')
             
             if label:
                 mermaid_code += f"    {from_node} {arrow}|{label}| {to_node}\\n"
@@ -472,35 +688,22 @@ def create_flowchart(steps: str, title: str = None, output_format: str = "png",
         
         # Add steps as nodes with appropriate shapes
         for step in steps_list:
-            step_id = step.get('id', '').replace(' ', '_').replace('-', '_')
-            step_label = step.get('label', 'Step')
-            step_type = step.get('type', 'process').lower()
-            
-            # Map step types to Mermaid shapes
-            shape_map = {
-                'start': '([Start])',
-                'end': '([End])',
-                'process': '[Process]',
-                'decision': '{Decision}',
-                'input': '[/Input/]',
-                'output': '[\\\\Output\\\\]',
-                'predefined': '[Predefined Process]',
-                'storage': '[(Database)]',
-                'document': '[(Document)]',
-                'manual': '[(Manual)]',
-                'delay': '[(Delay)]'
-            }
+            get = step.get
+            step_id = get('id', '').translate(_NODE_ID_TABLE)
+            step_label = get('label', 'Step')
+            step_type = get('type', 'process').lower()
             
-            shape = shape_map.get(step_type, '[Process]')
+            shape = _STEP_SHAPES.get(step_type, '[Process]')
             mermaid_code += f"    {step_id}{shape}{step_label}\\n"
         
         # Add connections (assuming steps are in order)
-        for i in range(len(steps_list) - 1):
-            current_id = steps_list[i].get('id', '').replace(' ', '_').replace('-', '_')
-            next_id = steps_list[i + 1].get('id', '').replace(' ', '_').replace('-', '_')
+        for current, following in zip(steps_list, steps_list[1:]):
+            get = current.get
+            current_id = get('id', '').translate(_NODE_ID_TABLE)
+            next_id = following.get('id', '').translate(_NODE_ID_TABLE)
             
             # Check for decision branches
-            current_type = steps_list[i].get('type', '').lower()
+            current_type = get('type', '').lower()
             if current_type == 'decision':
                 # Decision node should have yes/no branches
                 # This is simplified - in real implementation would need more complex logic
@@ -579,8 +782,9 @@ def create_sequence_diagram(actors: str, messages: str, title: str = None,
         
         # Add participants (actors)
         for actor in actors_list:
-            actor_name = actor.get('name', 'Actor')
-            actor_type = actor.get('type', 'participant').lower()
+            get = actor.get
+            actor_name = get('name', 'Actor')
+            actor_type = get('type', 'participant').lower()
             
             # Map actor types to Mermaid participant types
             if actor_type == 'actor':
@@ -594,10 +798,11 @@ def create_sequence_diagram(actors: str, messages: str, title: str = None,
         
         # Add messages
         for msg in messages_list:
-            from_actor = msg.get('from', '')
-            to_actor = msg.get('to', '')
-            message_text = msg.get('message', '')
-            msg_type = msg.get('type', 'sync').lower()
+            get = msg.get
+            from_actor = get('from', '')
+            to_actor = get('to', '')
+            message_text = get('message', '')
+            msg_type = get('type', 'sync').lower()
             
             # Map message types to Mermaid arrows
             if msg_type == 'async':
@@ -703,11 +908,13 @@ def convert_mermaid_to_dot(mermaid_code: str) -> str:
     dot_code += "}\\n"
     return dot_code
 
-TOOL_CALL_MAP = {
+# Read-only view: the map is never mutated after import, and interned keys
+# let dispatch lookups with interned tool names compare by identity
+TOOL_CALL_MAP = types.MappingProxyType({sys.intern(name): func for name, func in {
     "generate_mermaid_diagram": generate_mermaid_diagram,
     "generate_dot_diagram": generate_dot_diagram,
     "create_architecture_diagram": create_architecture_diagram,
     "create_flowchart": create_flowchart,
     "create_sequence_diagram": create_sequence_diagram,
     "export_diagram": export_diagram
-}
\ No newline at end of file
+}.items()})
\ No newline at end of file
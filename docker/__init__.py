@@ -1,3 +1,11 @@
-from .docker import tools, TOOL_CALL_MAP
+from .docker import TOOL_CALL_MAP, docker_available, docker_cache_clear, get_tools
 
-__all__ = ['tools', 'TOOL_CALL_MAP']
\ No newline at end of file
+__all__ = ['tools', 'TOOL_CALL_MAP', 'docker_available', 'docker_cache_clear']
+
+
+def __getattr__(name):
+    # `tools` is resolved on first access, like docker.docker.tools (PEP 562),
+    # so importing the package does not build the tool schemas
+    if name == "tools":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
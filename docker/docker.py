@@ -1,436 +1,756 @@
-from base import function_ai, parameters_func, property_param
+from base import function_ai
 
 import os
+import shutil
+import socket
+import selectors
 import subprocess
 import sys
+import re
 import json
+import shlex
+import collections
+import types
 import time
-from typing import Dict, List, Optional, Any
-
-__DOCKER_PROPERTY_ONE__ = property_param(
-    name="image",
-    description="Docker image name or ID.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_TWO__ = property_param(
-    name="container",
-    description="Docker container name or ID.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_THREE__ = property_param(
-    name="name",
-    description="Name for the container or resource.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_4__ = property_param(
-    name="command",
-    description="Command to run in container.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_5__ = property_param(
-    name="ports",
-    description="Port mappings (host:container).",
-    t="string"
-)
-
-__DOCKER_PROPERTY_6__ = property_param(
-    name="volumes",
-    description="Volume mappings (host:container).",
-    t="string"
-)
-
-__DOCKER_PROPERTY_7__ = property_param(
-    name="environment",
-    description="Environment variables (KEY=VALUE).",
-    t="string"
-)
-
-__DOCKER_PROPERTY_8__ = property_param(
-    name="detach",
-    description="Run container in detached mode.",
-    t="boolean"
-)
-
-__DOCKER_PROPERTY_9__ = property_param(
-    name="force",
-    description="Force the operation (use with caution).",
-    t="boolean"
-)
-
-__DOCKER_PROPERTY_10__ = property_param(
-    name="all",
-    description="Apply operation to all containers/images.",
-    t="boolean"
-)
-
-__DOCKER_PROPERTY_11__ = property_param(
-    name="dockerfile",
-    description="Path to Dockerfile for building images.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_12__ = property_param(
-    name="tag",
-    description="Tag for docker image.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_13__ = property_param(
-    name="context",
-    description="Build context path.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_14__ = property_param(
-    name="network",
-    description="Network name or ID.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_15__ = property_param(
-    name="volume",
-    description="Volume name or ID.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_16__ = property_param(
-    name="follow",
-    description="Follow log output.",
-    t="boolean"
-)
-
-__DOCKER_PROPERTY_17__ = property_param(
-    name="timeout",
-    description="Timeout in seconds for command execution.",
-    t="integer"
-)
-
-__DOCKER_PROPERTY_18__ = property_param(
-    name="filter",
-    description="Filter output (e.g., 'status=running').",
-    t="string"
-)
-
-__DOCKER_PROPERTY_19__ = property_param(
-    name="workdir",
-    description="Working directory inside container.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_20__ = property_param(
-    name="registry",
-    description="Docker registry URL.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_21__ = property_param(
-    name="username",
-    description="Username for registry authentication.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_22__ = property_param(
-    name="password",
-    description="Password for registry authentication.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_23__ = property_param(
-    name="compose_file",
-    description="Docker Compose file path.",
-    t="string"
-)
-
-__DOCKER_PROPERTY_24__ = property_param(
-    name="services",
-    description="Compose services to operate on.",
-    t="string"
-)
-
-# Container Management Functions
-__DOCKER_RUN_FUNCTION__ = function_ai(name="docker_run",
-                                     description="Run a docker container.",
-                                     parameters=parameters_func([__DOCKER_PROPERTY_ONE__, __DOCKER_PROPERTY_THREE__, __DOCKER_PROPERTY_4__, __DOCKER_PROPERTY_5__, __DOCKER_PROPERTY_6__, __DOCKER_PROPERTY_7__, __DOCKER_PROPERTY_8__, __DOCKER_PROPERTY_19__]))
-
-__DOCKER_PS_FUNCTION__ = function_ai(name="docker_ps",
-                                    description="List docker containers.",
-                                    parameters=parameters_func([__DOCKER_PROPERTY_10__, __DOCKER_PROPERTY_18__]))
-
-__DOCKER_START_FUNCTION__ = function_ai(name="docker_start",
-                                       description="Start one or more stopped containers.",
-                                       parameters=parameters_func([__DOCKER_PROPERTY_TWO__, __DOCKER_PROPERTY_10__]))
-
-__DOCKER_STOP_FUNCTION__ = function_ai(name="docker_stop",
-                                      description="Stop one or more running containers.",
-                                      parameters=parameters_func([__DOCKER_PROPERTY_TWO__, __DOCKER_PROPERTY_10__, __DOCKER_PROPERTY_9__, __DOCKER_PROPERTY_17__]))
-
-__DOCKER_RESTART_FUNCTION__ = function_ai(name="docker_restart",
-                                         description="Restart one or more containers.",
-                                         parameters=parameters_func([__DOCKER_PROPERTY_TWO__, __DOCKER_PROPERTY_10__, __DOCKER_PROPERTY_9__]))
-
-__DOCKER_RM_FUNCTION__ = function_ai(name="docker_rm",
-                                    description="Remove one or more containers.",
-                                    parameters=parameters_func([__DOCKER_PROPERTY_TWO__, __DOCKER_PROPERTY_10__, __DOCKER_PROPERTY_9__]))
-
-__DOCKER_LOGS_FUNCTION__ = function_ai(name="docker_logs",
-                                      description="Fetch the logs of a container.",
-                                      parameters=parameters_func([__DOCKER_PROPERTY_TWO__, __DOCKER_PROPERTY_16__, __DOCKER_PROPERTY_17__]))
-
-__DOCKER_EXEC_FUNCTION__ = function_ai(name="docker_exec",
-                                      description="Run a command in a running container.",
-                                      parameters=parameters_func([__DOCKER_PROPERTY_TWO__, __DOCKER_PROPERTY_4__, __DOCKER_PROPERTY_8__, __DOCKER_PROPERTY_19__]))
-
-__DOCKER_INSPECT_FUNCTION__ = function_ai(name="docker_inspect",
-                                         description="Return low-level information on Docker objects.",
-                                         parameters=parameters_func([__DOCKER_PROPERTY_TWO__]))
-
-# Image Management Functions
-__DOCKER_IMAGES_FUNCTION__ = function_ai(name="docker_images",
-                                        description="List docker images.",
-                                        parameters=parameters_func([]))
-
-__DOCKER_PULL_FUNCTION__ = function_ai(name="docker_pull",
-                                      description="Pull an image from a registry.",
-                                      parameters=parameters_func([__DOCKER_PROPERTY_ONE__, __DOCKER_PROPERTY_20__, __DOCKER_PROPERTY_21__, __DOCKER_PROPERTY_22__]))
-
-__DOCKER_BUILD_FUNCTION__ = function_ai(name="docker_build",
-                                       description="Build an image from a Dockerfile.",
-                                       parameters=parameters_func([__DOCKER_PROPERTY_11__, __DOCKER_PROPERTY_12__, __DOCKER_PROPERTY_13__, __DOCKER_PROPERTY_ONE__]))
-
-__DOCKER_PUSH_FUNCTION__ = function_ai(name="docker_push",
-                                      description="Push an image to a registry.",
-                                      parameters=parameters_func([__DOCKER_PROPERTY_ONE__, __DOCKER_PROPERTY_20__, __DOCKER_PROPERTY_21__, __DOCKER_PROPERTY_22__]))
-
-__DOCKER_RMI_FUNCTION__ = function_ai(name="docker_rmi",
-                                     description="Remove one or more images.",
-                                     parameters=parameters_func([__DOCKER_PROPERTY_ONE__, __DOCKER_PROPERTY_9__, __DOCKER_PROPERTY_10__]))
-
-# Network Management Functions
-__DOCKER_NETWORK_LS_FUNCTION__ = function_ai(name="docker_network_ls",
-                                            description="List docker networks.",
-                                            parameters=parameters_func([]))
-
-__DOCKER_NETWORK_CREATE_FUNCTION__ = function_ai(name="docker_network_create",
-                                                description="Create a docker network.",
-                                                parameters=parameters_func([__DOCKER_PROPERTY_THREE__, __DOCKER_PROPERTY_14__]))
-
-__DOCKER_NETWORK_RM_FUNCTION__ = function_ai(name="docker_network_rm",
-                                            description="Remove one or more docker networks.",
-                                            parameters=parameters_func([__DOCKER_PROPERTY_14__, __DOCKER_PROPERTY_9__]))
-
-# Volume Management Functions
-__DOCKER_VOLUME_LS_FUNCTION__ = function_ai(name="docker_volume_ls",
-                                           description="List docker volumes.",
-                                           parameters=parameters_func([]))
-
-__DOCKER_VOLUME_CREATE_FUNCTION__ = function_ai(name="docker_volume_create",
-                                               description="Create a docker volume.",
-                                               parameters=parameters_func([__DOCKER_PROPERTY_THREE__, __DOCKER_PROPERTY_15__]))
-
-__DOCKER_VOLUME_RM_FUNCTION__ = function_ai(name="docker_volume_rm",
-                                           description="Remove one or more docker volumes.",
-                                           parameters=parameters_func([__DOCKER_PROPERTY_15__, __DOCKER_PROPERTY_9__]))
-
-# System Functions
-__DOCKER_INFO_FUNCTION__ = function_ai(name="docker_info",
-                                      description="Display system-wide information.",
-                                      parameters=parameters_func([]))
-
-__DOCKER_VERSION_FUNCTION__ = function_ai(name="docker_version",
-                                         description="Show the Docker version information.",
-                                         parameters=parameters_func([]))
-
-# Compose Functions
-__DOCKER_COMPOSE_UP_FUNCTION__ = function_ai(name="docker_compose_up",
-                                            description="Create and start containers from compose file.",
-                                            parameters=parameters_func([__DOCKER_PROPERTY_23__, __DOCKER_PROPERTY_24__, __DOCKER_PROPERTY_8__]))
-
-__DOCKER_COMPOSE_DOWN_FUNCTION__ = function_ai(name="docker_compose_down",
-                                              description="Stop and remove containers, networks from compose file.",
-                                              parameters=parameters_func([__DOCKER_PROPERTY_23__, __DOCKER_PROPERTY_9__]))
-
-__DOCKER_COMPOSE_PS_FUNCTION__ = function_ai(name="docker_compose_ps",
-                                            description="List containers from compose file.",
-                                            parameters=parameters_func([__DOCKER_PROPERTY_23__]))
-
-__DOCKER_COMPOSE_LOGS_FUNCTION__ = function_ai(name="docker_compose_logs",
-                                              description="View output from containers from compose file.",
-                                              parameters=parameters_func([__DOCKER_PROPERTY_23__, __DOCKER_PROPERTY_24__, __DOCKER_PROPERTY_16__]))
-
-# Additional Functions Definitions
-__DOCKER_STATS_FUNCTION__ = function_ai(name="docker_stats",
-                                       description="Display a live stream of container(s) resource usage statistics.",
-                                       parameters=parameters_func([__DOCKER_PROPERTY_TWO__, __DOCKER_PROPERTY_10__]))
-
-__DOCKER_TOP_FUNCTION__ = function_ai(name="docker_top",
-                                     description="Display the running processes of a container.",
-                                     parameters=parameters_func([__DOCKER_PROPERTY_TWO__]))
-
-__DOCKER_LOGIN_FUNCTION__ = function_ai(name="docker_login",
-                                       description="Log in to a Docker registry.",
-                                       parameters=parameters_func([__DOCKER_PROPERTY_20__, __DOCKER_PROPERTY_21__, __DOCKER_PROPERTY_22__]))
-
-__DOCKER_LOGOUT_FUNCTION__ = function_ai(name="docker_logout",
-                                        description="Log out from a Docker registry.",
-                                        parameters=parameters_func([__DOCKER_PROPERTY_20__]))
-
-__DOCKER_SYSTEM_PRUNE_FUNCTION__ = function_ai(name="docker_system_prune",
-                                              description="Remove unused Docker data.",
-                                              parameters=parameters_func([__DOCKER_PROPERTY_10__, __DOCKER_PROPERTY_15__, __DOCKER_PROPERTY_9__]))
-
-__DOCKER_CONTAINER_PRUNE_FUNCTION__ = function_ai(name="docker_container_prune",
-                                                 description="Remove all stopped containers.",
-                                                 parameters=parameters_func([__DOCKER_PROPERTY_9__]))
-
-__DOCKER_IMAGE_PRUNE_FUNCTION__ = function_ai(name="docker_image_prune",
-                                             description="Remove unused images.",
-                                             parameters=parameters_func([__DOCKER_PROPERTY_10__, __DOCKER_PROPERTY_9__]))
+import functools
+import threading
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import urllib.parse
+from typing import Dict, List, Optional, Any, Union, NamedTuple
+
+# orjson is optional; it pretty-prints large inspect payloads much faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# 属性定义: one shared schema entry per parameter name. Every docker tool
+# parameter is required, and tools reference these entries instead of
+# building their own copies.
+_PROPS = {
+    "image": {"type": "string", "description": "Docker image name or ID."},
+    "images": {"type": "string", "description": "Docker image names, comma-separated."},
+    "container": {"type": "string", "description": "Docker container name or ID."},
+    "containers": {"type": "string", "description": "Docker container names or IDs, comma-separated."},
+    "name": {"type": "string", "description": "Name for the container or resource."},
+    "command": {"type": "string", "description": "Command to run in container."},
+    "ports": {"type": "string", "description": "Port mappings (host:container)."},
+    "volumes": {"type": "string", "description": "Volume mappings (host:container)."},
+    "environment": {"type": "string", "description": "Environment variables (KEY=VALUE)."},
+    "detach": {"type": "boolean", "description": "Run container in detached mode."},
+    "force": {"type": "boolean", "description": "Force the operation (use with caution)."},
+    "all": {"type": "boolean", "description": "Apply operation to all containers/images."},
+    "dockerfile": {"type": "string", "description": "Path to Dockerfile for building images."},
+    "tag": {"type": "string", "description": "Tag for docker image."},
+    "context": {"type": "string", "description": "Build context path."},
+    "network": {"type": "string", "description": "Network name or ID."},
+    "volume": {"type": "string", "description": "Volume name or ID."},
+    "follow": {"type": "boolean", "description": "Follow log output."},
+    "timeout": {"type": "integer", "description": "Timeout in seconds for command execution."},
+    "filter": {"type": "string", "description": "Filter output (e.g., 'status=running')."},
+    "workdir": {"type": "string", "description": "Working directory inside container."},
+    "registry": {"type": "string", "description": "Docker registry URL."},
+    "username": {"type": "string", "description": "Username for registry authentication."},
+    "password": {"type": "string", "description": "Password for registry authentication."},
+    "compose_file": {"type": "string", "description": "Docker Compose file path."},
+    "services": {"type": "string", "description": "Compose services to operate on."},
+    "format": {"type": "string", "description": "Output format: 'table' (default) or 'json'."},
+    "max_parallel": {"type": "integer", "description": "Maximum number of operations run at once (1 runs them one by one)."},
+}
 
-tools = [
-    # Container Management
-    __DOCKER_RUN_FUNCTION__,
-    __DOCKER_PS_FUNCTION__,
-    __DOCKER_START_FUNCTION__,
-    __DOCKER_STOP_FUNCTION__,
-    __DOCKER_RESTART_FUNCTION__,
-    __DOCKER_RM_FUNCTION__,
-    __DOCKER_LOGS_FUNCTION__,
-    __DOCKER_EXEC_FUNCTION__,
-    __DOCKER_INSPECT_FUNCTION__,
-    
-    # Image Management
-    __DOCKER_IMAGES_FUNCTION__,
-    __DOCKER_PULL_FUNCTION__,
-    __DOCKER_BUILD_FUNCTION__,
-    __DOCKER_PUSH_FUNCTION__,
-    __DOCKER_RMI_FUNCTION__,
-    
-    # Network Management
-    __DOCKER_NETWORK_LS_FUNCTION__,
-    __DOCKER_NETWORK_CREATE_FUNCTION__,
-    __DOCKER_NETWORK_RM_FUNCTION__,
-    
-    # Volume Management
-    __DOCKER_VOLUME_LS_FUNCTION__,
-    __DOCKER_VOLUME_CREATE_FUNCTION__,
-    __DOCKER_VOLUME_RM_FUNCTION__,
+def _params(names):
+    """Assemble a parameters schema from shared _PROPS entries."""
+    return {
+        "type": "object",
+        "properties": {name: _PROPS[name] for name in names},
+        "required": list(names)
+    }
+
+# 函数工具定义: name -> (description, parameter names).
+# function_ai schemas are only built when `tools` is first accessed, so
+# importing the module (e.g. to call docker_ps directly) skips that work.
+_TOOL_SPECS = {
+    # Container Management Functions
+    "docker_run": ("Run a docker container.",
+                    ["image", "name", "command", "ports", "volumes", "environment", "detach", "workdir"]),
+    "docker_ps": ("List docker containers.",
+                    ["all", "filter", "format"]),
+    "docker_start": ("Start one or more stopped containers. Accepts several comma-separated names or IDs, handled in one call.",
+                    ["container", "all"]),
+    "docker_stop": ("Stop one or more running containers. Accepts several comma-separated names or IDs, handled in one call.",
+                    ["container", "all", "force", "timeout"]),
+    "docker_restart": ("Restart one or more containers. Accepts several comma-separated names or IDs, handled in one call.",
+                    ["container", "all", "force"]),
+    "docker_rm": ("Remove one or more containers. Accepts several comma-separated names or IDs, handled in one call.",
+                    ["container", "all", "force"]),
+    "docker_logs": ("Fetch the logs of a container.",
+                    ["container", "follow", "timeout"]),
+    "docker_exec": ("Run a command in a running container.",
+                    ["container", "command", "detach", "workdir"]),
+    "docker_inspect": ("Return low-level information on Docker objects. Accepts several comma-separated names or IDs, inspected in one call.",
+                    ["container"]),
+    "docker_inspect_many": ("Return low-level information on several Docker objects, keyed by the requested name or ID.",
+                    ["containers"]),
+    
+    # Image Management Functions
+    "docker_images": ("List docker images.",
+                    []),
+    "docker_pull": ("Pull an image from a registry.",
+                    ["image", "registry", "username", "password"]),
+    "docker_pull_many": ("Pull several images concurrently. Accepts comma-separated image names; reports each image's result on its own line.",
+                    ["images", "registry", "max_parallel"]),
+    "docker_build": ("Build an image from a Dockerfile.",
+                    ["dockerfile", "tag", "context", "image"]),
+    "docker_push": ("Push an image to a registry.",
+                    ["image", "registry", "username", "password"]),
+    "docker_rmi": ("Remove one or more images.",
+                    ["image", "force", "all"]),
+    
+    # Network Management Functions
+    "docker_network_ls": ("List docker networks.",
+                    []),
+    "docker_network_create": ("Create a docker network.",
+                    ["name", "network"]),
+    "docker_network_rm": ("Remove one or more docker networks.",
+                    ["network", "force"]),
+    
+    # Volume Management Functions
+    "docker_volume_ls": ("List docker volumes.",
+                    []),
+    "docker_volume_create": ("Create a docker volume.",
+                    ["name", "volume"]),
+    "docker_volume_rm": ("Remove one or more docker volumes.",
+                    ["volume", "force"]),
     
     # System Functions
-    __DOCKER_INFO_FUNCTION__,
-    __DOCKER_VERSION_FUNCTION__,
+    "docker_info": ("Display system-wide information.",
+                    []),
+    "docker_version": ("Show the Docker version information.",
+                    []),
     
     # Compose Functions
-    __DOCKER_COMPOSE_UP_FUNCTION__,
-    __DOCKER_COMPOSE_DOWN_FUNCTION__,
-    __DOCKER_COMPOSE_PS_FUNCTION__,
-    __DOCKER_COMPOSE_LOGS_FUNCTION__,
+    "docker_compose_up": ("Create and start containers from compose file. In detached mode, max_parallel above 1 starts independent services concurrently, following depends_on.",
+                    ["compose_file", "services", "detach", "max_parallel"]),
+    "docker_compose_down": ("Stop and remove containers, networks from compose file.",
+                    ["compose_file", "force"]),
+    "docker_compose_ps": ("List containers from compose file.",
+                    ["compose_file"]),
+    "docker_compose_logs": ("View output from containers from compose file.",
+                    ["compose_file", "services", "follow"]),
+    
+    # Additional Functions Definitions
+    "docker_stats": ("Display a live stream of container(s) resource usage statistics.",
+                    ["container", "all"]),
+    "docker_top": ("Display the running processes of a container.",
+                    ["container"]),
+    "docker_login": ("Log in to a Docker registry.",
+                    ["registry", "username", "password"]),
+    "docker_logout": ("Log out from a Docker registry.",
+                    ["registry"]),
+    "docker_system_prune": ("Remove unused Docker data.",
+                    ["all", "volume", "force"]),
+    "docker_container_prune": ("Remove all stopped containers.",
+                    ["force"]),
+    "docker_image_prune": ("Remove unused images.",
+                    ["all", "force"]),
+}
+
+@functools.lru_cache(maxsize=None)
+def _tool(name):
+    """Build (once) the function_ai schema for one tool."""
+    description, properties = _TOOL_SPECS[name]
+    return function_ai(name=name, description=description, parameters=_params(properties))
+
+@functools.lru_cache(maxsize=None)
+def get_tools():
+    """Return the schemas of all docker tools, building them on first use."""
+    return [_tool(name) for name in _TOOL_SPECS]
+
+def __getattr__(name):
+    # Lazily resolve the module-level `tools` list (PEP 562)
+    if name == "tools":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Cache for read-only queries: argv tuple -> (monotonic timestamp, output).
+# Agents tend to poll the same listing repeatedly, so short TTLs absorb most
+# of the fork/exec + daemon round-trips; any mutating call clears the cache.
+_CACHE: Dict[tuple, tuple] = {}
+# Bumped on every invalidation, so a read that started before a mutating
+# call cannot store its (now stale) result afterwards
+_CACHE_GENERATION = 0
+
+# TTLs in seconds for the cached read-only queries
+_STATE_CACHE_TTL = 2.0      # ps, stats, inspect, top
+_LISTING_CACHE_TTL = 5.0    # images, networks, volumes
+_SYSTEM_CACHE_TTL = 30.0    # version, info
+
+# Fixed argv for the parameterless queries; tuples double as cache keys
+_ARGS_INFO = ("info",)
+_ARGS_VERSION = ("version",)
+_ARGS_IMAGES = ("images", "--format", "table {{.Repository}}\t{{.Tag}}\t{{.ID}}\t{{.CreatedAt}}\t{{.Size}}")
+_ARGS_NETWORK_LS = ("network", "ls", "--format", "table {{.ID}}\t{{.Name}}\t{{.Driver}}\t{{.Scope}}")
+_ARGS_VOLUME_LS = ("volume", "ls", "--format", "table {{.Name}}\t{{.Driver}}\t{{.Scope}}")
+
+# Result of the docker CLI presence probe: None until first probed. A
+# positive result is kept for the process lifetime; a negative one is
+# re-probed after _DOCKER_PROBE_RETRY seconds in case docker gets installed.
+_DOCKER_AVAILABLE: Optional[bool] = None
+# Absolute path of the docker CLI, so each exec skips the PATH search
+_DOCKER_BIN: Optional[str] = None
+_DOCKER_PROBE_TIME = 0.0
+_DOCKER_PROBE_RETRY = 30.0
+
+class CommandResult(NamedTuple):
+    """
+    Outcome of a docker CLI invocation.
+    
+    Internal code branches on ``ok``; public tool functions return
+    ``str(result)``, i.e. the output on success or the error message.
+    """
+    ok: bool
+    out: str = ""
+    err: str = ""
+    code: int = 0
+    
+    def __str__(self):
+        if self.ok:
+            return self.out or "Command executed successfully (no output)"
+        return self.err
+
+_DOCKER_MISSING_MSG = "Error: Docker is not installed or not in PATH"
+_DOCKER_MISSING = CommandResult(False, err=_DOCKER_MISSING_MSG, code=-1)
+
+def docker_available() -> bool:
+    '''
+    Check whether the docker CLI is on PATH, caching the answer.
+    
+    Lets callers skip offering docker tools entirely when docker is missing.
+    
+    :return: True if the docker CLI is available
+    :rtype: bool
+    '''
+    global _DOCKER_AVAILABLE, _DOCKER_PROBE_TIME, _DOCKER_BIN
+    
+    if _DOCKER_AVAILABLE is None or (
+            not _DOCKER_AVAILABLE and time.monotonic() - _DOCKER_PROBE_TIME >= _DOCKER_PROBE_RETRY):
+        # A PATH lookup is enough to detect presence; no need to fork docker --version
+        _DOCKER_BIN = shutil.which('docker')
+        _DOCKER_AVAILABLE = _DOCKER_BIN is not None
+        _DOCKER_PROBE_TIME = time.monotonic()
+    
+    return _DOCKER_AVAILABLE
+
+# Default output ceiling for commands whose output can grow without bound
+# (logs, ps on large fleets, inspect)
+_MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+
+# Larger pipes let one read() drain more output per wake-up (Linux, 3.10+);
+# kept well under the default unprivileged pipe-max-size of 1 MiB
+_PIPE_BUFFER_SIZE = 256 * 1024
+_PIPE_KWARGS = {"pipesize": _PIPE_BUFFER_SIZE} if sys.version_info >= (3, 10) else {}
+
+def _run_bounded(argv, timeout, max_bytes=_MAX_OUTPUT_BYTES, tail=False):
+    """
+    Run ``argv`` capturing at most ``max_bytes`` of output per stream.
+    
+    Output is read through a selector into byte buffers and decoded once at
+    the end. Once a buffer passes the ceiling the process is killed, so a
+    runaway command cannot grow memory without bound. With ``tail`` the
+    command runs to completion instead and only the last ``max_bytes`` of
+    each stream are kept, in a ring of chunks.
+    
+    :return: (returncode, stdout, stderr, truncated)
+    :raises subprocess.TimeoutExpired: If the command outlives ``timeout``
+    """
+    process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **_PIPE_KWARGS)
+    # Per stream: the chunks read so far and their total size
+    stdout = [collections.deque(), 0]
+    stderr = [collections.deque(), 0]
+    truncated = False
+    deadline = time.monotonic() + timeout
+    
+    with process, selectors.DefaultSelector() as selector:
+        for stream, buffer in ((process.stdout, stdout), (process.stderr, stderr)):
+            os.set_blocking(stream.fileno(), False)
+            selector.register(stream, selectors.EVENT_READ, buffer)
+        
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                process.kill()
+                raise subprocess.TimeoutExpired(argv, timeout)
+            
+            for key, _ in selector.select(timeout=remaining):
+                chunk = os.read(key.fd, _PIPE_BUFFER_SIZE)
+                if not chunk:  # Stream closed
+                    selector.unregister(key.fileobj)
+                    continue
+                buffer = key.data
+                buffer[0].append(chunk)
+                buffer[1] += len(chunk)
+                # Drop whole chunks from the front while the rest still fills the ring
+                while tail and buffer[1] - len(buffer[0][0]) >= max_bytes:
+                    buffer[1] -= len(buffer[0].popleft())
+                    truncated = True
+            
+            if not tail and (stdout[1] > max_bytes or stderr[1] > max_bytes):
+                truncated = True
+                process.kill()
+                break
+        
+        returncode = process.wait()
+    
+    def decode(buffer):
+        data = b"".join(buffer[0])
+        if len(data) <= max_bytes:
+            return data.decode('utf-8', 'replace')
+        if not tail:
+            return str(memoryview(data)[:max_bytes], 'utf-8', 'replace')
+        # Start the kept tail at a line boundary, decoding in place
+        start = len(data) - max_bytes
+        newline = data.find(b"\n", start)
+        if 0 <= newline < len(data) - 1:
+            start = newline + 1
+        return str(memoryview(data)[start:], 'utf-8', 'replace')
+    
+    truncated = truncated or stdout[1] > max_bytes or stderr[1] > max_bytes
+    return returncode, decode(stdout), decode(stderr), truncated
+
+def _run_with_pidfd(argv, timeout):
+    """
+    Run ``argv`` to completion, blocking in the kernel until it exits.
+    
+    On Linux the child's pidfd is watched in the same selector as its
+    pipes, so waiting for exit needs no sleep-and-retry polling. Elsewhere
+    this is plain ``subprocess.run``. Output is captured as bytes and
+    decoded once as UTF-8, replacing undecodable bytes (binary log lines).
+    
+    :return: (returncode, stdout, stderr)
+    :raises subprocess.TimeoutExpired: If the command outlives ``timeout``
+    """
+    if not hasattr(os, "pidfd_open"):
+        result = subprocess.run(argv, capture_output=True, timeout=timeout)
+        return result.returncode, result.stdout.decode('utf-8', 'replace'), result.stderr.decode('utf-8', 'replace')
+    
+    process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **_PIPE_KWARGS)
+    stdout = bytearray()
+    stderr = bytearray()
+    deadline = time.monotonic() + timeout
+    
+    with process, selectors.DefaultSelector() as selector:
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            pidfd = None
+        try:
+            for stream, buffer in ((process.stdout, stdout), (process.stderr, stderr)):
+                os.set_blocking(stream.fileno(), False)
+                selector.register(stream, selectors.EVENT_READ, buffer)
+            if pidfd is not None:
+                selector.register(pidfd, selectors.EVENT_READ)
+            
+            # Read until both pipes close and (if watched) the process exits
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    process.kill()
+                    raise subprocess.TimeoutExpired(argv, timeout)
+                
+                for key, _ in selector.select(timeout=remaining):
+                    if key.fd == pidfd:
+                        selector.unregister(pidfd)
+                        continue
+                    chunk = os.read(key.fd, _PIPE_BUFFER_SIZE)
+                    if chunk:
+                        key.data.extend(chunk)
+                    else:  # Stream closed
+                        selector.unregister(key.fileobj)
+            
+            # Already exited when the pidfd fired, so this just reaps
+            returncode = process.wait(max(deadline - time.monotonic(), 0))
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
+    
+    return returncode, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+
+# Well-known failure causes in docker's stderr, matched case-insensitively
+# in one pass without lowercasing a copy of the (possibly large) message
+_DOCKER_ERROR_RE = re.compile(r'(?i)(permission denied)|(connection refused)')
+
+# Most of a quiet command's merged output kept as its error message
+_QUIET_ERROR_BYTES = 4096
+
+def _run_docker_command(args, timeout=30, max_output=None, quiet=False, tail=False):
+    """
+    Internal helper function to run docker commands.
+    
+    When ``max_output`` is given, output is capped at that many bytes
+    instead of being captured in full; ``tail`` keeps the last bytes rather
+    than the first. With ``quiet`` the command is run directly without the
+    pidfd selector loop, for detached calls that only print an ID: stderr
+    shares stdout's pipe, the output on success is just the last line (the
+    ID), and on failure only its last _QUIET_ERROR_BYTES are kept.
+    
+    :return: CommandResult; ``err`` carries a ready-to-return error message
+    """
+    # Once docker is known to be missing, fail without spawning anything
+    if _DOCKER_AVAILABLE is not True and not docker_available():
+        return _DOCKER_MISSING
     
-    # Additional Functions
-    __DOCKER_STATS_FUNCTION__,
-    __DOCKER_TOP_FUNCTION__,
-    __DOCKER_LOGIN_FUNCTION__,
-    __DOCKER_LOGOUT_FUNCTION__,
-    __DOCKER_SYSTEM_PRUNE_FUNCTION__,
-    __DOCKER_CONTAINER_PRUNE_FUNCTION__,
-    __DOCKER_IMAGE_PRUNE_FUNCTION__,
-]
-
-def _run_docker_command(args, timeout=30, check_docker=True):
-    """Internal helper function to run docker commands."""
     try:
-        if check_docker:
-            # Check if docker is available
-            try:
-                subprocess.run(['docker', '--version'], 
-                              capture_output=True, check=True, timeout=5)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                return "Error: Docker is not installed or not in PATH"
-        
         # Run docker command
-        result = subprocess.run(
-            ['docker'] + args,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
+        if quiet:
+            # One pipe instead of two: stderr is merged into stdout, which
+            # otherwise carries only the ID
+            result = subprocess.run(
+                [_DOCKER_BIN, *args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=timeout
+            )
+            returncode, truncated = result.returncode, False
+            if returncode == 0:
+                # Pull progress and warnings come before the ID on its last line
+                output = result.stdout.rstrip().rpartition(b"\n")[2].decode('utf-8', 'replace')
+                error = ""
+            else:
+                output = ""
+                error = result.stdout[-_QUIET_ERROR_BYTES:].decode('utf-8', 'replace')
+        elif max_output is not None and os.name != "nt":
+            returncode, output, error, truncated = _run_bounded([_DOCKER_BIN, *args], timeout, max_output, tail)
+        else:
+            # Pipes are not selectable on Windows, so output is captured in full there
+            returncode, output, error = _run_with_pidfd([_DOCKER_BIN, *args], timeout)
+            truncated = False
+        
+        output = output.strip()
+        error = error.strip()
         
-        output = result.stdout.strip()
-        error = result.stderr.strip()
+        if truncated:
+            if tail:
+                return CommandResult(True, f"... (earlier output truncated)\n{output}", error, returncode)
+            return CommandResult(True, f"{output}\n... (output truncated)", error, returncode)
         
-        if result.returncode != 0:
-            if "permission denied" in error.lower():
-                return f"Error: Permission denied - you might need to run with sudo or add user to docker group: {error}"
-            elif "connection refused" in error.lower():
-                return f"Error: Docker daemon not running: {error}"
+        if returncode != 0:
+            match = _DOCKER_ERROR_RE.search(error)
+            if match is None:
+                message = f"Docker command failed: {error}"
+            elif match.group(1) is not None:
+                message = f"Error: Permission denied - you might need to run with sudo or add user to docker group: {error}"
             else:
-                return f"Docker command failed: {error}"
+                message = f"Error: Docker daemon not running: {error}"
+            return CommandResult(False, output, message, returncode)
         
-        return output if output else "Command executed successfully (no output)"
+        return CommandResult(True, output, error, returncode)
     
     except subprocess.TimeoutExpired:
-        return f"Error: Docker command timed out after {timeout} seconds"
+        return CommandResult(False, err=f"Error: Docker command timed out after {timeout} seconds", code=-1)
     except PermissionError as e:
-        return f"Error: Permission error: {str(e)}"
+        return CommandResult(False, err=f"Error: Permission error: {str(e)}", code=-1)
     except Exception as e:
-        return f"Error: Unexpected error executing docker command: {str(e)}"
+        return CommandResult(False, err=f"Error: Unexpected error executing docker command: {str(e)}", code=-1)
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection to the Docker Engine API over its unix socket."""
+    
+    def __init__(self, socket_path, timeout=30):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+    
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+# One keep-alive connection to the daemon is reused for the process lifetime,
+# so API-backed queries skip the fork/exec + CLI start-up of a docker call.
+# The docker SDK cannot be used here because this package shadows its name.
+# After a failed reconnect the API is skipped for _DOCKER_PROBE_RETRY seconds.
+_API_CONNECTION: Optional[_UnixHTTPConnection] = None
+_API_SOCKET_PATH: Optional[str] = None
+_API_DISABLED_UNTIL = float('-inf')
+_API_LOCK = threading.Lock()
+# (path, mtime, currentContext) of the last docker CLI config read
+_CLI_CONTEXT_CACHE = (None, None, None)
+
+def _cli_current_context():
+    """Return the ``currentContext`` of the docker CLI config, or None."""
+    global _CLI_CONTEXT_CACHE
+    
+    config_dir = os.environ.get("DOCKER_CONFIG") or os.path.join(os.path.expanduser("~"), ".docker")
+    config_path = os.path.join(config_dir, "config.json")
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return None
+    if _CLI_CONTEXT_CACHE[:2] != (config_path, mtime):
+        try:
+            with open(config_path, 'rb') as f:
+                context = _json_loads(f.read()).get("currentContext")
+        except (OSError, ValueError, AttributeError):
+            context = None
+        _CLI_CONTEXT_CACHE = (config_path, mtime, context)
+    return _CLI_CONTEXT_CACHE[2]
+
+def _docker_socket_path():
+    """
+    Return the unix socket of the daemon the docker CLI talks to.
+    
+    None when that is not a unix socket or when a non-default context is
+    selected, since the context's endpoint is only known to the CLI.
+    """
+    if os.environ.get("DOCKER_CONTEXT", "default") != "default":
+        return None
+    host = os.environ.get("DOCKER_HOST")
+    if not host:
+        if _cli_current_context() not in (None, "", "default"):
+            return None
+        host = "unix:///var/run/docker.sock"
+    if not host.startswith("unix://"):
+        return None
+    return host[len("unix://"):]
+
+def _api_get(path):
+    """
+    GET a Docker Engine API path over the persistent connection.
+    
+    Returns ``(status, data)`` with the decoded JSON body, or None when the
+    API is unreachable; callers then fall back to the docker CLI.
+    """
+    global _API_CONNECTION, _API_SOCKET_PATH, _API_DISABLED_UNTIL
+    
+    with _API_LOCK:
+        if time.monotonic() < _API_DISABLED_UNTIL:
+            return None
+        
+        # The daemon can change with DOCKER_HOST or the CLI context
+        socket_path = _docker_socket_path()
+        if socket_path != _API_SOCKET_PATH and _API_CONNECTION is not None:
+            _API_CONNECTION.close()
+            _API_CONNECTION = None
+        _API_SOCKET_PATH = socket_path
+        if not socket_path or not os.path.exists(socket_path):
+            return None
+        
+        # A dropped keep-alive connection (e.g. daemon restart) gets one reconnect
+        for attempt in range(2):
+            if _API_CONNECTION is None:
+                _API_CONNECTION = _UnixHTTPConnection(socket_path)
+            try:
+                _API_CONNECTION.request("GET", path)
+                response = _API_CONNECTION.getresponse()
+                body = response.read()
+                break
+            except (OSError, http.client.HTTPException):
+                _API_CONNECTION.close()
+                _API_CONNECTION = None
+        else:
+            # Socket unusable (permissions, daemon down): use the CLI for a while
+            _API_DISABLED_UNTIL = time.monotonic() + _DOCKER_PROBE_RETRY
+            return None
+    
+    try:
+        return response.status, _json_loads(body)
+    except ValueError:
+        return response.status, None
+
+def _api_inspect(ids):
+    """Inspect containers through the Engine API; None means use the CLI instead."""
+    results = []
+    for container_id in ids:
+        response = _api_get(f"/containers/{urllib.parse.quote(container_id, safe='')}/json")
+        # Non-containers (images, networks, ...) and errors go through the CLI,
+        # which resolves every object type and reports errors in its own words
+        if response is None or response[0] != 200 or response[1] is None:
+            return None
+        results.append(response[1])
+    return results
+
+# A long-lived `docker events` subscription invalidates the cache whenever an
+# image, network or volume changes, so those listings can be reused until
+# something actually happens instead of being re-fetched every few seconds
+_ARGS_EVENTS = ('events', '--format', '{{json .}}',
+                '--filter', 'type=image', '--filter', 'type=network', '--filter', 'type=volume')
+_EVENT_CACHE_TTL = 300.0
+# The subscription replays events from this many seconds before it was
+# started, covering the gap until `docker events` is actually subscribed
+_EVENTS_REPLAY_MARGIN = 5.0
+_EVENTS_PROCESS: Optional[subprocess.Popen] = None
+_EVENTS_START_TIME = float('-inf')
+_EVENTS_LOCK = threading.Lock()
+
+def _watch_events(process):
+    """Invalidate the cache for every event line until the subscription ends."""
+    for _ in process.stdout:
+        _invalidate_cache()
+    # Results cached for the long TTL were only safe while this was watching
+    _invalidate_cache()
+
+def _events_watched():
+    """
+    Return True if the events subscription is live, (re)starting it when due.
+    
+    The call that starts the subscription returns False: the process has
+    not proven it is running yet.
+    """
+    global _EVENTS_PROCESS, _EVENTS_START_TIME
+    
+    if _EVENTS_PROCESS is not None and _EVENTS_PROCESS.poll() is None:
+        return True
+    
+    with _EVENTS_LOCK:
+        if _EVENTS_PROCESS is not None and _EVENTS_PROCESS.poll() is None:
+            return True
+        # The daemon may be down; don't respawn the subscription on every read
+        if time.monotonic() - _EVENTS_START_TIME < _DOCKER_PROBE_RETRY or not docker_available():
+            return False
+        _EVENTS_START_TIME = time.monotonic()
+        
+        try:
+            since = f"{time.time() - _EVENTS_REPLAY_MARGIN:.3f}"
+            process = subprocess.Popen([_DOCKER_BIN, *_ARGS_EVENTS, '--since', since], stdin=subprocess.DEVNULL,
+                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            return False
+        threading.Thread(target=_watch_events, args=(process,), name="docker-events", daemon=True).start()
+        _EVENTS_PROCESS = process
+        
+        # Results cached before the subscription existed were never watched.
+        # This call keeps the short TTL; later calls extend it only once
+        # poll() shows the process survived its start-up.
+        _invalidate_cache()
+        return False
+
+def _stop_events_process():
+    """Kill the current events subscription at interpreter exit."""
+    process = _EVENTS_PROCESS
+    if process is not None and process.poll() is None:
+        process.kill()
+
+atexit.register(_stop_events_process)
+
+def _cached_run(args, ttl, timeout=30, max_output=None, watch=False):
+    """
+    Run a read-only docker command, reusing output younger than ``ttl`` seconds.
+    
+    With ``watch`` the result is kept for up to ``_EVENT_CACHE_TTL`` while
+    the events subscription is live, since any change clears it anyway.
+    """
+    if watch and _events_watched():
+        ttl = _EVENT_CACHE_TTL
+    
+    key = args if isinstance(args, tuple) else tuple(args)
+    cached = _CACHE.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    
+    generation = _CACHE_GENERATION
+    result = _run_docker_command(args, timeout=timeout, max_output=max_output)
+    # Never cache failures, so a transient error is retried on the next call
+    if result.ok and generation == _CACHE_GENERATION:
+        _CACHE[key] = (now, result)
+    return result
+
+def _invalidate_cache():
+    """Drop cached read-only results; called by every state-changing function."""
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+    _CACHE.clear()
+
+def _invalidates_cache(func):
+    """
+    Decorate a state-changing tool to drop the cache once it has run.
+    
+    Invalidating afterwards (even on error) means a read that overlapped
+    the change can neither keep nor store the state from before it.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _invalidate_cache()
+    return wrapper
+
+def docker_cache_clear() -> None:
+    '''
+    Drop all cached read-only docker results.
+    
+    Needed only when docker state is changed outside these tools (another
+    client, the docker CLI itself); every mutating tool here already clears
+    the cache.
+    '''
+    _invalidate_cache()
+
+# Mapping strings may separate items with commas or newlines
+_MAPPING_SPLIT_RE = re.compile(r'[,\n]')
+
+_MAPPING_FLAGS = {"port": "-p", "volume": "-v", "env": "-e"}
+
+# Bulk (all=True) operations split container IDs into batches that run
+# concurrently, since the daemon handles each invocation's IDs one by one
+_BULK_BATCH_SIZE = 10
+_BULK_MAX_WORKERS = 8
+
+def _run_in_batches(base_args, ids, timeout=30):
+    """Run ``docker <base_args> <ids...>`` over concurrent batches of IDs, joining outputs in order."""
+    batches = [ids[i:i + _BULK_BATCH_SIZE] for i in range(0, len(ids), _BULK_BATCH_SIZE)]
+    if len(batches) == 1:
+        return str(_run_docker_command(base_args + batches[0], timeout=timeout))
+    
+    with ThreadPoolExecutor(max_workers=min(_BULK_MAX_WORKERS, len(batches))) as executor:
+        results = executor.map(lambda batch: _run_docker_command(base_args + batch, timeout=timeout), batches)
+        return "\n".join(map(str, results))
 
 def _parse_mappings(mapping_str, mapping_type="port"):
-    """Parse port or volume mapping strings."""
+    """Parse port, volume or env mapping strings into flat docker argv tokens."""
     if not mapping_str:
-        return []
+        return
     
-    mappings = []
-    try:
-        # Split by comma or newline
-        if ',' in mapping_str:
-            items = mapping_str.split(',')
-        else:
-            items = mapping_str.split('\n')
+    flag = _MAPPING_FLAGS[mapping_type]
+    for item in _MAPPING_SPLIT_RE.split(mapping_str):
+        item = item.strip()
+        if not item:
+            continue
         
-        for item in items:
-            item = item.strip()
-            if item:
-                if mapping_type == "port":
-                    # Validate port mapping format
-                    if ':' in item:
-                        host_port, container_port = item.split(':', 1)
-                        # Basic validation
-                        if host_port and container_port:
-                            mappings.append(f"-p {item}")
-                    else:
-                        # Just container port
-                        mappings.append(f"-p {item}:{item}")
-                elif mapping_type == "volume":
-                    # Volume mapping
-                    if ':' in item:
-                        mappings.append(f"-v {item}")
-                    else:
-                        # Just container path
-                        mappings.append(f"-v {item}:{item}")
-                elif mapping_type == "env":
-                    # Environment variable
-                    if '=' in item:
-                        mappings.append(f"-e {item}")
-                    else:
-                        # Just key
-                        mappings.append(f"-e {item}=")
-    except Exception:
-        # If parsing fails, return as is
-        if mapping_type == "port":
-            return [f"-p {mapping_str}"]
-        elif mapping_type == "volume":
-            return [f"-v {mapping_str}"]
-        elif mapping_type == "env":
-            return [f"-e {mapping_str}"]
-    
-    return mappings
+        if mapping_type == "env":
+            # Environment variable; a bare key gets an empty value
+            yield flag
+            yield item if '=' in item else f"{item}="
+        elif ':' in item:
+            # host:container mapping; for ports both sides must be present
+            if mapping_type == "port":
+                host_port, container_port = item.split(':', 1)
+                if not (host_port and container_port):
+                    continue
+            yield flag
+            yield item
+        else:
+            # Just the container side, mapped to itself
+            yield flag
+            yield f"{item}:{item}"
+
+@functools.lru_cache(maxsize=256)
+def _shlex_split(command):
+    """Split a shell-style command string, honouring quotes; memoized per string."""
+    return tuple(shlex.split(command, posix=True))
+
+def _command_args(command):
+    """Return argv tokens for a command given as a string or a pre-split list."""
+    if isinstance(command, (list, tuple)):
+        return command
+    return _shlex_split(command)
 
 # Container Management Functions
-def docker_run(image: str, name: str = None, command: str = None, ports: str = None,
+@_invalidates_cache
+def docker_run(image: str, name: str = None, command: Union[str, List[str]] = None, ports: str = None,
                volumes: str = None, environment: str = None, detach: bool = False,
                workdir: str = None) -> str:
     '''
@@ -440,8 +760,8 @@ def docker_run(image: str, name: str = None, command: str = None, ports: str = N
     :type image: str
     :param name: Container name
     :type name: str
-    :param command: Command to run in container
-    :type command: str
+    :param command: Command to run in container (shell-style string or argv list)
+    :type command: Union[str, List[str]]
     :param ports: Port mappings (host:container)
     :type ports: str
     :param volumes: Volume mappings (host:container)
@@ -465,22 +785,13 @@ def docker_run(image: str, name: str = None, command: str = None, ports: str = N
             args.extend(["--name", name])
         
         # Add port mappings
-        if ports:
-            port_mappings = _parse_mappings(ports, "port")
-            for mapping in port_mappings:
-                args.extend(mapping.split())
+        args.extend(_parse_mappings(ports, "port"))
         
         # Add volume mappings
-        if volumes:
-            volume_mappings = _parse_mappings(volumes, "volume")
-            for mapping in volume_mappings:
-                args.extend(mapping.split())
+        args.extend(_parse_mappings(volumes, "volume"))
         
         # Add environment variables
-        if environment:
-            env_mappings = _parse_mappings(environment, "env")
-            for mapping in env_mappings:
-                args.extend(mapping.split())
+        args.extend(_parse_mappings(environment, "env"))
         
         if workdir:
             args.extend(["-w", workdir])
@@ -488,14 +799,38 @@ def docker_run(image: str, name: str = None, command: str = None, ports: str = N
         args.append(image)
         
         if command:
-            args.extend(command.split())
+            args.extend(_command_args(command))
         
-        return _run_docker_command(args, timeout=60)
+        return str(_run_docker_command(args, timeout=60, quiet=detach))
         
     except Exception as e:
         return f"Error running container: {str(e)}"
 
-def docker_ps(all: bool = False, filter: str = None) -> str:
+def _format_table(headers, rows):
+    """Render rows as a left-aligned, space-padded text table (like docker's table format)."""
+    widths = [len(header) for header in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    
+    # Columns are separated by 3 spaces; the last column is not padded
+    last = len(headers) - 1
+    return "\n".join(
+        "   ".join(cell if i == last else cell.ljust(widths[i]) for i, cell in enumerate(row)).rstrip()
+        for row in [headers, *rows]
+    )
+
+# docker ps columns: (header, key in the `{{json .}}` output)
+_PS_COLUMNS = (
+    ("CONTAINER ID", "ID"),
+    ("NAMES", "Names"),
+    ("IMAGE", "Image"),
+    ("STATUS", "Status"),
+    ("PORTS", "Ports"),
+)
+
+def docker_ps(all: bool = False, filter: str = None, format: str = "table") -> str:
     '''
     List docker containers.
     
@@ -503,6 +838,8 @@ def docker_ps(all: bool = False, filter: str = None) -> str:
     :type all: bool
     :param filter: Filter output (e.g., 'status=running')
     :type filter: str
+    :param format: Output format: 'table' (default) or 'json'
+    :type format: str
     :return: Container list output
     :rtype: str
     '''
@@ -514,16 +851,49 @@ def docker_ps(all: bool = False, filter: str = None) -> str:
     if filter:
         args.extend(["--filter", filter])
     
-    args.extend(["--format", "table {{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}"])
+    # One JSON object per line; tabulated here rather than by the CLI
+    args.extend(["--format", "{{json .}}"])
+    
+    result = _cached_run(args, _STATE_CACHE_TTL, max_output=_MAX_OUTPUT_BYTES)
+    if not result.ok:
+        return str(result)
+    
+    containers = []
+    for line in result.out.splitlines():
+        try:
+            containers.append(_json_loads(line))
+        except ValueError:
+            # The truncation marker, or a line cut short by the output cap
+            continue
+    
+    if format and format.lower() == "json":
+        return _json_pretty(containers)
+    
+    rows = [[str(container.get(key, "")) for _, key in _PS_COLUMNS] for container in containers]
+    return _format_table([header for header, _ in _PS_COLUMNS], rows)
+
+def _list_container_ids(status=None):
+    """
+    List container IDs, optionally filtered by status.
+    
+    Goes through the read-only cache, so bulk operations issued back to back
+    (or right after a listing) share one ``docker ps`` enumeration. Returns
+    the CommandResult of the listing, with the IDs whitespace-separated in
+    ``out``.
+    """
+    args = ["ps", "-a", "--format", "{{.ID}}"]
+    if status:
+        args[2:2] = ["--filter", f"status={status}"]
     
-    return _run_docker_command(args)
+    return _cached_run(args, _STATE_CACHE_TTL)
 
-def docker_start(container: str = None, all: bool = False) -> str:
+@_invalidates_cache
+def docker_start(container: Union[str, List[str]] = None, all: bool = False) -> str:
     '''
     Start one or more stopped containers.
     
-    :param container: Container name or ID
-    :type container: str
+    :param container: Container name or ID, or several (list or comma-separated)
+    :type container: Union[str, List[str]]
     :param all: Start all stopped containers
     :type all: bool
     :return: Start operation output
@@ -531,32 +901,27 @@ def docker_start(container: str = None, all: bool = False) -> str:
     '''
     if all:
         # Get all stopped containers
-        args = ["ps", "-a", "--filter", "status=exited", "--format", "{{.ID}}"]
-        result = _run_docker_command(args, check_docker=False)
-        
-        if result.startswith("Error:"):
-            return result
-        
-        containers = result.split()
+        listed = _list_container_ids("exited")
+        if not listed.ok:
+            return listed.err
+        containers = listed.out.split()
         if not containers:
             return "No stopped containers found"
-        
-        args = ["start"] + containers
-        return _run_docker_command(args)
-    
     elif container:
-        return _run_docker_command(["start", container])
-    
+        containers = _split_targets(container)
     else:
         return "Error: Either container name or 'all=True' must be specified"
+    
+    return _run_in_batches(["start"], containers)
 
-def docker_stop(container: str = None, all: bool = False, force: bool = False, 
+@_invalidates_cache
+def docker_stop(container: Union[str, List[str]] = None, all: bool = False, force: bool = False, 
                 timeout: int = 10) -> str:
     '''
     Stop one or more running containers.
     
-    :param container: Container name or ID
-    :type container: str
+    :param container: Container name or ID, or several (list or comma-separated)
+    :type container: Union[str, List[str]]
     :param all: Stop all running containers
     :type all: bool
     :param force: Force stop (kill)
@@ -566,44 +931,35 @@ def docker_stop(container: str = None, all: bool = False, force: bool = False,
     :return: Stop operation output
     :rtype: str
     '''
-    args = ["stop"]
-    
-    if force:
-        args = ["kill"]  # Use kill instead of stop for force
-    
     if all:
         # Get all running containers
-        list_args = ["ps", "--filter", "status=running", "--format", "{{.ID}}"]
-        result = _run_docker_command(list_args, check_docker=False)
-        
-        if result.startswith("Error:"):
-            return result
-        
-        containers = result.split()
+        listed = _list_container_ids("running")
+        if not listed.ok:
+            return listed.err
+        containers = listed.out.split()
         if not containers:
             return "No running containers found"
-        
-        args.extend(containers)
-        if "kill" not in args and timeout:
-            args.extend(["-t", str(timeout)])
-        
-        return _run_docker_command(args)
-    
     elif container:
-        if not force and timeout:
-            args.extend(["-t", str(timeout)])
-        args.append(container)
-        return _run_docker_command(args)
-    
+        containers = _split_targets(container)
     else:
         return "Error: Either container name or 'all=True' must be specified"
+    
+    if force:
+        args = ["kill"]  # Use kill instead of stop for force
+    else:
+        args = ["stop"]
+        if timeout:
+            args.extend(["-t", str(timeout)])
+    
+    return _run_in_batches(args, containers)
 
-def docker_restart(container: str = None, all: bool = False, force: bool = False) -> str:
+@_invalidates_cache
+def docker_restart(container: Union[str, List[str]] = None, all: bool = False, force: bool = False) -> str:
     '''
     Restart one or more containers.
     
-    :param container: Container name or ID
-    :type container: str
+    :param container: Container name or ID, or several (list or comma-separated)
+    :type container: Union[str, List[str]]
     :param all: Restart all containers
     :type all: bool
     :param force: Force restart
@@ -613,38 +969,30 @@ def docker_restart(container: str = None, all: bool = False, force: bool = False
     '''
     if all:
         # Get all containers
-        list_args = ["ps", "-a", "--format", "{{.ID}}"]
-        result = _run_docker_command(list_args, check_docker=False)
-        
-        if result.startswith("Error:"):
-            return result
-        
-        containers = result.split()
+        listed = _list_container_ids()
+        if not listed.ok:
+            return listed.err
+        containers = listed.out.split()
         if not containers:
             return "No containers found"
-        
-        args = ["restart"]
-        if force:
-            args.append("--force")
-        args.extend(containers)
-        return _run_docker_command(args)
-    
     elif container:
-        args = ["restart"]
-        if force:
-            args.append("--force")
-        args.append(container)
-        return _run_docker_command(args)
-    
+        containers = _split_targets(container)
     else:
         return "Error: Either container name or 'all=True' must be specified"
+    
+    args = ["restart"]
+    if force:
+        args.append("--force")
+    
+    return _run_in_batches(args, containers)
 
-def docker_rm(container: str = None, all: bool = False, force: bool = False) -> str:
+@_invalidates_cache
+def docker_rm(container: Union[str, List[str]] = None, all: bool = False, force: bool = False) -> str:
     '''
     Remove one or more containers.
     
-    :param container: Container name or ID
-    :type container: str
+    :param container: Container name or ID, or several (list or comma-separated)
+    :type container: Union[str, List[str]]
     :param all: Remove all containers
     :type all: bool
     :param force: Force removal
@@ -654,31 +1002,69 @@ def docker_rm(container: str = None, all: bool = False, force: bool = False) ->
     '''
     if all:
         # Get all containers
-        list_args = ["ps", "-a", "--format", "{{.ID}}"]
-        result = _run_docker_command(list_args, check_docker=False)
-        
-        if result.startswith("Error:"):
-            return result
-        
-        containers = result.split()
+        listed = _list_container_ids()
+        if not listed.ok:
+            return listed.err
+        containers = listed.out.split()
         if not containers:
             return "No containers found"
-        
-        args = ["rm"]
-        if force:
-            args.append("-f")
-        args.extend(containers)
-        return _run_docker_command(args)
-    
     elif container:
-        args = ["rm"]
-        if force:
-            args.append("-f")
-        args.append(container)
-        return _run_docker_command(args)
-    
+        containers = _split_targets(container)
     else:
         return "Error: Either container name or 'all=True' must be specified"
+    
+    return _run_in_batches(["rm", *(("-f",) if force else ())], containers)
+
+# Seconds a following `docker logs` gets to exit on SIGTERM before it is killed
+_FOLLOW_STOP_TIMEOUT = 2.0
+
+def _read_follow_output(process, timeout, max_lines=1000):
+    """
+    Collect output from a following process until ``timeout`` elapses, the
+    stream ends or ``max_lines`` is exceeded.
+    
+    Waits on the pipe with a selector and drains everything available per
+    wake-up, so lines are picked up as soon as they arrive. Raw bytes are
+    accumulated in a single buffer and decoded once at the end.
+    """
+    buf = bytearray()
+    line_count = 0
+    deadline = time.monotonic() + timeout
+    
+    if os.name == "nt":
+        # Pipes are not selectable on Windows; fall back to polling readline
+        while time.monotonic() < deadline and line_count <= max_lines:
+            line = process.stdout.readline()
+            if line:
+                buf += line
+                line_count += 1
+            else:
+                time.sleep(0.1)
+    else:
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while line_count <= max_lines:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(timeout=remaining):
+                    break
+                
+                chunk = os.read(fd, 65536)
+                if not chunk:  # Stream closed
+                    break
+                buf += chunk
+                line_count += chunk.count(b"\n")
+    
+    if line_count > max_lines:  # Limit output
+        cut = -1
+        for _ in range(max_lines):
+            cut = buf.index(b"\n", cut + 1)
+        del buf[cut + 1:]
+        buf += b"... (output truncated)"
+    
+    return buf.decode('utf-8', 'replace').rstrip()
 
 def docker_logs(container: str, follow: bool = False, timeout: int = 30) -> str:
     '''
@@ -705,44 +1091,39 @@ def docker_logs(container: str, follow: bool = False, timeout: int = 30) -> str:
     
     # For follow mode, we might want a different approach
     if follow:
+        if not docker_available():
+            return _DOCKER_MISSING_MSG
         try:
             process = subprocess.Popen(
-                ['docker'] + args,
+                [_DOCKER_BIN, *args],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.STDOUT
             )
-            
-            # Read for specified timeout
-            start_time = time.time()
-            output_lines = []
-            
-            while time.time() - start_time < timeout:
-                line = process.stdout.readline()
-                if line:
-                    output_lines.append(line.strip())
-                else:
-                    time.sleep(0.1)
-                
-                if len(output_lines) > 1000:  # Limit output
-                    output_lines.append("... (output truncated)")
-                    break
-            
-            process.terminate()
-            return "\n".join(output_lines)
+            # Leaving the with block closes stdout and reaps the process
+            with process:
+                try:
+                    return _read_follow_output(process, timeout)
+                finally:
+                    process.terminate()
+                    try:
+                        process.wait(timeout=_FOLLOW_STOP_TIMEOUT)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
         except Exception as e:
             return f"Error reading logs: {str(e)}"
     else:
-        return _run_docker_command(args, timeout=timeout)
+        # Keep the most recent output when the log is too large
+        return str(_run_docker_command(args, timeout=timeout, max_output=_MAX_OUTPUT_BYTES, tail=True))
 
-def docker_exec(container: str, command: str, detach: bool = False, workdir: str = None) -> str:
+@_invalidates_cache
+def docker_exec(container: str, command: Union[str, List[str]], detach: bool = False, workdir: str = None) -> str:
     '''
     Run a command in a running container.
     
     :param container: Container name or ID
     :type container: str
-    :param command: Command to execute
-    :type command: str
+    :param command: Command to execute (shell-style string or argv list)
+    :type command: Union[str, List[str]]
     :param detach: Detach from the command (run in background)
     :type detach: bool
     :param workdir: Working directory inside container
@@ -759,31 +1140,93 @@ def docker_exec(container: str, command: str, detach: bool = False, workdir: str
         args.extend(["-w", workdir])
     
     args.append(container)
-    args.extend(command.split())
+    try:
+        args.extend(_command_args(command))
+    except ValueError as e:
+        return f"Error: Invalid command: {str(e)}"
+    
+    return str(_run_docker_command(args, quiet=detach))
+
+def _json_loads(text):
+    """Parse JSON text, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _json_pretty(data):
+    """Pretty-print data as 2-space indented JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def _split_targets(targets: Union[str, List[str]]) -> List[str]:
+    """Normalize a list or comma-separated string of docker object names/IDs."""
+    if isinstance(targets, str):
+        targets = targets.split(',')
+    return [target.strip() for target in targets if target and target.strip()]
+
+def docker_inspect_many(containers: Union[str, List[str]]) -> Dict[str, Any]:
+    '''
+    Inspect several Docker objects with a single ``docker inspect`` invocation,
+    or over the persistent Engine API connection when it is reachable.
+    
+    :param containers: Container names or IDs, as a list or comma-separated string
+    :type containers: Union[str, List[str]]
+    :return: Inspect data keyed by the requested name or ID
+    :rtype: Dict[str, Any]
+    :raises RuntimeError: If docker reports an error or returns unparsable output
+    '''
+    ids = _split_targets(containers)
+    if not ids:
+        return {}
     
-    return _run_docker_command(args)
+    data = _api_inspect(ids)
+    if data is not None:
+        return dict(zip(ids, data))
+    
+    result = _cached_run(["inspect", *ids], _STATE_CACHE_TTL)
+    if not result.ok:
+        raise RuntimeError(str(result))
+    
+    try:
+        data = _json_loads(result.out)
+    except ValueError:
+        raise RuntimeError(f"Error: Unable to parse docker inspect output: {result.out}")
+    
+    # docker inspect preserves argument order in its JSON array
+    return dict(zip(ids, data))
 
-def docker_inspect(container: str) -> str:
+def docker_inspect(container: Union[str, List[str]]) -> str:
     '''
     Return low-level information on Docker objects.
     
-    :param container: Container name or ID
-    :type container: str
+    Several targets (a list or comma-separated string) are inspected with a
+    single docker invocation.
+    
+    :param container: Container name or ID, or several of them
+    :type container: Union[str, List[str]]
     :return: Inspection output
     :rtype: str
     '''
-    args = ["inspect", container]
-    result = _run_docker_command(args)
+    ids = _split_targets(container)
+    if not ids:
+        return "Error: At least one container name or ID must be specified"
+    
+    data = _api_inspect(ids)
+    if data is not None:
+        return _json_pretty(data)
     
-    if not result.startswith("Error:"):
+    args = ["inspect", *ids]
+    result = _cached_run(args, _STATE_CACHE_TTL, max_output=_MAX_OUTPUT_BYTES)
+    
+    if result.ok:
         try:
             # Try to format JSON output
-            data = json.loads(result)
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return _json_pretty(_json_loads(result.out))
         except:
             pass
     
-    return result
+    return str(result)
 
 # Image Management Functions
 def docker_images() -> str:
@@ -793,9 +1236,23 @@ def docker_images() -> str:
     :return: Images list output
     :rtype: str
     '''
-    args = ["images", "--format", "table {{.Repository}}\t{{.Tag}}\t{{.ID}}\t{{.CreatedAt}}\t{{.Size}}"]
-    return _run_docker_command(args)
+    return str(_cached_run(_ARGS_IMAGES, _LISTING_CACHE_TTL, watch=True))
+
+# Image reference: optional registry host (has a dot or a port), repository,
+# then an optional ":tag" or "@digest" suffix
+_IMAGE_REF_RE = re.compile(r'^(?:(?P<registry>[^/]+\.[^/]+|[^/]+:\d+)/)?(?P<repo>[^:@]+)(?P<ref>[:@].+)?$')
 
+@functools.lru_cache(maxsize=256)
+def _qualify_image(image, registry):
+    """Prefix ``image`` with ``registry``, replacing any registry it already names."""
+    match = _IMAGE_REF_RE.match(image)
+    if match is None:
+        return f"{registry}/{image}" if image else registry
+    if match.group("registry") == registry:
+        return image
+    return f"{registry}/{match.group('repo')}{match.group('ref') or ''}"
+
+@_invalidates_cache
 def docker_pull(image: str, registry: str = None, username: str = None, 
                 password: str = None) -> str:
     '''
@@ -813,26 +1270,38 @@ def docker_pull(image: str, registry: str = None, username: str = None,
     :rtype: str
     '''
     # Construct full image name
-    full_image = image
-    if registry:
-        # Remove any existing registry from image name
-        if '/' in image and not image.startswith(registry):
-            # Image might already have a registry
-            parts = image.split('/')
-            if len(parts) > 1 and '.' in parts[0] or ':' in parts[0]:
-                # First part looks like a registry
-                image = '/'.join(parts[1:])
-        
-        # Add registry prefix
-        full_image = f"{registry}/{image}" if image else registry
+    full_image = _qualify_image(image, registry) if registry else image
     
     args = ["pull", full_image]
     
     # Note: For authentication, Docker usually uses docker login command
     # or credentials from config. We could implement docker_login function.
     
-    return _run_docker_command(args, timeout=300)  # Longer timeout for pull
+    return str(_run_docker_command(args, timeout=300))  # Longer timeout for pull
 
+def docker_pull_many(images: Union[str, List[str]], registry: str = None,
+                     max_parallel: int = 4) -> str:
+    '''
+    Pull several images concurrently, at most ``max_parallel`` at a time.
+    
+    :param images: Image names, as a list or comma-separated string
+    :type images: Union[str, List[str]]
+    :param registry: Docker registry URL
+    :type registry: str
+    :param max_parallel: Maximum number of pulls running at once
+    :type max_parallel: int
+    :return: Pull output for each image, one ``image: output`` entry per image
+    :rtype: str
+    '''
+    images = _split_targets(images)
+    if not images:
+        return "Error: No images specified"
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(images)))) as executor:
+        results = executor.map(lambda image: docker_pull(image, registry), images)
+        return "\n".join(f"{image}: {result}" for image, result in zip(images, results))
+
+@_invalidates_cache
 def docker_build(dockerfile: str = "Dockerfile", tag: str = None, 
                  context: str = ".", image: str = None) -> str:
     '''
@@ -861,7 +1330,7 @@ def docker_build(dockerfile: str = "Dockerfile", tag: str = None,
     
     args.append(context)
     
-    return _run_docker_command(args, timeout=600)  # Long timeout for build
+    return str(_run_docker_command(args, timeout=600))  # Long timeout for build
 
 def docker_push(image: str, registry: str = None, username: str = None, 
                 password: str = None) -> str:
@@ -880,23 +1349,13 @@ def docker_push(image: str, registry: str = None, username: str = None,
     :rtype: str
     '''
     # Construct full image name
-    full_image = image
-    if registry:
-        # Remove any existing registry from image name
-        if '/' in image and not image.startswith(registry):
-            parts = image.split('/')
-            if len(parts) > 1 and ('.' in parts[0] or ':' in parts[0]):
-                image = '/'.join(parts[1:])
-        
-        # Add registry prefix
-        full_image = f"{registry}/{image}" if image else registry
-    
-    args = ["push", full_image]
+    full_image = _qualify_image(image, registry) if registry else image
     
     # Note: Authentication handled by docker login
     
-    return _run_docker_command(args, timeout=300)  # Longer timeout for push
+    return str(_run_docker_command(["push", full_image], timeout=300))  # Longer timeout for push
 
+@_invalidates_cache
 def docker_rmi(image: str = None, force: bool = False, all: bool = False) -> str:
     '''
     Remove one or more images.
@@ -912,14 +1371,10 @@ def docker_rmi(image: str = None, force: bool = False, all: bool = False) -> str
     '''
     if all:
         # Remove all unused images
-        return _run_docker_command(["image", "prune", "-a", "-f" if force else ""])
+        return str(_run_docker_command(["image", "prune", "-a", *(("-f",) if force else ())]))
     
     elif image:
-        args = ["rmi"]
-        if force:
-            args.append("-f")
-        args.append(image)
-        return _run_docker_command(args)
+        return str(_run_docker_command(["rmi", *(("-f",) if force else ()), image]))
     
     else:
         return "Error: Either image name or 'all=True' must be specified"
@@ -932,9 +1387,9 @@ def docker_network_ls() -> str:
     :return: Network list output
     :rtype: str
     '''
-    args = ["network", "ls", "--format", "table {{.ID}}\t{{.Name}}\t{{.Driver}}\t{{.Scope}}"]
-    return _run_docker_command(args)
+    return str(_cached_run(_ARGS_NETWORK_LS, _LISTING_CACHE_TTL, watch=True))
 
+@_invalidates_cache
 def docker_network_create(name: str = None, network: str = None) -> str:
     '''
     Create a docker network.
@@ -951,8 +1406,9 @@ def docker_network_create(name: str = None, network: str = None) -> str:
     if not network_name:
         return "Error: Network name is required"
     
-    return _run_docker_command(["network", "create", network_name])
+    return str(_run_docker_command(["network", "create", network_name]))
 
+@_invalidates_cache
 def docker_network_rm(network: str, force: bool = False) -> str:
     '''
     Remove one or more docker networks.
@@ -964,11 +1420,7 @@ def docker_network_rm(network: str, force: bool = False) -> str:
     :return: Network removal output
     :rtype: str
     '''
-    args = ["network", "rm"]
-    if force:
-        args.append("--force")
-    args.append(network)
-    return _run_docker_command(args)
+    return str(_run_docker_command(["network", "rm", *(("--force",) if force else ()), network]))
 
 # Volume Management Functions
 def docker_volume_ls() -> str:
@@ -978,9 +1430,9 @@ def docker_volume_ls() -> str:
     :return: Volume list output
     :rtype: str
     '''
-    args = ["volume", "ls", "--format", "table {{.Name}}\t{{.Driver}}\t{{.Scope}}"]
-    return _run_docker_command(args)
+    return str(_cached_run(_ARGS_VOLUME_LS, _LISTING_CACHE_TTL, watch=True))
 
+@_invalidates_cache
 def docker_volume_create(name: str = None, volume: str = None) -> str:
     '''
     Create a docker volume.
@@ -997,8 +1449,9 @@ def docker_volume_create(name: str = None, volume: str = None) -> str:
     if not volume_name:
         return "Error: Volume name is required"
     
-    return _run_docker_command(["volume", "create", volume_name])
+    return str(_run_docker_command(["volume", "create", volume_name]))
 
+@_invalidates_cache
 def docker_volume_rm(volume: str, force: bool = False) -> str:
     '''
     Remove one or more docker volumes.
@@ -1010,11 +1463,7 @@ def docker_volume_rm(volume: str, force: bool = False) -> str:
     :return: Volume removal output
     :rtype: str
     '''
-    args = ["volume", "rm"]
-    if force:
-        args.append("-f")
-    args.append(volume)
-    return _run_docker_command(args)
+    return str(_run_docker_command(["volume", "rm", *(("-f",) if force else ()), volume]))
 
 # System Functions
 def docker_info() -> str:
@@ -1024,7 +1473,7 @@ def docker_info() -> str:
     :return: Docker system information
     :rtype: str
     '''
-    return _run_docker_command(["info"])
+    return str(_cached_run(_ARGS_INFO, _SYSTEM_CACHE_TTL))
 
 def docker_version() -> str:
     '''
@@ -1033,69 +1482,183 @@ def docker_version() -> str:
     :return: Docker version information
     :rtype: str
     '''
-    return _run_docker_command(["version"])
+    return str(_cached_run(_ARGS_VERSION, _SYSTEM_CACHE_TTL))
 
 # Compose Functions
+_COMPOSE_MISSING_MSG = "Error: Neither docker-compose nor docker compose is available"
+
+@functools.lru_cache(maxsize=1)
+def _detect_compose_cmd():
+    """Return the compose command as an argv prefix, probed once per process (None if neither works)."""
+    # Prefer standalone docker-compose, then the docker compose (v2) plugin;
+    # both by absolute path so later runs skip the PATH search
+    docker_available()
+    for candidate in ((shutil.which('docker-compose'),), (_DOCKER_BIN, 'compose')):
+        if candidate[0] is None:
+            continue
+        try:
+            subprocess.run([*candidate, '--version'], capture_output=True, check=True, timeout=5)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            continue
+        return candidate
+    return None
+
+def _invalidate_compose_cache():
+    """Forget the detected compose command so the next call probes again."""
+    _detect_compose_cmd.cache_clear()
+
+def _run_compose(subcmd, compose_file, extra, timeout, empty_message, tail=False):
+    """
+    Run one compose subcommand and return its CommandResult.
+    
+    A successful run without output carries ``empty_message`` in ``out``.
+    With ``tail`` only the last ``_MAX_OUTPUT_BYTES`` of output are kept.
+    """
+    compose_cmd = _detect_compose_cmd()
+    if compose_cmd is None:
+        # Don't remember the miss, so installing compose later is picked up
+        _invalidate_compose_cache()
+        return CommandResult(False, err=_COMPOSE_MISSING_MSG, code=-1)
+    
+    args = [*compose_cmd, "-f", compose_file, subcmd, *extra]
+    
+    try:
+        if tail and os.name != "nt":
+            returncode, output, error, truncated = _run_bounded(args, timeout, _MAX_OUTPUT_BYTES, tail=True)
+            if truncated:
+                output = "... (earlier output truncated)\n" + output
+        else:
+            returncode, output, error = _run_with_pidfd(args, timeout)
+        output = output.strip()
+        error = error.strip()
+        
+        if returncode != 0:
+            return CommandResult(False, output, f"Compose {subcmd} failed: {error}", returncode)
+        
+        return CommandResult(True, output or empty_message, error, returncode)
+        
+    except subprocess.TimeoutExpired:
+        return CommandResult(False, err=f"Error: Compose {subcmd} command timed out after {timeout} seconds", code=-1)
+    except FileNotFoundError:
+        # The detected binary has gone away; detect again next time
+        _invalidate_compose_cache()
+        return CommandResult(False, err=_COMPOSE_MISSING_MSG, code=-1)
+    except Exception as e:
+        return CommandResult(False, err=f"Error executing compose {subcmd}: {str(e)}", code=-1)
+
+def _compose_service_levels(compose_file, services=None):
+    """
+    Group services of ``compose_file`` into ``depends_on`` levels.
+    
+    Each level depends only on earlier ones, so its services can start
+    together. With ``services`` the levels cover those services plus
+    everything they depend on; otherwise the file's default services.
+    Returns None when the file cannot be read or ordered, names an unknown
+    service, or PyYAML/graphlib are unavailable; compose then orders
+    services itself.
+    """
+    try:
+        import yaml
+        from graphlib import TopologicalSorter
+    except ImportError:
+        return None
+    
+    try:
+        with open(compose_file, 'r', encoding='utf-8') as f:
+            specs = {name: spec or {} for name, spec in yaml.safe_load(f).get('services').items()}
+        # depends_on is either a list of names or a mapping keyed by name
+        graph = {name: [dep for dep in spec.get('depends_on') or () if dep in specs]
+                 for name, spec in specs.items()}
+        
+        if services:
+            if any(service not in graph for service in services):
+                return None
+            # compose starts a service's dependencies too, so order all of them
+            wanted = set()
+            pending = list(services)
+            while pending:
+                name = pending.pop()
+                if name not in wanted:
+                    wanted.add(name)
+                    pending.extend(graph[name])
+        else:
+            # Services behind a profile are not started by a plain "up"
+            wanted = {name for name, spec in specs.items() if not spec.get('profiles')}
+        
+        sorter = TopologicalSorter({name: [dep for dep in graph[name] if dep in wanted] for name in wanted})
+        sorter.prepare()
+        
+        levels = []
+        while sorter.is_active():
+            ready = sorted(sorter.get_ready())
+            levels.append(ready)
+            sorter.done(*ready)
+        return levels
+    except (OSError, ValueError, AttributeError, TypeError, yaml.YAMLError):
+        # Unreadable or malformed file, or a dependency cycle (graphlib.CycleError)
+        return None
+
+def _compose_up_levels(compose_file, levels, max_parallel):
+    """
+    Bring services up level by level, at most ``max_parallel`` at once.
+    
+    Networks, volumes and containers are first created by a single
+    ``up --no-start``, so the concurrent per-service ``up --no-deps`` calls
+    only start containers and never race to create shared resources. A
+    failed level stops the levels after it.
+    """
+    services = [service for level in levels for service in level]
+    created = _run_compose("up", compose_file, ["--no-start", *services], 300,
+                           "Compose services created successfully")
+    if not created.ok:
+        return created.err
+    
+    lines = []
+    with ThreadPoolExecutor(max_workers=min(max_parallel, max(map(len, levels)))) as executor:
+        for index, level in enumerate(levels):
+            results = list(executor.map(
+                lambda service: _run_compose("up", compose_file, ["-d", "--no-deps", service], 300,
+                                             "Compose services started successfully"),
+                level))
+            lines.extend(f"{service}: {result}" for service, result in zip(level, results))
+            if not all(result.ok for result in results):
+                skipped = [service for later in levels[index + 1:] for service in later]
+                if skipped:
+                    lines.append(f"Skipped after a failure: {', '.join(skipped)}")
+                break
+    return "\n".join(lines)
+
+@_invalidates_cache
 def docker_compose_up(compose_file: str = "docker-compose.yml", services: str = None, 
-                      detach: bool = False) -> str:
+                      detach: bool = False, max_parallel: int = 1) -> str:
     '''
     Create and start containers from compose file.
     
+    In detached mode with ``max_parallel`` above 1, services are started
+    level by level along their ``depends_on`` graph, with the services of
+    a level brought up concurrently, at most ``max_parallel`` at a time.
+    
     :param compose_file: Docker Compose file path
     :type compose_file: str
     :param services: Specific services to start (comma-separated)
     :type services: str
     :param detach: Run in detached mode
     :type detach: bool
+    :param max_parallel: Maximum number of services started at once (default 1: a single compose call)
+    :type max_parallel: int
     :return: Compose up output
     :rtype: str
     '''
-    # Check if docker-compose is available
-    try:
-        subprocess.run(['docker-compose', '--version'], 
-                      capture_output=True, check=True, timeout=5)
-        compose_cmd = 'docker-compose'
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Try docker compose (v2)
-        try:
-            subprocess.run(['docker', 'compose', '--version'],
-                          capture_output=True, check=True, timeout=5)
-            compose_cmd = 'docker compose'
-        except:
-            return "Error: Neither docker-compose nor docker compose is available"
-    
-    args = compose_cmd.split()
-    args.extend(["-f", compose_file, "up"])
+    # Attached "up" never returns while services run, so only fan out when detached
+    if detach and max_parallel > 1 and _detect_compose_cmd() is not None:
+        levels = _compose_service_levels(compose_file, _split_targets(services) if services else None)
+        if levels and any(len(level) > 1 for level in levels):
+            return _compose_up_levels(compose_file, levels, max_parallel)
     
-    if detach:
-        args.append("-d")
-    
-    if services:
-        services_list = services.split(',')
-        args.extend(services_list)
-    
-    # Run the command
-    try:
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
-        
-        output = result.stdout.strip()
-        error = result.stderr.strip()
-        
-        if result.returncode != 0:
-            return f"Compose command failed: {error}"
-        
-        return output if output else "Compose services started successfully"
-        
-    except subprocess.TimeoutExpired:
-        return "Error: Compose command timed out after 300 seconds"
-    except Exception as e:
-        return f"Error executing compose command: {str(e)}"
+    extra = [*(("-d",) if detach else ()), *(services.split(',') if services else ())]
+    return str(_run_compose("up", compose_file, extra, 300, "Compose services started successfully"))
 
+@_invalidates_cache
 def docker_compose_down(compose_file: str = "docker-compose.yml", force: bool = False) -> str:
     '''
     Stop and remove containers, networks from compose file.
@@ -1107,43 +1670,8 @@ def docker_compose_down(compose_file: str = "docker-compose.yml", force: bool =
     :return: Compose down output
     :rtype: str
     '''
-    # Check compose availability (simplified version)
-    try:
-        subprocess.run(['docker-compose', '--version'], capture_output=True, timeout=5)
-        compose_cmd = 'docker-compose'
-    except:
-        try:
-            subprocess.run(['docker', 'compose', '--version'], capture_output=True, timeout=5)
-            compose_cmd = 'docker compose'
-        except:
-            return "Error: Neither docker-compose nor docker compose is available"
-    
-    args = compose_cmd.split()
-    args.extend(["-f", compose_file, "down"])
-    
-    if force:
-        args.extend(["-v", "--remove-orphans"])
-    
-    try:
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-        
-        output = result.stdout.strip()
-        error = result.stderr.strip()
-        
-        if result.returncode != 0:
-            return f"Compose down failed: {error}"
-        
-        return output if output else "Compose services stopped and removed"
-        
-    except subprocess.TimeoutExpired:
-        return "Error: Compose down command timed out"
-    except Exception as e:
-        return f"Error executing compose down: {str(e)}"
+    extra = ("-v", "--remove-orphans") if force else ()
+    return str(_run_compose("down", compose_file, extra, 120, "Compose services stopped and removed"))
 
 def docker_compose_ps(compose_file: str = "docker-compose.yml") -> str:
     '''
@@ -1154,40 +1682,7 @@ def docker_compose_ps(compose_file: str = "docker-compose.yml") -> str:
     :return: Compose ps output
     :rtype: str
     '''
-    # Check compose availability
-    try:
-        subprocess.run(['docker-compose', '--version'], capture_output=True, timeout=5)
-        compose_cmd = 'docker-compose'
-    except:
-        try:
-            subprocess.run(['docker', 'compose', '--version'], capture_output=True, timeout=5)
-            compose_cmd = 'docker compose'
-        except:
-            return "Error: Neither docker-compose nor docker compose is available"
-    
-    args = compose_cmd.split()
-    args.extend(["-f", compose_file, "ps"])
-    
-    try:
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        output = result.stdout.strip()
-        error = result.stderr.strip()
-        
-        if result.returncode != 0:
-            return f"Compose ps failed: {error}"
-        
-        return output if output else "No compose services running"
-        
-    except subprocess.TimeoutExpired:
-        return "Error: Compose ps command timed out"
-    except Exception as e:
-        return f"Error executing compose ps: {str(e)}"
+    return str(_run_compose("ps", compose_file, (), 30, "No compose services running"))
 
 def docker_compose_logs(compose_file: str = "docker-compose.yml", services: str = None, 
                         follow: bool = False) -> str:
@@ -1203,49 +1698,9 @@ def docker_compose_logs(compose_file: str = "docker-compose.yml", services: str
     :return: Compose logs output
     :rtype: str
     '''
-    # Check compose availability
-    try:
-        subprocess.run(['docker-compose', '--version'], capture_output=True, timeout=5)
-        compose_cmd = 'docker-compose'
-    except:
-        try:
-            subprocess.run(['docker', 'compose', '--version'], capture_output=True, timeout=5)
-            compose_cmd = 'docker compose'
-        except:
-            return "Error: Neither docker-compose nor docker compose is available"
-    
-    args = compose_cmd.split()
-    args.extend(["-f", compose_file, "logs"])
-    
-    if follow:
-        args.append("--follow")
-        # Limit initial output
-        args.extend(["--tail", "50"])
-    
-    if services:
-        services_list = services.split(',')
-        args.extend(services_list)
-    
-    try:
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=30 if not follow else 10
-        )
-        
-        output = result.stdout.strip()
-        error = result.stderr.strip()
-        
-        if result.returncode != 0:
-            return f"Compose logs failed: {error}"
-        
-        return output if output else "No logs available"
-        
-    except subprocess.TimeoutExpired:
-        return "Error: Compose logs command timed out"
-    except Exception as e:
-        return f"Error executing compose logs: {str(e)}"
+    # In follow mode limit the initial output
+    extra = [*(("--follow", "--tail", "50") if follow else ()), *(services.split(',') if services else ())]
+    return str(_run_compose("logs", compose_file, extra, 30 if not follow else 10, "No logs available", tail=True))
 
 
 
@@ -1262,15 +1717,10 @@ def docker_stats(container: str = None, all: bool = False) -> str:
     :return: Stats output
     :rtype: str
     '''
-    args = ["stats", "--no-stream"]  # Get one snapshot instead of streaming
+    # Get one snapshot instead of streaming
+    args = ["stats", "--no-stream", *(("--all",) if all else ()), *((container,) if container else ())]
     
-    if all:
-        args.append("--all")
-    
-    if container:
-        args.append(container)
-    
-    return _run_docker_command(args)
+    return str(_cached_run(args, _STATE_CACHE_TTL, max_output=_MAX_OUTPUT_BYTES))
 
 def docker_top(container: str) -> str:
     '''
@@ -1281,7 +1731,7 @@ def docker_top(container: str) -> str:
     :return: Top output
     :rtype: str
     '''
-    return _run_docker_command(["top", container])
+    return str(_cached_run(["top", container], _STATE_CACHE_TTL))
 
 def docker_login(registry: str = None, username: str = None, password: str = None) -> str:
     '''
@@ -1299,21 +1749,13 @@ def docker_login(registry: str = None, username: str = None, password: str = Non
     # Note: This function has security implications
     # In production, consider using Docker's credential store instead
     
-    args = ["login"]
-    
-    if registry:
-        args.append(registry)
-    
     # For username/password, we could use --username flag
     # But passing password via command line is insecure
     # Better approach: let docker prompt for password
+    # (the password is never put on the command line)
+    args = ["login", *((registry,) if registry else ()), *(("--username", username) if username else ())]
     
-    if username:
-        args.extend(["--username", username])
-        # Don't include password in command line for security
-        # Docker will prompt for password
-    
-    return _run_docker_command(args)
+    return str(_run_docker_command(args))
 
 def docker_logout(registry: str = None) -> str:
     '''
@@ -1324,13 +1766,11 @@ def docker_logout(registry: str = None) -> str:
     :return: Logout output
     :rtype: str
     '''
-    args = ["logout"]
+    args = ["logout", *((registry,) if registry else ())]
     
-    if registry:
-        args.append(registry)
-    
-    return _run_docker_command(args)
+    return str(_run_docker_command(args))
 
+@_invalidates_cache
 def docker_system_prune(all: bool = False, volumes: bool = False, force: bool = False) -> str:
     '''
     Remove unused Docker data.
@@ -1344,19 +1784,12 @@ def docker_system_prune(all: bool = False, volumes: bool = False, force: bool =
     :return: Prune output
     :rtype: str
     '''
-    args = ["system", "prune"]
-    
-    if force:
-        args.append("-f")
+    args = ["system", "prune", *(("-f",) if force else ()), *(("-a",) if all else ()),
+            *(("--volumes",) if volumes else ())]
     
-    if all:
-        args.append("-a")
-    
-    if volumes:
-        args.append("--volumes")
-    
-    return _run_docker_command(args)
+    return str(_run_docker_command(args))
 
+@_invalidates_cache
 def docker_container_prune(force: bool = False) -> str:
     '''
     Remove all stopped containers.
@@ -1366,13 +1799,11 @@ def docker_container_prune(force: bool = False) -> str:
     :return: Prune output
     :rtype: str
     '''
-    args = ["container", "prune"]
+    args = ["container", "prune", *(("-f",) if force else ())]
     
-    if force:
-        args.append("-f")
-    
-    return _run_docker_command(args)
+    return str(_run_docker_command(args))
 
+@_invalidates_cache
 def docker_image_prune(all: bool = False, force: bool = False) -> str:
     '''
     Remove unused images.
@@ -1384,17 +1815,12 @@ def docker_image_prune(all: bool = False, force: bool = False) -> str:
     :return: Prune output
     :rtype: str
     '''
-    args = ["image", "prune"]
-    
-    if force:
-        args.append("-f")
+    args = ["image", "prune", *(("-f",) if force else ()), *(("-a",) if all else ())]
     
-    if all:
-        args.append("-a")
-    
-    return _run_docker_command(args)
+    return str(_run_docker_command(args))
 
-TOOL_CALL_MAP = {
+# Read-only, with interned keys so interned tool names compare by identity
+TOOL_CALL_MAP = types.MappingProxyType({sys.intern(name): func for name, func in {
     # Container Management
     "docker_run": docker_run,
     "docker_ps": docker_ps,
@@ -1405,10 +1831,12 @@ TOOL_CALL_MAP = {
     "docker_logs": docker_logs,
     "docker_exec": docker_exec,
     "docker_inspect": docker_inspect,
+    "docker_inspect_many": docker_inspect_many,
     
     # Image Management
     "docker_images": docker_images,
     "docker_pull": docker_pull,
+    "docker_pull_many": docker_pull_many,
     "docker_build": docker_build,
     "docker_push": docker_push,
     "docker_rmi": docker_rmi,
@@ -1441,4 +1869,4 @@ TOOL_CALL_MAP = {
     "docker_system_prune": docker_system_prune,
     "docker_container_prune": docker_container_prune,
     "docker_image_prune": docker_image_prune,
-}
+}.items()})
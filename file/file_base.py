@@ -0,0 +1,101 @@
+"""
+File base module - helpers shared by the file tools for replacing file contents.
+"""
+
+import os
+import stat
+import tempfile
+from typing import Any, Optional, Tuple
+
+# The process umask, read once at import; os.umask() can only be read by
+# setting it, which is not safe to do while other threads create files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _open_in_place(target: str, keep: int) -> Any:
+    """Open ``target`` for rewriting in place, positioned after its first ``keep`` bytes."""
+    if not keep:
+        return open(target, 'wb')
+    f = open(target, 'r+b')
+    f.seek(keep)
+    return f
+
+
+def _open_output(path: str, keep: int = 0) -> Tuple[Any, Optional[str]]:
+    """
+    Open a binary writer that will replace the contents of ``path``.
+
+    Returns ``(file, temp_path)``. When the file can be swapped in whole
+    (it is new, or an existing single-link file we own and may write), the
+    writer is a temp file in the same directory and the caller renames
+    ``temp_path`` over the target with os.replace(), so neither a crash nor
+    a concurrent reader ever sees a half-written file. Otherwise ``path``
+    is rewritten in place, keeping its owner and hard links, and
+    ``temp_path`` is None; the writer is then positioned after the first
+    ``keep`` bytes, which the caller knows are unchanged, and the caller
+    truncates the file once it is written. Raises the same errors open()
+    would.
+    """
+    target = os.path.realpath(path)
+    try:
+        st = os.stat(target)
+    except FileNotFoundError:
+        st = None
+    if st is not None and (
+        st.st_nlink > 1
+        or not os.access(target, os.W_OK)
+        or (hasattr(os, 'geteuid') and st.st_uid != os.geteuid())
+    ):
+        return _open_in_place(target, keep), None
+
+    # mkstemp creates a new, randomly named file (O_EXCL), so nothing
+    # planted in the directory can redirect the write
+    try:
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(target), prefix=f".{os.path.basename(target)}.", suffix=".tmp"
+        )
+    except PermissionError:
+        if st is None:
+            raise
+        # A writable file in a read-only directory can only be rewritten in place
+        return _open_in_place(target, keep), None
+    try:
+        # Keep the permissions of the file being replaced; a new file gets
+        # the mode open() would have given it rather than mkstemp's 0600
+        mode = stat.S_IMODE(st.st_mode) if st is not None else 0o666 & ~_UMASK
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, mode)
+        else:
+            os.chmod(temp_path, mode)
+        return open(fd, 'wb'), temp_path
+    except BaseException:
+        os.close(fd)
+        os.unlink(temp_path)
+        raise
+
+
+def _write_output(path: str, data: bytes, keep: int = 0) -> None:
+    """
+    Replace the contents of ``path`` with ``data`` through _open_output.
+
+    The temp file, if one was used, is renamed over the target once the
+    data is written, or removed if writing fails. A file rewritten in place
+    only has the bytes after its first ``keep`` written, so ``data`` must
+    start with those bytes of the current file. Raises the same errors
+    open() would.
+    """
+    f, temp_path = _open_output(path, keep)
+    try:
+        with f:
+            f.write(memoryview(data)[f.tell():])
+            f.truncate()
+        if temp_path:
+            os.replace(temp_path, os.path.realpath(path))
+    except BaseException:
+        if temp_path:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+        raise
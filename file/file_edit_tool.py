@@ -7,9 +7,14 @@ Based on analysis of Claude Code source: restored-src/src/tools/FileEditTool/typ
 
 import os
 import json
-import difflib
+import codecs
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 from base import function_ai, parameters_func, property_param
 
+from .file_base import _write_output
+
 # Property definitions for FileEditTool
 __FILE_PATH_PROPERTY__ = property_param(
     name="file_path",
@@ -46,6 +51,20 @@ __ENCODING_PROPERTY__ = property_param(
     required=False,
 )
 
+__DRY_RUN_PROPERTY__ = property_param(
+    name="dry_run",
+    description="Only count the occurrences that would be replaced, without writing the file (default false).",
+    t="boolean",
+    required=False,
+)
+
+__MAX_BYTES_PROPERTY__ = property_param(
+    name="max_bytes",
+    description="Refuse to edit files larger than this many bytes (default: 10MB).",
+    t="integer",
+    required=False,
+)
+
 # Function metadata
 __FILE_EDIT_FUNCTION__ = function_ai(
     name="edit",
@@ -56,11 +75,19 @@ __FILE_EDIT_FUNCTION__ = function_ai(
         __NEW_STRING_PROPERTY__,
         __REPLACE_ALL_PROPERTY__,
         __ENCODING_PROPERTY__,
+        __DRY_RUN_PROPERTY__,
+        __MAX_BYTES_PROPERTY__,
     ]),
 )
 
 tools = [__FILE_EDIT_FUNCTION__]
 
+# Default limit on the size of a file edit() will read
+_DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+# Files at least this large are checked for old_string on a mapping first
+_MMAP_SCAN_THRESHOLD = 1024 * 1024
+
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
@@ -71,6 +98,27 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
+def _absent_on_disk(file_path: str, needle: str, encoding: str, file_size: int) -> bool:
+    """
+    Cheaply prove that ``needle`` does not occur in a large UTF-8 file.
+    
+    UTF-8 is self-synchronizing, so a byte search over a mapping of the file
+    finds the encoded needle exactly where the decoded text contains it,
+    provided newline translation cannot touch it. Returns False whenever
+    that shortcut does not apply, leaving the decision to the full read.
+    """
+    if file_size < _MMAP_SCAN_THRESHOLD or '\n' in needle or '\r' in needle:
+        return False
+    try:
+        if codecs.lookup(encoding).name != 'utf-8':
+            return False
+        data = needle.encode('utf-8')
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(data) < 0
+    except (LookupError, UnicodeError, OSError, ValueError):
+        return False
+
+
 def generate_structured_patch(original_content: str, new_content: str):
     """
     Generate structured patch similar to Claude Code's structuredPatch format.
@@ -79,10 +127,16 @@ def generate_structured_patch(original_content: str, new_content: str):
     if original_content == new_content:
         return []
     
+    original_lines = original_content.splitlines(keepends=True)
+    new_lines = new_content.splitlines(keepends=True)
+    
+    # Only needed once a change has to be diffed, so imported here
+    import difflib
+    
     # Create unified diff
     diff = list(difflib.unified_diff(
-        original_content.splitlines(keepends=True),
-        new_content.splitlines(keepends=True),
+        original_lines,
+        new_lines,
         fromfile='original',
         tofile='new',
         lineterm='\n'
@@ -93,9 +147,6 @@ def generate_structured_patch(original_content: str, new_content: str):
     
     # Parse diff to create structured patch
     # This is a simplified version - Claude Code has more detailed parsing
-    original_lines = original_content.splitlines(keepends=True)
-    new_lines = new_content.splitlines(keepends=True)
-    
     # Create a simple hunk representation
     hunk = {
         "oldStart": 1,
@@ -109,7 +160,8 @@ def generate_structured_patch(original_content: str, new_content: str):
 
 
 def edit(file_path: str, old_string: str, new_string: str, 
-              replace_all: bool = False, encoding: str = "utf-8") -> str:
+              replace_all: bool = False, encoding: str = "utf-8",
+              dry_run: bool = False, max_bytes: int = _DEFAULT_MAX_BYTES) -> str:
     """
     Edit a file by replacing old_string with new_string.
     
@@ -128,6 +180,8 @@ def edit(file_path: str, old_string: str, new_string: str,
         new_string: The text to replace it with
         replace_all: Whether to replace all occurrences (default: False)
         encoding: File encoding (default: 'utf-8')
+        dry_run: Only count the occurrences, leaving the file untouched (default: False)
+        max_bytes: Largest file size, in bytes, that will be read (default: 10MB)
         
     Returns:
         JSON-formatted operation result matching Claude Code's FileEditOutput
@@ -195,7 +249,7 @@ def edit(file_path: str, old_string: str, new_string: str,
         
         # Check file size (warning for large files)
         file_size = os.path.getsize(normalized_path)
-        if file_size > 10 * 1024 * 1024:  # 10MB
+        if file_size > max_bytes:
             return json.dumps({
                 "warning": f"File is large ({format_file_size(file_size)}). Editing may be slow.",
                 "filePath": normalized_path,
@@ -205,25 +259,35 @@ def edit(file_path: str, old_string: str, new_string: str,
                 "suggestion": "Consider using a different approach for large files"
             }, indent=2)
         
-        # Read the file
-        try:
-            with open(normalized_path, 'r', encoding=encoding) as f:
-                original_content = f.read()
-        except UnicodeDecodeError:
-            return json.dumps({
-                "error": f"Encoding error with '{encoding}'. File may be binary or use different encoding.",
-                "filePath": normalized_path,
-                "success": False
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Cannot read file: {str(e)}",
-                "filePath": normalized_path,
-                "success": False
-            }, indent=2)
+        # A file with fewer bytes than old_string has characters cannot
+        # contain it, so it is not read at all
+        first_index = -1
+        if file_size >= len(old_string) and not _absent_on_disk(normalized_path, old_string, encoding, file_size):
+            # Read the file
+            try:
+                with open(normalized_path, 'rb') as f:
+                    raw = f.read()
+                original_content = raw.decode(encoding)
+                # Same newline translation as a text-mode read
+                if '\r' in original_content:
+                    original_content = original_content.replace('\r\n', '\n').replace('\r', '\n')
+            except UnicodeDecodeError:
+                return json.dumps({
+                    "error": f"Encoding error with '{encoding}'. File may be binary or use different encoding.",
+                    "filePath": normalized_path,
+                    "success": False
+                }, indent=2)
+            except Exception as e:
+                return json.dumps({
+                    "error": f"Cannot read file: {str(e)}",
+                    "filePath": normalized_path,
+                    "success": False
+                }, indent=2)
+            
+            first_index = original_content.find(old_string)
         
         # Check if old_string exists in the file
-        if old_string not in original_content:
+        if first_index < 0:
             return json.dumps({
                 "error": f"Old string not found in file: {normalized_path}",
                 "filePath": normalized_path,
@@ -232,30 +296,60 @@ def edit(file_path: str, old_string: str, new_string: str,
                 "suggestion": "Check for typos or different whitespace"
             }, indent=2)
         
-        # Count occurrences before replacement
-        occurrence_count = original_content.count(old_string)
+        if dry_run:
+            # Count only; neither the new content nor the file is produced
+            occurrence_count = original_content.count(old_string, first_index)
+            return json.dumps({
+                "filePath": normalized_path,
+                "oldString": old_string,
+                "newString": new_string,
+                "replaceAll": replace_all,
+                "_metadata": {
+                    "success": True,
+                    "dryRun": True,
+                    "fileName": os.path.basename(normalized_path),
+                    "originalLength": len(original_content),
+                    "occurrenceCount": occurrence_count,
+                    "replacementCount": occurrence_count if replace_all else 1,
+                    "encoding": encoding,
+                    "fileSize": file_size
+                }
+            }, indent=2)
         
-        # Perform replacement
+        # Perform replacement, counting occurrences without rescanning
+        # the content before the first one
         if replace_all:
             new_content = original_content.replace(old_string, new_string)
+            # Each replacement changes the length by the same amount
+            delta = len(new_string) - len(old_string)
+            if delta:
+                occurrence_count = (len(new_content) - len(original_content)) // delta
+            else:
+                occurrence_count = original_content.count(old_string, first_index)
             replacement_count = occurrence_count
         else:
-            # Replace only the first occurrence
-            new_content = original_content.replace(old_string, new_string, 1)
+            # Replace only the first occurrence, splicing at the known index
+            new_content = (original_content[:first_index] + new_string
+                           + original_content[first_index + len(old_string):])
+            occurrence_count = original_content.count(old_string, first_index)
             replacement_count = 1
         
-        # Check if replacement actually changed anything
-        if original_content == new_content:
-            return json.dumps({
-                "error": "Replacement did not change file content",
-                "filePath": normalized_path,
-                "success": False
-            }, indent=2)
+        # old_string differs from new_string and occurs at least once, so
+        # the content has changed without comparing it to the original
         
-        # Write the file
+        # Write the file through a temp file renamed over it. When it has
+        # to be rewritten in place instead (hard links, another owner, a
+        # read-only directory), everything before the first replacement is
+        # unchanged on disk and only the bytes from there on are written.
         try:
-            with open(normalized_path, 'w', encoding=encoding) as f:
-                f.write(new_content)
+            if os.linesep != '\n':
+                new_data = new_content.replace('\n', os.linesep).encode(encoding)
+            else:
+                new_data = new_content.encode(encoding)
+            head = len(original_content[:first_index].encode(encoding))
+            if not new_data.startswith(raw[:head]):
+                head = 0
+            _write_output(normalized_path, new_data, keep=head)
         except Exception as e:
             return json.dumps({
                 "error": f"Cannot write to file: {str(e)}",
@@ -298,6 +392,46 @@ def edit(file_path: str, old_string: str, new_string: str,
         }, indent=2)
 
 
+def edit_many(file_paths: List[str], old_string: str, new_string: str,
+              replace_all: bool = False, encoding: str = "utf-8",
+              max_workers: int = 8) -> str:
+    """
+    Apply the same replacement to several files concurrently.
+    
+    Each file goes through edit() on a thread pool, so reading and writing
+    one file overlaps with the others. Duplicate paths are edited once.
+    
+    Args:
+        file_paths: Absolute paths of the files to edit
+        old_string: The text to replace
+        new_string: The text to replace it with
+        replace_all: Whether to replace all occurrences in each file
+        encoding: File encoding (default: 'utf-8')
+        max_workers: Maximum number of files edited at once
+        
+    Returns:
+        JSON object with one edit() result per file under "results"
+        and the number of files changed under "editedCount"
+    """
+    paths = list(dict.fromkeys(file_paths or []))
+    if not paths:
+        return json.dumps({
+            "error": "No file paths given",
+            "success": False
+        }, indent=2)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+        results = list(executor.map(
+            lambda path: json.loads(edit(path, old_string, new_string, replace_all, encoding)),
+            paths
+        ))
+    
+    return json.dumps({
+        "results": results,
+        "editedCount": sum(1 for r in results if r.get("_metadata", {}).get("success")),
+    }, indent=2)
+
+
 # Tool call map for dispatching
 TOOL_CALL_MAP = {
     "edit": edit
@@ -7,8 +7,11 @@ Focuses on text file reading with Claude Code compatibility.
 
 import os
 import json
+import codecs
+import mmap
+import stat
 import sys
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 # AITools decorators
 from base import function_ai, parameters_func, property_param
@@ -60,6 +63,128 @@ __FILE_READ_FUNCTION__ = function_ai(
     ])
 )
 
+# Below this size one read() is cheaper than setting up a mapping
+_MMAP_THRESHOLD = 64 * 1024
+
+# Sequential scans read this much per syscall
+_COUNT_CHUNK_SIZE = 1024 * 1024
+
+
+def _skip_lines(buf: Union[bytes, mmap.mmap], pos: int, count: int) -> int:
+    """Return the offset just past ``count`` newlines from ``pos`` (EOF if fewer)."""
+    find = buf.find
+    for _ in range(count):
+        newline = find(b'\n', pos)
+        if newline < 0:
+            return len(buf)
+        pos = newline + 1
+    return pos
+
+
+def _skip_lines_universal(buf: Union[bytes, mmap.mmap], pos: int, count: int) -> int:
+    """
+    Like _skip_lines, but a line may also end in ``\r`` or ``\r\n``.
+    
+    These are the line endings text-mode reads recognise. The next position
+    of each byte is remembered, so neither is searched for more than once
+    per occurrence.
+    """
+    find = buf.find
+    size = len(buf)
+    next_lf = next_cr = -1
+    for _ in range(count):
+        if next_lf < pos:
+            next_lf = find(b'\n', pos)
+            if next_lf < 0:
+                next_lf = size
+        if next_cr < pos:
+            next_cr = find(b'\r', pos)
+            if next_cr < 0:
+                next_cr = size
+        end = min(next_lf, next_cr)
+        if end >= size:
+            return size
+        # A \r\n pair ends one line, not two
+        pos = end + 2 if end == next_cr and next_lf == end + 1 else end + 1
+    return pos
+
+
+def _line_range(buf: Union[bytes, mmap.mmap], offset: int, limit: int) -> Tuple[int, int]:
+    """Return the byte range of ``limit`` lines starting at 1-indexed ``offset``."""
+    # Files without a carriage return, by far the common case, split on \n alone
+    skip = _skip_lines_universal if buf.find(b'\r') >= 0 else _skip_lines
+    start = skip(buf, 0, offset - 1)
+    end = skip(buf, start, limit) if limit else len(buf)
+    return start, end
+
+
+def _decode_range(buf: Union[bytes, mmap.mmap], start: int, end: int) -> str:
+    """Decode ``buf[start:end]`` through a memoryview, without copying the slice first."""
+    with memoryview(buf) as view:
+        # Try UTF-8 encoding first, fallback to latin-1
+        try:
+            text = str(view[start:end], 'utf-8')
+        except UnicodeDecodeError:
+            text = str(view[start:end], 'latin-1')
+    
+    # Match the newline translation of text-mode reads
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _count_line_ends(chunk: bytes) -> int:
+    """Count the line endings in ``chunk``: \n, \r and \r\n (once)."""
+    count = chunk.count(b'\n')
+    if b'\r' in chunk:
+        count += chunk.count(b'\r') - chunk.count(b'\r\n')
+    return count
+
+
+def _total_lines(buf: Union[bytes, mmap.mmap]) -> int:
+    """Count the lines in ``buf``, including a final line without a newline."""
+    if isinstance(buf, bytes):
+        total = _count_line_ends(buf)
+    else:
+        # mmap has no count(); go through it in bounded slices
+        total = 0
+        after_cr = False
+        for pos in range(0, len(buf), _COUNT_CHUNK_SIZE):
+            chunk = buf[pos:pos + _COUNT_CHUNK_SIZE]
+            total += _count_line_ends(chunk)
+            # A \r\n split across two slices was counted as two endings
+            if after_cr and chunk[:1] == b'\n':
+                total -= 1
+            after_cr = chunk[-1:] == b'\r'
+    if buf[-1:] not in (b'', b'\n', b'\r'):
+        total += 1
+    return total
+
+
+def _read_lines(file_path: str, offset: int, limit: int) -> Tuple[str, int]:
+    """
+    Return the decoded line range and the file's total line count.
+    
+    Both come from the same buffer or mapping, so the file is opened and
+    scanned once. Only the selected slice is decoded.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            buf = f.read()
+            text = _decode_range(buf, *_line_range(buf, offset, limit))
+            total = _total_lines(buf)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Both scans walk the mapping front to back
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                text = _decode_range(mm, *_line_range(mm, offset, limit))
+                total = _total_lines(mm)
+    
+    # If offset is beyond total lines, this is an empty string
+    return text, total
+
+
 def _read(file_path: str, offset: int = 1, limit: int = 0, mode: str = "r") -> str:
     if mode not in ("r", "rb"):
         return f"Error: Invalid mode '{mode}'. Use 'r' or 'rb'."
@@ -73,41 +198,7 @@ def _read(file_path: str, offset: int = 1, limit: int = 0, mode: str = "r") -> s
         if mode == "rb":
             return "Error: Binary mode ('rb') not supported for line-based reading. Use text mode ('r')."
         
-        # Convert 1-indexed offset to 0-indexed for internal processing
-        offset_0 = offset - 1
-        
-        # Try UTF-8 encoding first, fallback to latin-1
-        lines = []
-        lines_collected = 0
-        current_line = 0
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if current_line >= offset_0:
-                        if limit == 0 or lines_collected < limit:
-                            lines.append(line)
-                            lines_collected += 1
-                        else:
-                            break
-                    current_line += 1
-        except UnicodeDecodeError:
-            # Fallback to latin-1 encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
-                for line in f:
-                    if current_line >= offset_0:
-                        if limit == 0 or lines_collected < limit:
-                            lines.append(line)
-                            lines_collected += 1
-                        else:
-                            break
-                    current_line += 1
-        
-        # If offset is beyond total lines, return empty string
-        if current_line <= offset_0 and lines_collected == 0:
-            return ""
-        
-        return ''.join(lines)
+        return _read_lines(file_path, offset, limit)[0]
         
     except Exception as e:
         return f"Error: Unexpected error when reading file: {str(e)}"
@@ -160,8 +251,10 @@ def read(
         # Normalize path
         normalized_path = os.path.normpath(file_path)
         
-        # Check if file exists
-        if not os.path.exists(normalized_path):
+        # One stat() answers existence, file type, size and mtime
+        try:
+            file_stat = os.stat(normalized_path)
+        except (FileNotFoundError, NotADirectoryError):
             suggestion = suggest_similar_file(normalized_path)
             return json.dumps({
                 "error": True,
@@ -172,7 +265,7 @@ def read(
             }, indent=2)
         
         # Check if it's a file
-        if not os.path.isfile(normalized_path):
+        if not stat.S_ISREG(file_stat.st_mode):
             return json.dumps({
                 "error": True,
                 "message": f"Path is not a file: {normalized_path}",
@@ -180,17 +273,8 @@ def read(
                 "error_code": 3
             }, indent=2)
         
-        # Check read permission
-        if not os.access(normalized_path, os.R_OK):
-            return json.dumps({
-                "error": True,
-                "message": f"No read permission for file: {normalized_path}",
-                "filePath": normalized_path,
-                "error_code": 4
-            }, indent=2)
-        
         # Check file size (warning for large files)
-        file_size = os.path.getsize(normalized_path)
+        file_size = file_stat.st_size
         size_formatted = format_file_size(file_size)
         
         # Warn for very large files
@@ -223,18 +307,10 @@ def read(
                 "error_code": 6
             }, indent=2)
         
-        # Try to read the file using AITools read function
+        # Read the requested range
         try:
-            # First, get total lines to calculate actual line ranges
-            total_lines = count_file_lines(normalized_path, encoding)
-            
-            # Use AITools read function
-            content = _read(
-                file_path=normalized_path,
-                offset=actual_offset,
-                limit=actual_limit,
-                mode="r"
-            )
+            # One pass yields the requested lines and the total line count
+            content, total_lines = _read_lines(normalized_path, actual_offset, actual_limit)
             
             # If content is empty and offset is beyond total lines
             if not content and actual_offset > total_lines:
@@ -250,8 +326,9 @@ def read(
             if content and content.endswith('\n'):
                 content = content.rstrip('\n')
             
-            # Calculate actual lines read
-            lines_read = len(content.splitlines()) if content else 0
+            # Calculate actual lines read (trailing newlines were stripped
+            # above, so this counts lines without building a list of them)
+            lines_read = content.count('\n') + 1 if content else 0
             actual_end_line = actual_offset + lines_read - 1 if lines_read > 0 else actual_offset
             
             # Build Claude Code compatible response
@@ -268,7 +345,7 @@ def read(
                     "fileSize": file_size,
                     "sizeFormatted": size_formatted,
                     "encoding": encoding,
-                    "modifiedTime": os.path.getmtime(normalized_path),
+                    "modifiedTime": file_stat.st_mtime,
                     "offset": actual_offset,
                     "limit": actual_limit if actual_limit > 0 else "end of file"
                 }
@@ -276,6 +353,15 @@ def read(
             
             return json.dumps(response, indent=2)
             
+        except PermissionError:
+            # Read permission is checked by opening the file rather than
+            # with a separate access() call
+            return json.dumps({
+                "error": True,
+                "message": f"No read permission for file: {normalized_path}",
+                "filePath": normalized_path,
+                "error_code": 4
+            }, indent=2)
         except UnicodeDecodeError:
             # Try with different encoding or return error
             return json.dumps({
@@ -299,6 +385,10 @@ def count_file_lines(file_path: str, encoding: str = "utf-8") -> int:
     """
     Count total lines in a file efficiently.
     
+    Line endings (\n, \r\n and a lone \r, as in text mode) are counted on
+    raw bytes read in large chunks, so nothing is decoded; only encodings whose newline is not a single byte fall back to
+    iterating decoded text.
+    
     Args:
         file_path: Path to the file
         encoding: File encoding
@@ -306,20 +396,29 @@ def count_file_lines(file_path: str, encoding: str = "utf-8") -> int:
     Returns:
         Total number of lines in the file
     """
-    try:
-        # Try UTF-8 first
+    if codecs.lookup(encoding).name.startswith(("utf-16", "utf-32")):
         with open(file_path, 'r', encoding=encoding) as f:
-            line_count = 0
-            for _ in f:
-                line_count += 1
-            return line_count
-    except UnicodeDecodeError:
-        # Try latin-1 as fallback
-        with open(file_path, 'r', encoding='latin-1') as f:
-            line_count = 0
-            for _ in f:
-                line_count += 1
-            return line_count
+            return sum(1 for _ in f)
+    
+    line_count = 0
+    last = b''
+    with open(file_path, 'rb') as f:
+        # Let the kernel widen readahead for the front-to-back scan
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while True:
+            chunk = f.read(_COUNT_CHUNK_SIZE)
+            if not chunk:
+                break
+            line_count += _count_line_ends(chunk)
+            # A \r\n split across two reads was counted as two endings
+            if last[-1:] == b'\r' and chunk[:1] == b'\n':
+                line_count -= 1
+            last = chunk
+    # A final line without a trailing newline still counts
+    if last and not last.endswith((b'\n', b'\r')):
+        line_count += 1
+    return line_count
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -371,9 +470,9 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
             "modified": stats.st_mtime,
             "created": stats.st_ctime,
             "accessed": stats.st_atime,
-            "isFile": os.path.isfile(file_path),
-            "isDir": os.path.isdir(file_path),
-            "exists": os.path.exists(file_path),
+            "isFile": stat.S_ISREG(stats.st_mode),
+            "isDir": stat.S_ISDIR(stats.st_mode),
+            "exists": True,
             "extension": os.path.splitext(file_path)[1],
             "permissions": {
                 "readable": os.access(file_path, os.R_OK),
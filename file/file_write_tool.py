@@ -7,13 +7,17 @@ Focuses on Claude Code compatibility with create/update distinction and simple d
 
 import os
 import json
-import difflib
+import itertools
+import re
 import sys
+import tempfile
 from typing import Dict, List, Any, Optional, Tuple
 
 # AITools decorators
 from base import function_ai, parameters_func, property_param
 
+from .file_base import _write_output
+
 # ============================================================================
 # PROPERTY DEFINITIONS (matching Claude Code's FileWriteTool interface)
 # ============================================================================
@@ -49,9 +53,42 @@ __FILE_WRITE_FUNCTION__ = function_ai(
 # MAIN FUNCTION IMPLEMENTATION
 # ============================================================================
 
+def _read_text(path: str) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Read a file once, returning its raw bytes and its text.
+    
+    The text is decoded as UTF-8 with a latin-1 fallback, and newlines are
+    normalized the same way text-mode ``open()`` does. The raw bytes let the
+    caller tell an unchanged file without reading it again. Returns
+    ``(None, None)`` if the file cannot be read.
+    """
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except Exception:
+        return None, None
+    
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        text = raw.decode('latin-1')
+    
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return raw, text
+
+
+def _count_lines(text: str) -> int:
+    """Count lines like ``len(text.splitlines())`` for newline-delimited text, without building the list."""
+    if not text:
+        return 0
+    return text.count('\n') + (not text.endswith('\n'))
+
+
 def write(
     file_path: str,
-    content: str
+    content: str,
+    max_diff_lines: int = 500
 ) -> str:
     """
     Write content to a file with Claude Code compatibility.
@@ -62,6 +99,7 @@ def write(
     Args:
         file_path: The absolute path to the file to write
         content: The content to write to the file
+        max_diff_lines: Maximum number of diff lines kept in structuredPatch
         
     Returns:
         JSON string matching Claude Code's format:
@@ -105,80 +143,76 @@ def write(
         operation_type = "create" if not file_exists else "update"
         
         # Read original content for update operations
-        original_content = None
-        if file_exists:
-            try:
-                with open(normalized_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-            except UnicodeDecodeError:
-                # Try latin-1 as fallback
-                try:
-                    with open(normalized_path, 'r', encoding='latin-1') as f:
-                        original_content = f.read()
-                except Exception as e:
-                    # If we can't read, treat as binary or inaccessible
-                    original_content = None
-            except Exception as e:
-                original_content = None
-        
-        # Check write permission
-        if file_exists and not os.access(normalized_path, os.W_OK):
-            return json.dumps({
-                "error": True,
-                "message": f"No write permission for file: {normalized_path}",
-                "filePath": normalized_path,
-                "error_code": 3
-            }, indent=2)
-        
-        # Check parent directory write permission
-        parent_dir = os.path.dirname(normalized_path)
-        if parent_dir and not os.path.exists(parent_dir):
-            # Try to create parent directory
-            try:
-                os.makedirs(parent_dir, exist_ok=True)
-            except Exception as e:
-                return json.dumps({
-                    "error": True,
-                    "message": f"Cannot create parent directory: {str(e)}",
-                    "parentDir": parent_dir,
-                    "error_code": 4
-                }, indent=2)
-        
-        if os.path.exists(parent_dir) and not os.access(parent_dir, os.W_OK):
-            return json.dumps({
-                "error": True,
-                "message": f"No write permission for directory: {parent_dir}",
-                "directory": parent_dir,
-                "error_code": 5
-            }, indent=2)
+        original_raw, original_content = _read_text(normalized_path) if file_exists else (None, None)
         
         # Write the file using AITools write function or direct write
         try:
-            # Use simple write for compatibility
-            with open(normalized_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Bytes as text-mode writing would produce them
+            data = (content if os.linesep == '\n' else content.replace('\n', os.linesep)).encode('utf-8')
+            
+            # Leave the file untouched when it already holds this content,
+            # compared against the bytes read above. Permissions and a
+            # missing parent directory are found out by open() itself
+            # rather than checked up front.
+            if original_raw != data:
+                parent_dir = os.path.dirname(normalized_path)
+                try:
+                    try:
+                        _write_output(normalized_path, data)
+                    except FileNotFoundError:
+                        # Create the missing parent directory, then retry once
+                        try:
+                            os.makedirs(parent_dir, exist_ok=True)
+                        except Exception as e:
+                            return json.dumps({
+                                "error": True,
+                                "message": f"Cannot create parent directory: {str(e)}",
+                                "parentDir": parent_dir,
+                                "error_code": 4
+                            }, indent=2)
+                        _write_output(normalized_path, data)
+                except PermissionError:
+                    if file_exists:
+                        return json.dumps({
+                            "error": True,
+                            "message": f"No write permission for file: {normalized_path}",
+                            "filePath": normalized_path,
+                            "error_code": 3
+                        }, indent=2)
+                    return json.dumps({
+                        "error": True,
+                        "message": f"No write permission for directory: {parent_dir}",
+                        "directory": parent_dir,
+                        "error_code": 5
+                    }, indent=2)
             
             # Calculate simple diff for structuredPatch
             structured_patch = []
             if original_content is not None and original_content != content:
-                # Create a simple diff
-                diff = list(difflib.unified_diff(
+                # Create a simple diff (difflib is only needed on this path)
+                import difflib
+                diff = difflib.unified_diff(
                     original_content.splitlines(keepends=True),
                     content.splitlines(keepends=True),
                     fromfile='original',
                     tofile='new',
                     lineterm='\n'
-                ))
+                )
                 
-                if diff:
+                # Skip header lines and stop consuming the diff at the cap
+                diff_lines = list(itertools.islice(diff, 2, 2 + max_diff_lines))
+                if next(diff, None) is not None:
+                    diff_lines.append(f"... (diff truncated after {max_diff_lines} lines)\n")
+                
+                if diff_lines:
                     # Create a simple hunk representation
                     # This is a simplified version of Claude Code's structuredPatch
                     hunk = {
                         "oldStart": 1,
-                        "oldLines": len(original_content.splitlines()),
+                        "oldLines": _count_lines(original_content),
                         "newStart": 1,
-                        "newLines": len(content.splitlines()),
-                        "lines": diff[2:] if len(diff) > 2 else diff  # Skip header lines
+                        "newLines": _count_lines(content),
+                        "lines": diff_lines
                     }
                     structured_patch.append(hunk)
             
@@ -217,6 +251,10 @@ def write(
         }, indent=2)
 
 
+# Unified diff hunk header, matched once per hunk
+_HUNK_HEADER_RE = re.compile(r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+
 def generate_simple_diff(original: str, new: str) -> List[Dict[str, Any]]:
     """
     Generate a simplified diff between original and new content.
@@ -234,6 +272,7 @@ def generate_simple_diff(original: str, new: str) -> List[Dict[str, Any]]:
     orig_lines = original.splitlines(keepends=True)
     new_lines = new.splitlines(keepends=True)
     
+    import difflib
     diff = list(difflib.unified_diff(orig_lines, new_lines, lineterm='\n'))
     
     if not diff:
@@ -251,8 +290,7 @@ def generate_simple_diff(original: str, new: str) -> List[Dict[str, Any]]:
             if current_hunk:
                 hunks.append(current_hunk)
             
-            import re
-            match = re.match(r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@', line)
+            match = _HUNK_HEADER_RE.match(line)
             if match:
                 old_start = int(match.group(1))
                 old_lines = int(match.group(2)) if match.group(2) else 1
@@ -14,6 +14,7 @@ Safety features added:
 """
 
 import os
+import re
 import fnmatch
 import json
 import time
@@ -77,6 +78,11 @@ def _safe_recursive_glob(pattern, search_dir, max_results, deadline):
     search_cancelled = False
     total_scanned = 0
     
+    # Compile the pattern once instead of going through fnmatch.fnmatch
+    # (normcase plus a cache lookup) for every entry; same semantics
+    normcase = os.path.normcase
+    matches = re.compile(fnmatch.translate(normcase(pattern))).match
+    
     def _scan(root_dir, depth=0):
         nonlocal timed_out, search_cancelled, total_scanned
         
@@ -124,7 +130,7 @@ def _safe_recursive_glob(pattern, search_dir, max_results, deadline):
                         continue
                     
                     # Check if this entry matches the pattern
-                    if fnmatch.fnmatch(rel, pattern):
+                    if matches(normcase(rel)):
                         all_files.append(entry.path)
                         if len(all_files) >= max_results:
                             return
@@ -19,10 +19,14 @@ Claude Code兼容的GrepTool简化实现。
 import os
 import re
 import json
+import codecs
+import mmap
 import time
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
+from fnmatch import fnmatch
+from functools import lru_cache
+from itertools import islice
 
 from base import function_ai, parameters_func, property_param
 
@@ -201,48 +205,105 @@ def _should_include_file(filepath: str, glob_pattern: Optional[str] = None) -> b
     if not glob_pattern:
         return True
     
-    # 简单的glob模式匹配（简化的实现）
+    return fnmatch(filepath, glob_pattern)
+
+# 出现这些字符的模式按正则处理，否则可视为字面量
+_REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
+
+# 小于该大小的文件直接读入做字节查找，更大的用mmap
+_MMAP_SCAN_THRESHOLD = 64 * 1024
+
+def _is_ascii_literal(pattern: str) -> bool:
+    """模式是否为不含正则元字符的纯ASCII字面量"""
+    return bool(pattern) and pattern.isascii() and _REGEX_METACHARS.isdisjoint(pattern)
+
+def _ascii_literal_needle(pattern: str, case_insensitive: bool) -> Optional[str]:
+    """大小写不敏感的纯ASCII字面量模式返回其小写形式，否则返回None"""
+    if case_insensitive and _is_ascii_literal(pattern):
+        return pattern.lower()
+    return None
+
+def _decodes_cleanly(buf) -> bool:
+    """buf能否按UTF-8严格解码；大文件分块增量解码，不一次性生成整段字符串"""
+    if isinstance(buf, bytes) and buf.isascii():
+        return True
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for start in range(0, len(buf), _MMAP_SCAN_THRESHOLD):
+            decoder.decode(buf[start:start + _MMAP_SCAN_THRESHOLD])
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+def _file_may_contain(filepath: str, needle: bytes) -> bool:
+    """在原始字节上查找needle；只有确定不存在时才返回False
+
+    搜索时按errors='ignore'解码，被丢弃的非法字节两侧可能拼出needle，
+    所以字节中找不到时还要确认文件能被严格解码，否则仍需完整搜索。
+    """
     try:
-        from fnmatch import fnmatch
-        return fnmatch(filepath, glob_pattern)
-    except ImportError:
-        # 如果fnmatch不可用，使用简单匹配
-        if "*" in glob_pattern:
-            # 简单通配符匹配
-            import re
-            pattern = glob_pattern.replace("*", ".*").replace("?", ".")
-            return bool(re.match(pattern, filepath))
-        return glob_pattern in filepath
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _MMAP_SCAN_THRESHOLD:
+                data = f.read()
+                return needle in data or not _decodes_cleanly(data)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(needle) >= 0 or not _decodes_cleanly(mm)
+    except (OSError, ValueError):
+        return True
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, case_insensitive: bool) -> "re.Pattern":
+    """编译搜索模式；re模块自身的缓存较小，在频繁调用中容易被挤出"""
+    return re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
 
 def _search_in_file(filepath: str, options: GrepOptions) -> FileMatches:
     """在单个文件中搜索"""
     matches = []
     
+    # 编译正则表达式（缓存，多文件搜索只编译一次）
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-    except (IOError, UnicodeDecodeError):
-        # 如果无法读取文件，返回空结果
-        return FileMatches(filepath=filepath, matches=[], match_count=0)
-    
-    # 编译正则表达式
-    re_flags = re.IGNORECASE if options.case_insensitive else 0
-    try:
-        pattern_re = re.compile(options.pattern, re_flags)
+        pattern_re = _compile_pattern(options.pattern, options.case_insensitive)
     except re.error:
         # 无效的正则表达式
         return FileMatches(filepath=filepath, matches=[], match_count=0)
     
-    # 搜索每一行
-    for line_num, line in enumerate(lines, 1):
-        for match in pattern_re.finditer(line):
-            matches.append(GrepMatch(
-                filepath=filepath,
-                line_num=line_num,
-                line_content=line.rstrip('\n'),
-                match_start=match.start(),
-                match_end=match.end()
-            ))
+    # 区分大小写的ASCII字面量先在原始字节上查找，不存在就不必解码整个文件；
+    # 文本模式会把\r\n和\r转换为\n，含换行符的模式与原始字节不对应，不做预筛
+    if (not options.case_insensitive and _is_ascii_literal(options.pattern)
+            and '\n' not in options.pattern and '\r' not in options.pattern
+            and not _file_may_contain(filepath, options.pattern.encode('ascii'))):
+        return FileMatches(filepath=filepath, matches=[], match_count=0)
+    
+    # IGNORECASE会关闭正则的字面量前缀快速查找；ASCII字面量在ASCII行上
+    # 改为对小写后的行做str.find，结果与finditer一致
+    needle = _ascii_literal_needle(options.pattern, options.case_insensitive)
+    
+    # 逐行流式搜索，不再用readlines()把整个文件读成行列表
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            for line_num, line in enumerate(f, 1):
+                if needle is not None and line.isascii():
+                    lowered = line.lower()
+                    spans = []
+                    pos = lowered.find(needle)
+                    while pos >= 0:
+                        spans.append((pos, pos + len(needle)))
+                        pos = lowered.find(needle, pos + len(needle))
+                else:
+                    spans = [match.span() for match in pattern_re.finditer(line)]
+                for match_start, match_end in spans:
+                    matches.append(GrepMatch(
+                        filepath=filepath,
+                        line_num=line_num,
+                        line_content=line.rstrip('\n'),
+                        match_start=match_start,
+                        match_end=match_end
+                    ))
+    except (IOError, UnicodeDecodeError):
+        # 如果无法读取文件，返回空结果
+        return FileMatches(filepath=filepath, matches=[], match_count=0)
     
     return FileMatches(filepath=filepath, matches=matches, match_count=len(matches))
 
@@ -259,18 +320,23 @@ def _get_context_lines(lines: List[str], line_num: int, context_before: int, con
 
 def _format_match_display(match: GrepMatch, context_before: int = 0, context_after: int = 0, show_line_numbers: bool = True) -> str:
     """格式化匹配行显示"""
-    try:
-        with open(match.filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-    except (IOError, UnicodeDecodeError):
-        # 如果无法重新读取文件，只显示匹配行
-        if show_line_numbers:
-            return f"{match.filepath}:{match.line_num}:{match.line_content}"
-        else:
-            return f"{match.filepath}:{match.line_content}"
-    
-    # 获取上下文行
-    context = _get_context_lines(lines, match.line_num, context_before, context_after)
+    if context_before == 0 and context_after == 0:
+        # 没有上下文时匹配行已保存在match中，无需重新打开并解码文件
+        context = [(match.line_num, match.line_content)]
+    else:
+        try:
+            # 只读到最后一行上下文为止，不解码文件其余部分
+            with open(match.filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                lines = list(islice(f, match.line_num + context_after))
+        except (IOError, UnicodeDecodeError):
+            # 如果无法重新读取文件，只显示匹配行
+            if show_line_numbers:
+                return f"{match.filepath}:{match.line_num}:{match.line_content}"
+            else:
+                return f"{match.filepath}:{match.line_content}"
+        
+        # 获取上下文行
+        context = _get_context_lines(lines, match.line_num, context_before, context_after)
     
     # 格式化输出
     result_lines = []
@@ -370,6 +436,17 @@ def grep(
     if A is not None:
         context_after = A
     
+    # 空模式会匹配每一行，相当于把整个目录树的内容全部输出，直接拒绝
+    if not pattern:
+        error_result = {
+            "error": "Pattern must be a non-empty string",
+            "mode": output_mode,
+            "numFiles": 0,
+            "filenames": [],
+            "content": "",
+        }
+        return json.dumps(error_result, ensure_ascii=False)
+
     # 验证路径
     if not os.path.exists(search_path):
         error_result = {
@@ -14,6 +14,8 @@ from datetime import datetime
 # AITools decorators - same pattern as other tools
 from base import function_ai, parameters_func, property_param
 
+from .file_base import _write_output
+
 __NOTEBOOK_EDIT_PROPERTY_ONE__ = property_param(
     name="action",
     description="Action to perform on the notebook: 'read', 'write', 'add_cell', 'remove_cell', 'update_cell', 'execute'.",
@@ -153,8 +155,7 @@ def write_notebook(filepath: str, content: str) -> str:
             return "Error: Invalid notebook structure"
         
         # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=2)
+        _save_notebook(filepath, notebook)
         
         return f"Successfully wrote notebook to: {filepath}\n" + format_notebook_info(notebook, filepath)
         
@@ -193,8 +194,7 @@ def add_cell(filepath: str, content: str, cell_type: str = "code") -> str:
         notebook["cells"].append(new_cell)
         
         # Save back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=2)
+        _save_notebook(filepath, notebook)
         
         cell_index = len(notebook["cells"]) - 1
         return f"Added {cell_type} cell at index {cell_index} to {filepath}"
@@ -225,8 +225,7 @@ def remove_cell(filepath: str, cell_index: int) -> str:
         cell_type = removed_cell.get("cell_type", "unknown")
         
         # Save back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=2)
+        _save_notebook(filepath, notebook)
         
         return f"Removed {cell_type} cell at index {cell_index} from {filepath}"
         
@@ -262,8 +261,7 @@ def update_cell(filepath: str, cell_index: int, content: str, cell_type: str = "
             cell["outputs"] = []
         
         # Save back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=2)
+        _save_notebook(filepath, notebook)
         
         return f"Updated cell at index {cell_index} to {cell_type} cell in {filepath}"
         
@@ -314,8 +312,7 @@ def execute_cell(filepath: str, cell_index: int, output: str = "") -> str:
             }]
         
         # Save back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(notebook, f, indent=2)
+        _save_notebook(filepath, notebook)
         
         return f"Simulated execution of code cell at index {cell_index} in {filepath}"
         
@@ -323,6 +320,19 @@ def execute_cell(filepath: str, cell_index: int, output: str = "") -> str:
         return f"Error executing cell: {str(e)}"
 
 
+def _save_notebook(filepath: str, notebook: Dict[str, Any]) -> None:
+    """
+    Replace ``filepath`` with the serialized notebook.
+    
+    Saved through the file tools' shared _write_output: the JSON goes to a
+    randomly named temp file in the same directory that is renamed over
+    the target, so an interrupted save never leaves a truncated notebook.
+    Hard-linked notebooks, notebooks owned by another user and notebooks
+    in a read-only directory are rewritten in place instead.
+    """
+    _write_output(filepath, json.dumps(notebook, indent=2).encode('utf-8'))
+
+
 def create_empty_notebook() -> Dict[str, Any]:
     """
     Create an empty Jupyter notebook structure.
@@ -4,6 +4,13 @@ import os
 import subprocess
 import sys
 import re
+import time
+import shutil
+import atexit
+import selectors
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Module metadata
 __module_metadata__ = {
@@ -99,6 +106,24 @@ __GIT_PROPERTY_14__ = property_param(
     t="string"
 )
 
+__GIT_PROPERTY_15__ = property_param(
+    name="defer",
+    description="Queue the files and add them together with other deferred adds in one git call.",
+    t="boolean"
+)
+
+__GIT_PROPERTY_16__ = property_param(
+    name="calls",
+    description="The git tool calls to run, each an object {\"name\": \"git_status\", \"args\": {...}}.",
+    t="array"
+)
+
+__GIT_PROPERTY_17__ = property_param(
+    name="max_workers",
+    description="Maximum number of git commands running at once (default: 8).",
+    t="integer"
+)
+
 __GIT_STATUS_FUNCTION__ = function_ai(name="git_status",
                                       description="Show the working tree status.",
                                       parameters=parameters_func([__GIT_PROPERTY_ONE__]))
@@ -133,7 +158,11 @@ __GIT_COMMIT_FUNCTION__ = function_ai(name="git_commit",
 
 __GIT_ADD_FUNCTION__ = function_ai(name="git_add",
                                    description="Add file contents to the index.",
-                                   parameters=parameters_func([__GIT_PROPERTY_ONE__, __GIT_PROPERTY_5__, __GIT_PROPERTY_10__, __GIT_PROPERTY_6__]))
+                                   parameters=parameters_func([__GIT_PROPERTY_ONE__, __GIT_PROPERTY_5__, __GIT_PROPERTY_10__, __GIT_PROPERTY_6__, __GIT_PROPERTY_15__]))
+
+__GIT_ADD_FLUSH_FUNCTION__ = function_ai(name="git_add_flush",
+                                         description="Add all files queued by deferred git_add calls to the index now.",
+                                         parameters=parameters_func([__GIT_PROPERTY_ONE__]))
 
 __GIT_CHECKOUT_FUNCTION__ = function_ai(name="git_checkout",
                                         description="Switch branches or restore working tree files.",
@@ -175,10 +204,22 @@ __GIT_CONFIG_FUNCTION__ = function_ai(name="git_config",
                                       description="Get or set git configuration.",
                                       parameters=parameters_func([__GIT_PROPERTY_ONE__, __GIT_PROPERTY_13__, __GIT_PROPERTY_14__]))
 
+__GIT_SHOW_FILE_FUNCTION__ = function_ai(name="git_show_file",
+                                         description="Show the contents of a file as of a given commit (default: HEAD).",
+                                         parameters=parameters_func([__GIT_PROPERTY_ONE__, __GIT_PROPERTY_8__, __GIT_PROPERTY_6__]))
+
 __GIT_INIT_FUNCTION__ = function_ai(name="git_init",
                                    description="Initialize a new git repository.",
                                    parameters=parameters_func([__GIT_PROPERTY_ONE__]))
 
+__GIT_BOOTSTRAP_FUNCTION__ = function_ai(name="git_bootstrap",
+                                         description="Initialize a repository, optionally on a named branch and with an origin remote, and commit everything in it, all in one call.",
+                                         parameters=parameters_func([__GIT_PROPERTY_ONE__, __GIT_PROPERTY_11__, __GIT_PROPERTY_TWO__, __GIT_PROPERTY_THREE__]))
+
+__GIT_BATCH_FUNCTION__ = function_ai(name="git_batch",
+                                     description="Run several git tool calls concurrently, e.g. git_status over many repositories, returning each call's output in order.",
+                                     parameters=parameters_func([__GIT_PROPERTY_16__, __GIT_PROPERTY_17__]))
+
 tools = [
     __GIT_STATUS_FUNCTION__,
     __GIT_LOG_FUNCTION__,
@@ -189,6 +230,7 @@ tools = [
     __GIT_PUSH_FUNCTION__,
     __GIT_COMMIT_FUNCTION__,
     __GIT_ADD_FUNCTION__,
+    __GIT_ADD_FLUSH_FUNCTION__,
     __GIT_CHECKOUT_FUNCTION__,
     __GIT_FETCH_FUNCTION__,
     __GIT_MERGE_FUNCTION__,
@@ -197,46 +239,157 @@ tools = [
     __GIT_RESET_FUNCTION__,
     __GIT_STASH_FUNCTION__,
     __GIT_SHOW_FUNCTION__,
+    __GIT_SHOW_FILE_FUNCTION__,
     __GIT_REBASE_FUNCTION__,
     __GIT_INIT_FUNCTION__,
+    __GIT_BOOTSTRAP_FUNCTION__,
+    __GIT_BATCH_FUNCTION__,
     __GIT_CONFIG_FUNCTION__
 ]
 
-def _run_git_command(repo_path, args, timeout=30):
+# Whether git is on PATH is looked up once, not with a `git --version` per
+# command; a negative answer is re-checked after _GIT_PROBE_RETRY seconds
+# in case git gets installed.
+_GIT_BIN = None
+_GIT_PROBE_TIME = float('-inf')
+_GIT_PROBE_RETRY = 30.0
+_GIT_PROBE_LOCK = threading.Lock()
+
+def _git_binary():
+    """Return the path of the git executable, or None if it is not on PATH."""
+    global _GIT_BIN, _GIT_PROBE_TIME
+    
+    if _GIT_BIN is None and time.monotonic() - _GIT_PROBE_TIME >= _GIT_PROBE_RETRY:
+        with _GIT_PROBE_LOCK:
+            if _GIT_BIN is None and time.monotonic() - _GIT_PROBE_TIME >= _GIT_PROBE_RETRY:
+                _GIT_BIN = shutil.which('git')
+                _GIT_PROBE_TIME = time.monotonic()
+    return _GIT_BIN
+
+def _repo_cwd(repo_path):
+    """Return the directory git runs in for ``repo_path``."""
+    if repo_path and os.path.exists(repo_path):
+        return repo_path
+    return os.getcwd()
+
+# Deferred git_add calls collect their files per repository and are added by a
+# single `git add` once _ADD_FLUSH_DELAY seconds pass without another one, or
+# earlier when any other git command runs in that repository. A failed flush
+# is reported by (and fails) the next git command there, so e.g. a commit
+# never goes ahead with only part of the queued files staged.
+_ADD_FLUSH_DELAY = 0.05
+_PENDING_ADDS = {}
+_PENDING_ADDS_LOCK = threading.Lock()
+
+class _PendingAdds:
+    """Files queued for one repository's next `git add`."""
+    
+    def __init__(self, cwd):
+        self.cwd = cwd
+        self.files = {}
+        self.timer = None
+        self.result = None
+        self.error = None
+        self.lock = threading.Lock()
+
+def _pending_adds(cwd, create=False):
+    """Return the pending adds for ``cwd`` (None if there are none and not ``create``)."""
+    key = os.path.realpath(cwd)
+    pending = _PENDING_ADDS.get(key)
+    if pending is None and create:
+        with _PENDING_ADDS_LOCK:
+            pending = _PENDING_ADDS.setdefault(key, _PendingAdds(key))
+    return pending
+
+def _is_git_error(output):
+    """Whether a tool output string reports a failure."""
+    return output.startswith(("Error:", "Git command failed:"))
+
+def _flush_pending_adds(pending):
+    """Run one `git add` for everything queued, returning its output (None if nothing was queued)."""
+    # The lock is held while git runs, so a command that flushes first
+    # waits for an add already in progress
+    with pending.lock:
+        if pending.timer is not None:
+            pending.timer.cancel()
+            pending.timer = None
+        if not pending.files:
+            return None
+        files = list(pending.files)
+        pending.files.clear()
+        result = _run_git_command(pending.cwd, ['add', '--'] + files, flush_adds=False)
+        if _is_git_error(result) and len(files) > 1:
+            # One bad pathspec makes git add nothing at all; add the files
+            # one by one so the others are still staged
+            errors = []
+            for name in files:
+                output = _run_git_command(pending.cwd, ['add', '--', name], flush_adds=False)
+                if _is_git_error(output):
+                    errors.append(output)
+            result = "\n".join(errors) if errors else "Command executed successfully (no output)"
+        pending.result = result
+        if _is_git_error(result):
+            pending.error = result
+        return result
+
+def _take_add_error(pending):
+    """Return and clear the error of a deferred add nobody has reported yet."""
+    with pending.lock:
+        error, pending.error = pending.error, None
+        return error
+
+def _flush_all_pending_adds():
+    """Add files still queued when the interpreter exits."""
+    for pending in list(_PENDING_ADDS.values()):
+        _flush_pending_adds(pending)
+
+atexit.register(_flush_all_pending_adds)
+
+def _format_git_result(result, cwd):
+    """Turn a finished git process into the tools' output/error string."""
+    output = result.stdout.strip()
+    error = result.stderr.strip()
+    
+    if result.returncode != 0:
+        if "not a git repository" in error.lower():
+            return f"Error: Not a git repository: {cwd}"
+        elif "permission denied" in error.lower():
+            return f"Error: Permission denied: {error}"
+        else:
+            return f"Git command failed: {error}"
+    
+    return output if output else "Command executed successfully (no output)"
+
+def _run_git_command(repo_path, args, timeout=30, flush_adds=True):
     """Internal helper function to run git commands."""
     try:
-        if repo_path and os.path.exists(repo_path):
-            cwd = repo_path
-        else:
-            cwd = os.getcwd()
+        cwd = _repo_cwd(repo_path)
+        
+        # Queued adds go first so this command sees them in the index; if
+        # they failed, this command reports that instead of running
+        if flush_adds and _PENDING_ADDS:
+            pending = _pending_adds(cwd)
+            if pending is not None:
+                _flush_pending_adds(pending)
+                error = _take_add_error(pending)
+                if error is not None:
+                    return f"Error: Deferred git add failed, command not run:\n{error}"
         
         # Check if git is available
-        try:
-            subprocess.run(['git', '--version'], capture_output=True, check=True, timeout=5)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        git_bin = _git_binary()
+        if git_bin is None:
             return "Error: Git is not installed or not in PATH"
         
         # Run git command
         result = subprocess.run(
-            ['git'] + args,
+            [git_bin] + args,
             cwd=cwd,
             capture_output=True,
             text=True,
             timeout=timeout
         )
         
-        output = result.stdout.strip()
-        error = result.stderr.strip()
-        
-        if result.returncode != 0:
-            if "not a git repository" in error.lower():
-                return f"Error: Not a git repository: {cwd}"
-            elif "permission denied" in error.lower():
-                return f"Error: Permission denied: {error}"
-            else:
-                return f"Git command failed: {error}"
-        
-        return output if output else "Command executed successfully (no output)"
+        return _format_git_result(result, cwd)
     
     except subprocess.TimeoutExpired:
         return f"Error: Git command timed out after {timeout} seconds"
@@ -245,6 +398,163 @@ def _run_git_command(repo_path, args, timeout=30):
     except Exception as e:
         return f"Error: Unexpected error executing git command: {str(e)}"
 
+# File contents at a revision are served by one long-lived `git cat-file --batch`
+# per repository, so repeated reads skip the fork/exec of a git process each.
+# Sessions beyond the _CAT_FILE_MAX_SESSIONS most recently used are closed,
+# and a timer checking every _CAT_FILE_IDLE_TIMEOUT seconds (while any
+# session is open) closes those idle for longer. A session that sends
+# nothing for _CAT_FILE_READ_TIMEOUT seconds is given up on.
+_CAT_FILE_MAX_SESSIONS = 8
+_CAT_FILE_IDLE_TIMEOUT = 60.0
+_CAT_FILE_READ_TIMEOUT = 10.0
+_CAT_FILE_READ_SIZE = 64 * 1024
+_CAT_FILE_SESSIONS = OrderedDict()
+_CAT_FILE_LOCK = threading.Lock()
+_CAT_FILE_REAPER = None
+
+class _CatFileSession:
+    """A `git cat-file --batch` process bound to one repository."""
+    
+    def __init__(self, git_bin, cwd):
+        self.process = subprocess.Popen([git_bin, 'cat-file', '--batch'], cwd=cwd,
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, bufsize=0)
+        self.fd = self.process.stdout.fileno()
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ)
+        self.buffer = bytearray()
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+    
+    def alive(self):
+        return self.process.poll() is None
+    
+    def close(self):
+        if self.alive():
+            self.process.kill()
+            self.process.wait()
+        self.selector.close()
+    
+    def _fill(self, size):
+        # Wait for output with a timeout rather than blocking in read(), so a
+        # hung git cannot hold the session lock forever
+        if not self.selector.select(_CAT_FILE_READ_TIMEOUT):
+            raise TimeoutError("git cat-file did not answer in time")
+        chunk = os.read(self.fd, max(size, _CAT_FILE_READ_SIZE))
+        if not chunk:
+            raise EOFError("git cat-file exited")
+        self.buffer += chunk
+    
+    def _read_exactly(self, size):
+        while len(self.buffer) < size:
+            self._fill(size - len(self.buffer))
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+    
+    def _read_header(self):
+        end = self.buffer.find(b'\n')
+        while end < 0:
+            searched = len(self.buffer)
+            self._fill(0)
+            end = self.buffer.find(b'\n', searched)
+        header = self.buffer[:end].decode('utf-8', 'replace')
+        del self.buffer[:end + 1]
+        return header
+    
+    def get(self, name):
+        """
+        Return ``(type, data)`` for object ``name``, or None if it does not exist.
+        
+        Raises OSError (including TimeoutError) or EOFError when the process
+        is unusable.
+        """
+        with self.lock:
+            self.last_used = time.monotonic()
+            self.process.stdin.write(name.encode('utf-8') + b'\n')
+            header = self._read_header()
+            fields = header.split(' ')
+            # "<name> missing" / "<name> ambiguous" carry no payload
+            if len(fields) != 3 or not fields[2].isdigit():
+                return None
+            data = self._read_exactly(int(fields[2]) + 1)
+            return fields[1], data[:-1]
+
+def _schedule_cat_file_reaper():
+    """Start the idle-session timer if sessions are open; call with _CAT_FILE_LOCK held."""
+    global _CAT_FILE_REAPER
+    if _CAT_FILE_REAPER is None and _CAT_FILE_SESSIONS:
+        _CAT_FILE_REAPER = threading.Timer(_CAT_FILE_IDLE_TIMEOUT, _reap_cat_file_sessions)
+        _CAT_FILE_REAPER.daemon = True
+        _CAT_FILE_REAPER.start()
+
+def _reap_cat_file_sessions():
+    """Close sessions idle for over _CAT_FILE_IDLE_TIMEOUT seconds, skipping busy ones."""
+    global _CAT_FILE_REAPER
+    now = time.monotonic()
+    idle = []
+    with _CAT_FILE_LOCK:
+        _CAT_FILE_REAPER = None
+        for key, session in list(_CAT_FILE_SESSIONS.items()):
+            if now - session.last_used > _CAT_FILE_IDLE_TIMEOUT and session.lock.acquire(blocking=False):
+                del _CAT_FILE_SESSIONS[key]
+                idle.append(session)
+        _schedule_cat_file_reaper()
+    for session in idle:
+        try:
+            session.close()
+        finally:
+            session.lock.release()
+
+def _close_cat_file_sessions():
+    """Stop every cat-file process at interpreter exit."""
+    global _CAT_FILE_REAPER
+    with _CAT_FILE_LOCK:
+        sessions = list(_CAT_FILE_SESSIONS.values())
+        _CAT_FILE_SESSIONS.clear()
+        if _CAT_FILE_REAPER is not None:
+            _CAT_FILE_REAPER.cancel()
+            _CAT_FILE_REAPER = None
+    for session in sessions:
+        session.close()
+
+atexit.register(_close_cat_file_sessions)
+
+def _cat_file_session(cwd):
+    """Return the live cat-file session for ``cwd``, starting one if needed."""
+    git_bin = _git_binary()
+    if git_bin is None:
+        raise FileNotFoundError("git is not on PATH")
+    key = os.path.realpath(cwd)
+    with _CAT_FILE_LOCK:
+        session = _CAT_FILE_SESSIONS.get(key)
+        if session is not None and session.alive():
+            # Counts as use already, so the reaper leaves it to the caller
+            session.last_used = time.monotonic()
+            _CAT_FILE_SESSIONS.move_to_end(key)
+            return session
+        
+        session = _CatFileSession(git_bin, key)
+        _CAT_FILE_SESSIONS[key] = session
+        while len(_CAT_FILE_SESSIONS) > _CAT_FILE_MAX_SESSIONS:
+            _, oldest = _CAT_FILE_SESSIONS.popitem(last=False)
+            oldest.close()
+        _schedule_cat_file_reaper()
+        return session
+
+def _drop_cat_file_session(session):
+    """Forget a session that failed, so the next call starts a fresh one."""
+    with _CAT_FILE_LOCK:
+        for key, other in list(_CAT_FILE_SESSIONS.items()):
+            if other is session:
+                del _CAT_FILE_SESSIONS[key]
+    session.close()
+
+# Global options for commands that only inspect the working tree: skip the
+# optional index refresh write (and its index.lock), and stat files in
+# parallel on git versions where preloading is not already the default
+_INSPECT_OPTIONS = ['--no-optional-locks', '-c', 'core.preloadindex=true']
+
 def git_status(repo_path: str = None) -> str:
     '''
     Show the working tree status.
@@ -254,7 +564,7 @@ def git_status(repo_path: str = None) -> str:
     :return: Git status output
     :rtype: str
     '''
-    return _run_git_command(repo_path, ['status'])
+    return _run_git_command(repo_path, _INSPECT_OPTIONS + ['status'])
 
 def git_log(repo_path: str = None, commit_hash: str = None) -> str:
     '''
@@ -285,7 +595,7 @@ def git_diff(repo_path: str = None, file: str = None, commit_hash: str = None) -
     :return: Git diff output
     :rtype: str
     '''
-    args = ['diff']
+    args = _INSPECT_OPTIONS + ['diff']
     if commit_hash:
         args.append(commit_hash)
     if file:
@@ -401,10 +711,17 @@ def git_commit(repo_path: str = None, message: str = "", all: bool = False) -> s
     args.extend(['-m', message])
     return _run_git_command(repo_path, args)
 
-def git_add(repo_path: str = None, files: list = None, all: bool = False, file: str = None) -> str:
+def git_add(repo_path: str = None, files: list = None, all: bool = False, file: str = None,
+            defer: bool = False) -> str:
     '''
     Add file contents to the index.
     
+    With ``defer`` the files are queued instead, and every file queued for
+    the repository is added by one ``git add`` shortly afterwards, when
+    git_add_flush is called, or before the next git command there runs.
+    If that add fails, the next command returns the failure instead of
+    running.
+    
     :param repo_path: Path to git repository
     :type repo_path: str
     :param files: List of files to add
@@ -413,6 +730,8 @@ def git_add(repo_path: str = None, files: list = None, all: bool = False, file:
     :type all: bool
     :param file: Single file to add
     :type file: str
+    :param defer: Queue the files for a batched add
+    :type defer: bool
     :return: Add operation output
     :rtype: str
     '''
@@ -420,15 +739,47 @@ def git_add(repo_path: str = None, files: list = None, all: bool = False, file:
     if all:
         args.append('.')
     elif file:
-        args.append(file)
+        args.extend(['--', file])
     elif files:
-        for f in files:
-            args.append(f)
+        args.append('--')
+        args.extend(files)
     else:
         return "Error: No files specified for git add"
     
+    if defer and not all:
+        pending = _pending_adds(_repo_cwd(repo_path), create=True)
+        with pending.lock:
+            pending.files.update(dict.fromkeys(args[2:]))
+            if pending.timer is not None:
+                pending.timer.cancel()
+            pending.timer = threading.Timer(_ADD_FLUSH_DELAY, _flush_pending_adds, args=(pending,))
+            pending.timer.daemon = True
+            pending.timer.start()
+            return f"Queued {len(pending.files)} file(s) for git add"
+    
     return _run_git_command(repo_path, args)
 
+def git_add_flush(repo_path: str = None) -> str:
+    '''
+    Add all files queued by deferred git_add calls to the index now.
+    
+    :param repo_path: Path to git repository
+    :type repo_path: str
+    :return: Add operation output, or that of the last batched add if the
+             queue was already flushed; files that could not be added are
+             reported, the others are still staged
+    :rtype: str
+    '''
+    pending = _pending_adds(_repo_cwd(repo_path))
+    if pending is None:
+        return "No deferred git add to flush"
+    result = _flush_pending_adds(pending)
+    # The failure is reported here, so later commands are not failed for it
+    error = _take_add_error(pending)
+    if result is None:
+        result = error or pending.result or "No deferred git add to flush"
+    return result
+
 def git_checkout(repo_path: str = None, branch: str = None, file: str = None, force: bool = False) -> str:
     '''
     Switch branches or restore working tree files.
@@ -604,6 +955,47 @@ def git_show(repo_path: str = None, commit_hash: str = None, file: str = None) -
     
     return _run_git_command(repo_path, args)
 
+def git_show_file(repo_path: str = None, commit_hash: str = None, file: str = None) -> str:
+    '''
+    Show the contents of a file as of a given commit.
+    
+    Blobs are read through the repository's persistent ``git cat-file
+    --batch`` process; anything else (directories, failures, a process that
+    stops answering) and every read on Windows goes through
+    ``git show <commit>:<file>``.
+    
+    :param repo_path: Path to git repository
+    :type repo_path: str
+    :param commit_hash: Commit to read the file from (default: HEAD)
+    :type commit_hash: str
+    :param file: Path of the file relative to the repository root
+    :type file: str
+    :return: File contents
+    :rtype: str
+    '''
+    if not file:
+        return "Error: File is required for git_show_file"
+    
+    name = f"{commit_hash or 'HEAD'}:{file}"
+    # Session reads wait on the pipe with select(), which Windows only
+    # supports for sockets
+    if '\n' not in name and os.name != 'nt':
+        cwd = _repo_cwd(repo_path)
+        session = None
+        try:
+            session = _cat_file_session(cwd)
+            obj = session.get(name)
+        except (OSError, EOFError):
+            if session is not None:
+                _drop_cat_file_session(session)
+            obj = None
+        if obj is not None and obj[0] == 'blob':
+            output = obj[1].decode('utf-8', 'replace').strip()
+            return output if output else "Command executed successfully (no output)"
+    
+    # Missing objects, trees and unusable sessions get git's own output/errors
+    return _run_git_command(repo_path, ['show', name])
+
 def git_rebase(repo_path: str = None, branch: str = None, force: bool = False) -> str:
     '''
     Reapply commits on top of another base tip.
@@ -638,6 +1030,66 @@ def git_init(repo_path: str = None) -> str:
     '''
     return _run_git_command(repo_path, ['init'])
 
+def git_bootstrap(repo_path: str = None, url: str = None, branch: str = None,
+                  message: str = "Initial commit") -> str:
+    '''
+    Initialize a repository and make its first commit in one call.
+    
+    Runs ``git init -b <branch>``, ``git remote add origin <url>``, ``git
+    add -A`` and ``git commit`` in turn, stopping at the first step that
+    fails, instead of one git tool call per step. Branch and remote are
+    skipped when not given; the directory is created if needed. Running it
+    again after a failed step is safe: an existing origin gets its URL set.
+    
+    :param repo_path: Directory to initialize
+    :type repo_path: str
+    :param url: URL to add as the origin remote
+    :type url: str
+    :param branch: Branch to create the first commit on
+    :type branch: str
+    :param message: Commit message
+    :type message: str
+    :return: Output of the commit, or of the first step that failed
+    :rtype: str
+    '''
+    if not repo_path:
+        return "Error: repo_path is required for git_bootstrap"
+    if not message:
+        return "Error: Commit message is required"
+    
+    if _git_binary() is None:
+        return "Error: Git is not installed or not in PATH"
+    
+    try:
+        os.makedirs(repo_path, exist_ok=True)
+    except PermissionError as e:
+        return f"Error: Permission error: {str(e)}"
+    except OSError as e:
+        return f"Error: Cannot create directory {repo_path}: {str(e)}"
+    
+    # Arguments go straight to git, never through a shell
+    output = _run_git_command(repo_path, ['init', '-q', *(('-b', branch) if branch else ())], timeout=60)
+    if branch and "unknown switch" in output:
+        # git before 2.28 has no init -b; name the unborn branch afterwards
+        output = _run_git_command(repo_path, ['init', '-q'], timeout=60)
+        if not _is_git_error(output):
+            output = _run_git_command(repo_path, ['checkout', '-q', '-b', branch], timeout=60)
+    if _is_git_error(output):
+        return output
+    
+    if url:
+        output = _run_git_command(repo_path, ['remote', 'add', 'origin', url], timeout=60)
+        if "already exists" in output:
+            output = _run_git_command(repo_path, ['remote', 'set-url', 'origin', url], timeout=60)
+        if _is_git_error(output):
+            return output
+    
+    for step in (['add', '-A'], ['commit', '--allow-empty', '-m', message]):
+        output = _run_git_command(repo_path, step, timeout=60)
+        if _is_git_error(output):
+            return output
+    return output
+
 def git_config(repo_path: str = None, key: str = None, value: str = None) -> str:
     '''
     Get or set git configuration.
@@ -666,6 +1118,57 @@ def git_config(repo_path: str = None, key: str = None, value: str = None) -> str
     except Exception as e:
         return f"Error in git_config: {str(e)}"
 
+# Tools that only read a repository; git_batch runs any other tool under a
+# per-repository lock so concurrent writers don't collide on .git/index.lock
+_READ_ONLY_TOOLS = frozenset({
+    "git_status", "git_log", "git_diff", "git_show", "git_show_file",
+})
+_REPO_WRITE_LOCKS = {}
+_REPO_WRITE_LOCKS_LOCK = threading.Lock()
+
+def _repo_write_lock(repo_path):
+    """Return the lock serializing git_batch writers in ``repo_path``."""
+    key = os.path.realpath(_repo_cwd(repo_path))
+    with _REPO_WRITE_LOCKS_LOCK:
+        return _REPO_WRITE_LOCKS.setdefault(key, threading.Lock())
+
+def _run_batch_call(call):
+    """Run one ``{"name": ..., "args": {...}}`` entry of git_batch."""
+    name = call.get("name")
+    args = call.get("args") or {}
+    # A nested batch would take the write lock its own calls then wait for
+    function = TOOL_CALL_MAP.get(name) if name != "git_batch" else None
+    if function is None:
+        return f"Error: Unknown git tool: {name}"
+    try:
+        if name in _READ_ONLY_TOOLS:
+            return function(**args)
+        with _repo_write_lock(args.get("repo_path")):
+            return function(**args)
+    except TypeError as e:
+        return f"Error: Invalid arguments for {name}: {str(e)}"
+
+def git_batch(calls: list, max_workers: int = 8) -> list:
+    '''
+    Run several git tool calls concurrently, e.g. git_status over many repos.
+    
+    Read-only calls run freely in parallel; calls that change a repository
+    run one at a time per repository, in no particular order, so callers
+    needing ordered writes to one repository should make separate calls.
+    
+    :param calls: Entries of the form ``{"name": "git_status", "args": {...}}``
+    :type calls: list
+    :param max_workers: Maximum number of git commands running at once
+    :type max_workers: int
+    :return: Output of each call, in the order given
+    :rtype: list
+    '''
+    if not calls:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls)))) as executor:
+        return list(executor.map(_run_batch_call, calls))
+
 TOOL_CALL_MAP = {
     "git_status": git_status,
     "git_log": git_log,
@@ -676,6 +1179,7 @@ TOOL_CALL_MAP = {
     "git_push": git_push,
     "git_commit": git_commit,
     "git_add": git_add,
+    "git_add_flush": git_add_flush,
     "git_checkout": git_checkout,
     "git_fetch": git_fetch,
     "git_merge": git_merge,
@@ -684,7 +1188,10 @@ TOOL_CALL_MAP = {
     "git_reset": git_reset,
     "git_stash": git_stash,
     "git_show": git_show,
+    "git_show_file": git_show_file,
     "git_rebase": git_rebase,
     "git_init": git_init,
+    "git_bootstrap": git_bootstrap,
+    "git_batch": git_batch,
     "git_config": git_config,
 }
\ No newline at end of file
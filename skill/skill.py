@@ -8,6 +8,7 @@ YAML frontmatter and markdown content.
 
 from base import function_ai, parameters_func, property_param
 import os
+import json
 import yaml
 import re
 from typing import List, Dict, Optional, Tuple
@@ -219,7 +220,7 @@ def scan_skills(skills_dir=".agents/skills") -> str:
             # Update cache
             _SKILL_CACHE[cache_key] = skills
         
-        return str(skills)
+        return json.dumps(skills, ensure_ascii=False, default=str)
         
     except Exception as e:
         return f"Error scanning skills: {e}"
@@ -240,8 +241,7 @@ def get_skills_list(skills_dir=".agents/skills") -> str:
             return skills_result
         
         # Parse skills from string
-        import ast
-        skills = ast.literal_eval(skills_result)
+        skills = json.loads(skills_result)
         
         if not skills:
             return "No skills found. Skills directory may be empty or not configured correctly."
@@ -274,12 +274,11 @@ def get_skill_by_name(skill_name: str, skills_dir=".agents/skills") -> str:
         if skills_result.startswith("Error:"):
             return skills_result
         
-        import ast
-        skills = ast.literal_eval(skills_result)
+        skills = json.loads(skills_result)
         
         for skill in skills:
             if skill['name'] == skill_name:
-                return str(skill)
+                return json.dumps(skill, ensure_ascii=False, default=str)
         
         return f"Error: Skill '{skill_name}' not found."
         
@@ -312,8 +311,7 @@ def load_skill_by_name(skill_name: str, max_sections: Optional[int] = None,
         if skill_result.startswith("Error:"):
             return skill_result
         
-        import ast
-        skill = ast.literal_eval(skill_result)
+        skill = json.loads(skill_result)
         skill_path = skill['full_path']
         
         if not os.path.exists(skill_path):
@@ -453,10 +451,9 @@ def ai_recommend_skills(user_query: str, top_n: int = 3) -> str:
     if skills_result.startswith("Error:"):
         return f"Cannot recommend skills: {skills_result}"
     
-    # Parse skills from string representation
-    import ast
+    # Parse skills from JSON
     try:
-        skills = ast.literal_eval(skills_result)
+        skills = json.loads(skills_result)
     except Exception as e:
         return f"Error parsing skills data: {e}"
 
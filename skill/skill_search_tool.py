@@ -15,7 +15,6 @@ from base import function_ai, parameters_func, property_param
 # Import existing skill functions
 from skill.skill import (
     scan_skills,
-    get_skills_list,
     get_skill_by_name,
     load_skill_by_name,
     ai_recommend_skills
@@ -96,22 +95,13 @@ def _parse_skills_result(skills_result: str) -> List[Dict]:
         return []
     
     try:
-        import ast
-        skills = ast.literal_eval(skills_result)
+        skills = json.loads(skills_result)
         if isinstance(skills, list):
             return skills
         else:
             return []
     except:
-        # Try to parse as JSON if ast fails
-        try:
-            skills = json.loads(skills_result)
-            if isinstance(skills, list):
-                return skills
-            else:
-                return []
-        except:
-            return []
+        return []
 
 def _extract_skill_categories(skill_name: str, skill_content: str) -> List[str]:
     """
@@ -318,8 +308,9 @@ def skill_search(
                 "success": False
             }, indent=2)
         
-        # Get all available skills
-        skills_result = get_skills_list()
+        # Get all available skills (scan_skills returns the JSON list;
+        # get_skills_list is the Markdown rendering of it)
+        skills_result = scan_skills()
         skills = _parse_skills_result(skills_result)
         
         if not skills:
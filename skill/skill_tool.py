@@ -152,9 +152,8 @@ def skill_tool(skill: str, args: str = None) -> str:
         # Get skill info using existing AITools function
         try:
             skill_info_str = get_skill_by_name(skill_name=skill)
-            # get_skill_by_name returns a string representation of a dict
-            import ast
-            skill_info = ast.literal_eval(skill_info_str)
+            # get_skill_by_name returns the skill dict as JSON
+            skill_info = json.loads(skill_info_str)
             
             # Check if it's an error
             if isinstance(skill_info, dict) and "error" in skill_info:
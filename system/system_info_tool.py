@@ -85,8 +85,7 @@ def _get_cpu_info() -> Dict[str, Any]:
         if platform.system() == "Linux":
             # Read CPU info from /proc/cpuinfo on Linux
             with open('/proc/cpuinfo', 'r') as f:
-                lines = f.readlines()
-                for line in lines:
+                for line in f:
                     if line.strip().startswith('model name'):
                         cpu_info["model"] = line.split(':')[1].strip()
                         break
@@ -103,8 +102,7 @@ def _get_cpu_info() -> Dict[str, Any]:
         if platform.system() == "Linux":
             # Read CPU stats from /proc/stat
             with open('/proc/stat', 'r') as f:
-                lines = f.readlines()
-                for line in lines:
+                for line in f:
                     if line.startswith('cpu '):
                         parts = line.split()
                         total = sum(int(x) for x in parts[1:])
@@ -138,9 +136,8 @@ def _get_memory_info() -> Dict[str, Any]:
         try:
             if platform.system() == "Linux":
                 with open('/proc/meminfo', 'r') as f:
-                    lines = f.readlines()
                     mem_data = {}
-                    for line in lines:
+                    for line in f:
                         if ':' in line:
                             key, value = line.split(':', 1)
                             mem_data[key.strip()] = value.strip()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Tests for the docker tools, with the docker CLI replaced by a script or a recorder.
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import docker.docker as docker_module
+from docker.docker import docker_pull_many
+
+
+@unittest.skipIf(os.name == "nt", "the fake docker CLI is a shell script")
+class FakeDockerTestCase(unittest.TestCase):
+    """Base for tests that run a shell script in place of the docker CLI."""
+
+    # Body of the fake `docker` script; "$@" holds the docker arguments
+    SCRIPT = "exit 0"
+
+    def setUp(self):
+        self.bin_dir = tempfile.mkdtemp(prefix="test_docker_")
+        self.addCleanup(shutil.rmtree, self.bin_dir)
+        path = os.path.join(self.bin_dir, "docker")
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n" + self.SCRIPT + "\n")
+        os.chmod(path, 0o755)
+        for name, value in (("_DOCKER_BIN", path), ("_DOCKER_AVAILABLE", True)):
+            patcher = mock.patch.object(docker_module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestQuietDockerCommand(FakeDockerTestCase):
+    """Test suite for _run_docker_command(quiet=True), used by detached run/exec."""
+
+    SCRIPT = """case "$1" in
+run) echo "Unable to find image 'app' locally" >&2; echo "latest: Pulling from app" >&2; echo 4f2a9c;;
+exec) exit 0;;
+denied) echo "permission denied while trying to connect to the docker API" >&2; exit 1;;
+*) head -c 10000 /dev/zero | tr '\\0' x >&2; echo " the end" >&2; exit 2;;
+esac"""
+
+    def test_returns_only_the_id(self):
+        """Test that pull progress on stderr is dropped and the ID line kept."""
+        result = docker_module._run_docker_command(["run", "-d", "app"], quiet=True)
+        self.assertTrue(result.ok)
+        self.assertEqual(str(result), "4f2a9c")
+
+        result = docker_module._run_docker_command(["exec", "-d", "c", "ls"], quiet=True)
+        self.assertEqual(str(result), "Command executed successfully (no output)")
+
+    def test_failures_are_classified(self):
+        """Test that stderr still reaches the error classification."""
+        result = docker_module._run_docker_command(["denied"], quiet=True)
+        self.assertFalse(result.ok)
+        self.assertTrue(result.err.startswith("Error: Permission denied"), result.err)
+
+    def test_error_output_is_bounded(self):
+        """Test that only the last _QUIET_ERROR_BYTES of a failure are kept."""
+        result = docker_module._run_docker_command(["noisy"], quiet=True)
+        self.assertFalse(result.ok)
+        self.assertTrue(result.err.endswith("the end"), result.err[-40:])
+        self.assertLessEqual(len(result.err), docker_module._QUIET_ERROR_BYTES + len("Docker command failed: "))
+
+
+@unittest.skipIf(os.name == "nt", "_run_bounded needs selectable pipes")
+class TestRunBounded(unittest.TestCase):
+    """Test suite for _run_bounded, which caps the output kept from a command."""
+
+    def test_small_output_is_kept_whole(self):
+        """Test that output under the limit comes back unchanged."""
+        returncode, out, err, truncated = docker_module._run_bounded(
+            ["sh", "-c", "echo out; echo err >&2; exit 3"], 10, max_bytes=100)
+        self.assertEqual((returncode, out, err, truncated), (3, "out\n", "err\n", False))
+
+    def test_output_over_limit_is_cut(self):
+        """Test that a command writing past the limit is stopped and its output capped."""
+        start = time.monotonic()
+        returncode, out, err, truncated = docker_module._run_bounded(
+            ["sh", "-c", "yes x; echo never"], 10, max_bytes=1000)
+        self.assertTrue(truncated)
+        self.assertEqual(out, "x\n" * 500)
+        self.assertNotEqual(returncode, 0)
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_tail_keeps_last_lines(self):
+        """Test that tail mode runs to the end and keeps whole lines from the end."""
+        returncode, out, err, truncated = docker_module._run_bounded(
+            ["sh", "-c", "seq 1 100000"], 10, max_bytes=1000, tail=True)
+        self.assertTrue(truncated)
+        self.assertEqual(returncode, 0)
+        self.assertLessEqual(len(out), 1000)
+        lines = out.splitlines()
+        self.assertEqual(lines[-1], "100000")
+        self.assertEqual([int(line) for line in lines], list(range(100001 - len(lines), 100001)))
+
+
+class TestCachedRun(FakeDockerTestCase):
+    """Test suite for the read-only result cache behind _cached_run."""
+
+    # Prints how many times it has run; "bad" fails
+    SCRIPT = """echo x >> "$0.calls"
+[ "$1" = bad ] && { echo broken >&2; exit 1; }
+wc -l < "$0.calls"
+"""
+
+    def setUp(self):
+        super().setUp()
+        docker_module._invalidate_cache()
+        self.addCleanup(docker_module._invalidate_cache)
+
+    def test_reuses_result_within_ttl(self):
+        """Test that a repeated query is answered from the cache until the TTL passes."""
+        self.assertEqual(docker_module._cached_run(["ps"], 60).out, "1")
+        self.assertEqual(docker_module._cached_run(("ps",), 60).out, "1")
+        self.assertEqual(docker_module._cached_run(["ps"], 0).out, "2")
+
+    def test_state_change_invalidates(self):
+        """Test that a state-changing tool drops cached results."""
+        self.assertEqual(docker_module._cached_run(["ps"], 60).out, "1")
+        docker_module.docker_rm("c1")
+        self.assertEqual(docker_module._cached_run(["ps"], 60).out, "3")
+
+    def test_failures_are_not_cached(self):
+        """Test that a failed query is run again on the next call."""
+        self.assertFalse(docker_module._cached_run(["bad"], 60).ok)
+        self.assertFalse(docker_module._cached_run(["bad"], 60).ok)
+        self.assertEqual(docker_module._cached_run(["ps"], 60).out, "3")
+
+
+class TestBulkContainerOperations(FakeDockerTestCase):
+    """Test suite for the all=True paths of docker_start/stop/restart/rm."""
+
+    SCRIPT = """case "$1" in
+ps) [ -f "$0.down" ] && { echo "Cannot connect to the Docker daemon" >&2; exit 1; }; echo c1; echo c2;;
+*) echo "$@";;
+esac"""
+
+    def setUp(self):
+        super().setUp()
+        docker_module._invalidate_cache()
+
+    def test_all_uses_listed_ids(self):
+        """Test that the listed container IDs are passed to the operation."""
+        self.assertEqual(docker_module.docker_rm(all=True, force=True), "rm -f c1 c2")
+
+    def test_listing_error_is_returned(self):
+        """Test that a failed listing is reported instead of being treated as IDs."""
+        open(docker_module._DOCKER_BIN + ".down", "w").close()
+        result = docker_module.docker_stop(all=True)
+        self.assertIn("Cannot connect to the Docker daemon", result)
+        self.assertNotIn("stop", result)
+
+
+class TestFollowLogs(FakeDockerTestCase):
+    """Test suite for docker_logs(follow=True)."""
+
+    # Keeps following, and ignores the SIGTERM sent when the read is over
+    SCRIPT = "trap '' TERM; echo line one; echo line two; exec sleep 30"
+
+    def test_stops_following_process(self):
+        """Test that the logs are returned and the process is killed and reaped."""
+        processes = []
+        popen = subprocess.Popen
+
+        def record(*args, **kwargs):
+            processes.append(popen(*args, **kwargs))
+            return processes[-1]
+
+        start = time.monotonic()
+        with mock.patch.object(docker_module, "_FOLLOW_STOP_TIMEOUT", 0.2), \
+                mock.patch.object(docker_module.subprocess, "Popen", side_effect=record):
+            result = docker_module.docker_logs("c1", follow=True, timeout=1)
+
+        self.assertEqual(result, "line one\nline two")
+        self.assertLess(time.monotonic() - start, 5)
+        process, = processes
+        self.assertIsNotNone(process.returncode)
+        self.assertTrue(process.stdout.closed)
+
+
+class TestQualifyImage(unittest.TestCase):
+    """Test suite for _qualify_image, which docker_pull and docker_push share."""
+
+    def test_adds_registry(self):
+        """Test that an image without a registry gets the given one."""
+        self.assertEqual(docker_module._qualify_image("nginx", "reg.io"), "reg.io/nginx")
+        self.assertEqual(docker_module._qualify_image("library/redis:7", "reg.io:5000"),
+                         "reg.io:5000/library/redis:7")
+
+    def test_replaces_registry_with_port(self):
+        """Test that a registry host with a port is recognized and replaced."""
+        self.assertEqual(docker_module._qualify_image("myhost:5000/lib/app:v1", "reg.io"), "reg.io/lib/app:v1")
+        self.assertEqual(docker_module._qualify_image("myhost:5000/lib/app:v1", "myhost:5000"),
+                         "myhost:5000/lib/app:v1")
+        self.assertEqual(docker_module._qualify_image("ghcr.io/org/app@sha256:ab", "reg.io"),
+                         "reg.io/org/app@sha256:ab")
+
+    def test_push_uses_qualified_name(self):
+        """Test that docker_push pushes the name _qualify_image builds."""
+        with mock.patch.object(docker_module, "_run_docker_command", return_value="") as run:
+            docker_module.docker_push("myhost:5000/lib/app:v1", registry="reg.io")
+        self.assertEqual(run.call_args[0][0], ["push", "reg.io/lib/app:v1"])
+
+
+class TestComposeServiceLevels(unittest.TestCase):
+    """Test suite for the depends_on ordering used by docker_compose_up(max_parallel=...)."""
+
+    COMPOSE = """services:
+  web:
+    depends_on: [api, cache]
+  api:
+    depends_on:
+      db:
+        condition: service_healthy
+  cache: {}
+  db:
+  debug:
+    profiles: [debug]
+    depends_on: [web]
+"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(prefix="test_compose_", suffix=".yml")
+        with os.fdopen(fd, "w") as f:
+            f.write(self.COMPOSE)
+        self.addCleanup(os.unlink, self.path)
+
+    def test_default_services(self):
+        """Test that services come in dependency levels and profiled ones are left out."""
+        self.assertEqual(docker_module._compose_service_levels(self.path),
+                         [["cache", "db"], ["api"], ["web"]])
+
+    def test_selected_services_include_dependencies(self):
+        """Test that requested services bring their dependencies along."""
+        self.assertEqual(docker_module._compose_service_levels(self.path, ["api"]), [["db"], ["api"]])
+        self.assertEqual(docker_module._compose_service_levels(self.path, ["debug"]),
+                         [["cache", "db"], ["api"], ["web"], ["debug"]])
+
+    def test_unorderable_files(self):
+        """Test that unknown services, cycles and missing files give None."""
+        self.assertIsNone(docker_module._compose_service_levels(self.path, ["nope"]))
+        self.assertIsNone(docker_module._compose_service_levels(self.path + ".missing"))
+        with open(self.path, "w") as f:
+            f.write("services:\n  a:\n    depends_on: [b]\n  b:\n    depends_on: [a]\n")
+        self.assertIsNone(docker_module._compose_service_levels(self.path))
+
+
+class TestDockerPullMany(unittest.TestCase):
+    """Test suite for docker_pull_many, with the docker CLI replaced by a recorder."""
+
+    def setUp(self):
+        """Record each docker invocation instead of running it."""
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+        patcher = mock.patch.object(docker_module, "_run_docker_command", side_effect=self._fake_docker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fake_docker(self, args, timeout=30, **kwargs):
+        with self.lock:
+            self.calls.append(args)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        # Stay busy long enough for the other pulls to overlap
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        if args[1].endswith("missing"):
+            return "Error: pull access denied for missing"
+        return f"pulled {args[1]}"
+
+    def test_pulls_every_image_in_order(self):
+        """Test that each image is pulled once and reported in the given order."""
+        result = docker_pull_many(["alpine", "redis:7", "missing"])
+
+        self.assertEqual(result.splitlines(), [
+            "alpine: pulled alpine",
+            "redis:7: pulled redis:7",
+            "missing: Error: pull access denied for missing",
+        ])
+        self.assertEqual(sorted(args[1] for args in self.calls), ["alpine", "missing", "redis:7"])
+        self.assertTrue(all(args[0] == "pull" for args in self.calls))
+
+    def test_comma_separated_images_and_registry(self):
+        """Test that a comma-separated string is split and names are qualified with the registry."""
+        result = docker_pull_many(" nginx, ,library/redis:7 ", registry="reg.io:5000")
+
+        self.assertEqual(result.splitlines(), [
+            "nginx: pulled reg.io:5000/nginx",
+            "library/redis:7: pulled reg.io:5000/library/redis:7",
+        ])
+
+    def test_max_parallel_bounds_concurrency(self):
+        """Test that no more than max_parallel pulls run at once, and that they do overlap."""
+        docker_pull_many([f"image{i}" for i in range(6)], max_parallel=2)
+
+        self.assertEqual(len(self.calls), 6)
+        self.assertEqual(self.max_running, 2)
+
+        self.calls.clear()
+        self.max_running = 0
+        docker_pull_many(["a", "b", "c"], max_parallel=0)
+        self.assertEqual(self.max_running, 1)
+
+    def test_registered_as_tool(self):
+        """Test that docker_pull_many is callable by name with its schema parameters."""
+        self.assertIs(docker_module.TOOL_CALL_MAP["docker_pull_many"], docker_pull_many)
+        self.assertEqual(docker_module._TOOL_SPECS["docker_pull_many"][1], ["images", "registry", "max_parallel"])
+
+    def test_no_images(self):
+        """Test error when no images are given."""
+        self.assertEqual(docker_pull_many([]), "Error: No images specified")
+        self.assertEqual(docker_pull_many(" , "), "Error: No images specified")
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
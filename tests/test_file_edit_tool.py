@@ -12,7 +12,7 @@ import unittest
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from file.file_edit_tool import file_edit
+from file.file_edit_tool import edit as file_edit, edit_many
 
 
 class TestFileEditTool(unittest.TestCase):
@@ -164,6 +164,42 @@ Line 5: End of file"""
         self.assertIsInstance(data["userModified"], bool)
         self.assertIsInstance(data["replaceAll"], bool)
 
+    
+    def test_edit_many(self):
+        """Test applying one replacement to several files, including duplicates and misses."""
+        other = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8')
+        other.write("Hello from another file\n")
+        other.close()
+        missing = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8')
+        missing.write("Nothing to replace\n")
+        missing.close()
+        
+        try:
+            paths = [self.test_file.name, other.name, missing.name, self.test_file.name]
+            data = json.loads(edit_many(paths, "Hello", "Greetings"))
+            
+            # Duplicate paths are edited once, and results keep the given order
+            self.assertEqual(len(data["results"]), 3)
+            self.assertEqual([r.get("filePath") for r in data["results"][:2]],
+                             [self.test_file.name, other.name])
+            self.assertEqual(data["editedCount"], 2)
+            self.assertFalse(data["results"][2].get("_metadata", {}).get("success", False))
+            
+            for path in (self.test_file.name, other.name):
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                self.assertIn("Greetings", content)
+                self.assertNotIn("Hello", content)
+        finally:
+            os.unlink(other.name)
+            os.unlink(missing.name)
+    
+    def test_edit_many_without_paths(self):
+        """Test error when no file paths are given."""
+        data = json.loads(edit_many([], "Hello", "Greetings"))
+        self.assertFalse(data["success"])
+        self.assertIn("error", data)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
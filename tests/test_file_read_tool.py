@@ -13,7 +13,8 @@ import shutil
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from file.file_read_tool import file_read, count_file_lines, format_file_size
+import file.file_read_tool as file_read_tool
+from file.file_read_tool import read as file_read, count_file_lines, format_file_size, _read_lines
 
 def create_test_file(content: str, suffix: str = ".txt") -> str:
     """Create a temporary test file with given content."""
@@ -360,6 +361,76 @@ def test_performance_considerations():
     finally:
         os.remove(test_file)
 
+def _text_mode_read(path: str, offset: int, limit: int):
+    """Reference line slice and line count from a text-mode read (the original reader)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    end = len(lines) if limit == 0 else offset - 1 + limit
+    return ''.join(lines[offset - 1:end]), len(lines)
+
+def test_read_lines_matches_text_mode_reader():
+    """Test that the byte-level line reader matches text-mode reads for every newline style."""
+    print("\n" + "=" * 60)
+    print("Test 11: Line Slicing Across Newline Styles")
+    print("=" * 60)
+    
+    samples = {
+        "LF": b"one\ntwo\n\nfour\nfive",
+        "CRLF": b"one\r\ntwo\r\n\r\nfour\r\nfive\r\n",
+        "CR": b"l1\rl2\rl3\r",
+        "mixed": b"a\r\nb\rc\nd\r\r\ne\n\r",
+        "empty": b"",
+    }
+    saved_threshold = file_read_tool._MMAP_THRESHOLD
+    temp_dir = tempfile.mkdtemp()
+    
+    try:
+        for name, data in samples.items():
+            path = os.path.join(temp_dir, name + ".txt")
+            with open(path, 'wb') as f:
+                f.write(data)
+            # Small files are read into memory, larger ones mapped; cover both
+            for threshold in (saved_threshold, 1):
+                file_read_tool._MMAP_THRESHOLD = threshold
+                for offset in range(1, 8):
+                    for limit in range(0, 4):
+                        if threshold == 1 and not data:
+                            continue  # an empty file cannot be mapped
+                        expected = _text_mode_read(path, offset, limit)
+                        actual = _read_lines(path, offset, limit)
+                        assert actual == expected, \
+                            f"{name} offset={offset} limit={limit}: {actual!r} != {expected!r}"
+            assert count_file_lines(path) == _text_mode_read(path, 1, 0)[1], \
+                f"{name}: count_file_lines mismatch"
+        
+        print("✓ Offset/limit slices and line counts match the text-mode reader")
+        print(f"  Checked {', '.join(samples)} newlines")
+    
+    finally:
+        file_read_tool._MMAP_THRESHOLD = saved_threshold
+        shutil.rmtree(temp_dir)
+
+def test_carriage_return_only_file():
+    """Test reading a file whose lines end in a lone CR."""
+    print("\n" + "=" * 60)
+    print("Test 12: CR-only Line Endings")
+    print("=" * 60)
+    
+    fd, test_file = tempfile.mkstemp(suffix=".txt")
+    with os.fdopen(fd, 'wb') as f:
+        f.write(b"l1\rl2\rl3\r")
+    
+    try:
+        data = json.loads(file_read(test_file, offset=2, limit=1))
+        assert data["file"]["totalLines"] == 3, f"Expected totalLines 3, got {data['file']['totalLines']}"
+        assert data["file"]["content"] == "l2", f"Expected 'l2', got {data['file']['content']!r}"
+        assert count_file_lines(test_file) == 3, "count_file_lines should count CR line endings"
+        
+        print("✓ CR-only line endings test passed")
+    
+    finally:
+        os.remove(test_file)
+
 def main():
     """Run all tests."""
     print("FileReadTool Test Suite")
@@ -378,6 +449,8 @@ def main():
         test_helper_functions,
         test_unicode_and_encoding,
         test_performance_considerations,
+        test_read_lines_matches_text_mode_reader,
+        test_carriage_return_only_file,
     ]
     
     passed = 0
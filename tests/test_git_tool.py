@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Tests for the git tools: deferred adds, git_show_file, git_batch and git_bootstrap.
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import git.git as git_module
+from git.git import (
+    git_add, git_add_flush, git_batch, git_bootstrap, git_commit, git_show_file,
+)
+
+# Commits need an identity, whatever the global git config holds
+GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class TestGitTool(unittest.TestCase):
+    """Test suite for the git tools."""
+
+    def setUp(self):
+        """Create an empty repository."""
+        self.env = mock.patch.dict(os.environ, GIT_IDENTITY)
+        self.env.start()
+        self.repo = tempfile.mkdtemp(prefix="test_git_")
+        self._git("init", "-q")
+
+    def tearDown(self):
+        """Stop cat-file sessions and remove the repository."""
+        git_module._close_cat_file_sessions()
+        self.env.stop()
+        shutil.rmtree(self.repo)
+
+    def _git(self, *args, cwd=None):
+        return subprocess.run(["git", *args], cwd=cwd or self.repo, capture_output=True,
+                              text=True, check=True).stdout
+
+    def _write(self, name, content):
+        with open(os.path.join(self.repo, name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def _staged(self):
+        return self._git("diff", "--cached", "--name-only").split()
+
+    def test_deferred_add_flush(self):
+        """Test that deferred adds are queued and staged by one flush."""
+        self._write("a.txt", "a\n")
+        self._write("b.txt", "b\n")
+
+        self.assertEqual(git_add(self.repo, file="a.txt", defer=True), "Queued 1 file(s) for git add")
+        self.assertEqual(git_add(self.repo, files=["b.txt", "a.txt"], defer=True),
+                         "Queued 2 file(s) for git add")
+
+        git_add_flush(self.repo)
+        self.assertEqual(self._staged(), ["a.txt", "b.txt"])
+        self.assertEqual(git_add_flush(self.repo), "Command executed successfully (no output)")
+
+    def test_deferred_add_flushes_after_delay(self):
+        """Test that queued files are added once the flush delay passes."""
+        self._write("a.txt", "a\n")
+        git_add(self.repo, file="a.txt", defer=True)
+
+        time.sleep(git_module._ADD_FLUSH_DELAY + 0.5)
+        self.assertEqual(self._staged(), ["a.txt"])
+
+    def test_deferred_add_error_fails_next_command(self):
+        """Test that a bad pathspec is reported by the next command and the rest is still staged."""
+        self._write("a.txt", "a\n")
+        self._write("b.txt", "b\n")
+        git_add(self.repo, files=["a.txt", "missing.txt", "b.txt"], defer=True)
+
+        result = git_commit(self.repo, message="first")
+        self.assertTrue(result.startswith("Error: Deferred git add failed"), result)
+        self.assertIn("missing.txt", result)
+        self.assertEqual(self._staged(), ["a.txt", "b.txt"])
+
+        # The failure is reported once; the next commit goes ahead
+        self.assertIn("first", git_commit(self.repo, message="first"))
+        self.assertEqual(self._git("ls-files").split(), ["a.txt", "b.txt"])
+
+    def test_deferred_add_error_reported_by_flush(self):
+        """Test that git_add_flush returns the error of an add flushed by its timer."""
+        git_add(self.repo, file="missing.txt", defer=True)
+        time.sleep(git_module._ADD_FLUSH_DELAY + 0.5)
+
+        self.assertTrue(git_add_flush(self.repo).startswith("Git command failed:"))
+        # Already reported, so later commands are not failed for it
+        self.assertFalse(git_commit(self.repo, message="empty").startswith("Error: Deferred"))
+
+    def test_show_file_follows_head(self):
+        """Test that git_show_file reads the current HEAD after new commits."""
+        self._write("f.txt", "one\n")
+        self._git("add", "f.txt")
+        self._git("commit", "-q", "-m", "one")
+        self.assertEqual(git_show_file(self.repo, file="f.txt"), "one")
+
+        self._write("f.txt", "two\n")
+        self._git("commit", "-q", "-am", "two")
+        self.assertEqual(git_show_file(self.repo, file="f.txt"), "two")
+        self.assertEqual(git_show_file(self.repo, commit_hash="HEAD~1", file="f.txt"), "one")
+
+        self.assertTrue(git_show_file(self.repo, file="missing.txt").startswith("Git command failed:"))
+        self.assertEqual(git_show_file(self.repo), "Error: File is required for git_show_file")
+
+    def test_show_file_falls_back_when_session_fails(self):
+        """Test that a broken cat-file session is dropped and git show answers instead."""
+        self._write("f.txt", "one\n")
+        self._git("add", "f.txt")
+        self._git("commit", "-q", "-m", "one")
+
+        with mock.patch.object(git_module._CatFileSession, "get",
+                               side_effect=TimeoutError("git cat-file did not answer in time")):
+            self.assertEqual(git_show_file(self.repo, file="f.txt"), "one")
+        self.assertEqual(len(git_module._CAT_FILE_SESSIONS), 0)
+
+    def test_idle_sessions_are_reaped(self):
+        """Test that the reaper closes idle cat-file sessions and skips busy ones."""
+        self._write("f.txt", "one\n")
+        self._git("add", "f.txt")
+        self._git("commit", "-q", "-m", "one")
+
+        with mock.patch.object(git_module, "_CAT_FILE_IDLE_TIMEOUT", 0.1):
+            self.assertEqual(git_show_file(self.repo, file="f.txt"), "one")
+            session, = git_module._CAT_FILE_SESSIONS.values()
+
+            # A session in use is left alone, however long it has been idle
+            with session.lock:
+                time.sleep(0.3)
+                self.assertIn(session, git_module._CAT_FILE_SESSIONS.values())
+
+            time.sleep(0.3)
+            self.assertEqual(len(git_module._CAT_FILE_SESSIONS), 0)
+            self.assertFalse(session.alive())
+
+    def test_batch(self):
+        """Test that git_batch returns each call's output in order."""
+        self._write("a.txt", "a\n")
+        other = tempfile.mkdtemp(prefix="test_git_")
+        try:
+            subprocess.run(["git", "init", "-q"], cwd=other, check=True)
+            results = git_batch([
+                {"name": "git_add", "args": {"repo_path": self.repo, "file": "a.txt"}},
+                {"name": "git_status", "args": {"repo_path": other}},
+                {"name": "git_nope", "args": {}},
+                {"name": "git_status", "args": {"bogus": 1}},
+                {"name": "git_batch", "args": {"calls": []}},
+            ])
+        finally:
+            shutil.rmtree(other)
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[0], "Command executed successfully (no output)")
+        self.assertIn("No commits yet", results[1])
+        self.assertEqual(results[2], "Error: Unknown git tool: git_nope")
+        self.assertTrue(results[3].startswith("Error: Invalid arguments for git_status"))
+        self.assertEqual(results[4], "Error: Unknown git tool: git_batch")
+        self.assertEqual(self._staged(), ["a.txt"])
+        self.assertEqual(git_batch([]), [])
+        self.assertIs(git_module.TOOL_CALL_MAP["git_batch"], git_batch)
+        self.assertIn("git_batch", [tool["function"]["name"] for tool in git_module.tools])
+
+    def test_bootstrap(self):
+        """Test that git_bootstrap creates the repository, branch, remote and first commit."""
+        path = os.path.join(self.repo, "new")
+        result = git_bootstrap(path, url="https://example.com/r.git; touch pwned",
+                               branch="dev", message="it's $(id)")
+
+        self.assertIn("it's $(id)", result)
+        self.assertFalse(os.path.exists(os.path.join(path, "pwned")))
+        self.assertEqual(self._git("branch", "--show-current", cwd=path).strip(), "dev")
+        self.assertEqual(self._git("remote", "get-url", "origin", cwd=path).strip(),
+                         "https://example.com/r.git; touch pwned")
+
+        # A failing step stops the chain and is returned
+        result = git_bootstrap(os.path.join(self.repo, "bad"), branch="bad..name")
+        self.assertTrue(result.startswith("Git command failed:"), result)
+
+    def test_bootstrap_rerun(self):
+        """Test that git_bootstrap can run again over a repository whose origin exists."""
+        path = os.path.join(self.repo, "new")
+        git_bootstrap(path, url="https://example.com/old.git", branch="dev")
+        result = git_bootstrap(path, url="https://example.com/new.git", branch="dev", message="again")
+
+        self.assertIn("again", result)
+        self.assertEqual(self._git("remote", "get-url", "origin", cwd=path).strip(), "https://example.com/new.git")
+        self.assertEqual(self._git("rev-list", "--count", "HEAD", cwd=path).strip(), "2")
+
+
+if __name__ == "__main__":
+    unittest.main()
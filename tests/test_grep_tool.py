@@ -17,6 +17,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from file.grep_tool import grep
 
+# file包把grep_tool名字绑定为工具定义列表，模块本身从sys.modules取
+grep_tool = sys.modules[grep.__module__]
+
 class TestGrepTool:
     """GrepTool测试类"""
     
@@ -301,6 +304,49 @@ Another test in nested dir.""")
         assert data_context["mode"] == "content"
         # 两个结果都应该有效
 
+    def _write_parity_files(self):
+        """写入预筛容易出错的文件：非法字节、各种换行、超过mmap阈值的大文件"""
+        samples = {
+            "invalid.txt": b"ab\xffc\nno match\n",
+            "split.txt": b"te\xc3st\nTE\xffST\n",
+            "crlf.txt": b"a test\r\nTest\rtest\n",
+            "clean.txt": "caf\u00e9 only\n".encode("utf-8"),
+            "big.bin": b"x" * (grep_tool._MMAP_SCAN_THRESHOLD + 10) + b"te\xffst\n",
+        }
+        os.makedirs("parity", exist_ok=True)
+        for name, data in samples.items():
+            with open(os.path.join("parity", name), "wb") as f:
+                f.write(data)
+    
+    def test_grep_literal_across_invalid_bytes(self):
+        """测试被忽略的非法字节两侧拼成的匹配不会被字节预筛跳过"""
+        self._write_parity_files()
+        result = grep(pattern="abc", path="parity")
+        data = json.loads(result)
+        
+        filenames = [os.path.basename(f) for f in data["filenames"]]
+        assert "invalid.txt" in filenames
+    
+    def test_grep_prefilter_parity(self, monkeypatch):
+        """测试字节预筛与ASCII字面量快速路径的结果与完整正则搜索一致"""
+        self._write_parity_files()
+        patterns = ["test", "abc", "TEST", "only", "caf\u00e9", "no match", "t\nT"]
+        
+        def search_all():
+            results = {}
+            for pattern in patterns:
+                for case_insensitive in (False, True):
+                    data = json.loads(grep(pattern=pattern, path="parity", output_mode="content",
+                                           n=True, i=case_insensitive, head_limit=0))
+                    results[pattern, case_insensitive] = (data.get("numLines"), data.get("content"))
+            return results
+        
+        fast = search_all()
+        # 关闭预筛和小写字面量查找，所有文件都走解码后的正则搜索
+        monkeypatch.setattr(grep_tool, "_file_may_contain", lambda filepath, needle: True)
+        monkeypatch.setattr(grep_tool, "_ascii_literal_needle", lambda pattern, case_insensitive: None)
+        assert search_all() == fast
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, "-v"])
\ No newline at end of file
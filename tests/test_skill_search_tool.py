@@ -28,7 +28,7 @@ class TestSkillSearchToolHelpers(unittest.TestCase):
     
     def test_parse_skills_result_valid(self):
         """Test parsing valid skills result."""
-        skills_data = "[{'name': 'test_skill', 'description': 'A test skill'}]"
+        skills_data = '[{"name": "test_skill", "description": "A test skill"}]'
         result = _parse_skills_result(skills_data)
         
         self.assertEqual(len(result), 1)
@@ -216,7 +216,7 @@ class TestSkillSearchToolMain(unittest.TestCase):
         """Parse JSON result from skill_search function."""
         return json.loads(result_str)
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_empty_query(self, mock_get_skills):
         """Test search with empty query."""
         result = skill_search("")
@@ -226,7 +226,7 @@ class TestSkillSearchToolMain(unittest.TestCase):
         self.assertFalse(data.get("success", True))
         self.assertIn("non-empty string", data["error"])
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_invalid_limit(self, mock_get_skills):
         """Test search with invalid limit."""
         result = skill_search("test", limit=0)
@@ -236,7 +236,7 @@ class TestSkillSearchToolMain(unittest.TestCase):
         self.assertFalse(data.get("success", True))
         self.assertIn("must be positive", data["error"])
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_no_skills_available(self, mock_get_skills):
         """Test search when no skills are available."""
         mock_get_skills.return_value = ""
@@ -249,12 +249,14 @@ class TestSkillSearchToolMain(unittest.TestCase):
         self.assertEqual(data["results"], [])
         self.assertIn("No skills available", data["message"])
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_successful_search(self, mock_get_skills):
         """Test successful skill search."""
         # Mock skills data
-        mock_skills = "[{'name': 'file_reader', 'description': 'Reads files from disk'}, " \
-                      "{'name': 'web_fetcher', 'description': 'Fetches web content'}]"
+        mock_skills = json.dumps([
+            {'name': 'file_reader', 'description': 'Reads files from disk'},
+            {'name': 'web_fetcher', 'description': 'Fetches web content'},
+        ])
         mock_get_skills.return_value = mock_skills
         
         # Mock load_skill_by_name for content snippets
@@ -276,12 +278,16 @@ class TestSkillSearchToolMain(unittest.TestCase):
             self.assertGreater(first_result["score"], 0)
             self.assertIn("reasons", first_result)
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_search_with_category_filter(self, mock_get_skills):
         """Test search with category filter."""
         # Mock skills data with categories in content
-        mock_skills = "[{'name': 'file_reader', 'description': 'Reads files', 'content': '---\\nname: file_reader\\ncategories: [file]\\n---\\n# Content'}, " \
-                      "{'name': 'git_commit', 'description': 'Git commit', 'content': '---\\nname: git_commit\\ncategories: [git]\\n---\\n# Content'}]"
+        mock_skills = json.dumps([
+            {'name': 'file_reader', 'description': 'Reads files',
+             'content': '---\nname: file_reader\ncategories: [file]\n---\n# Content'},
+            {'name': 'git_commit', 'description': 'Git commit',
+             'content': '---\nname: git_commit\ncategories: [git]\n---\n# Content'},
+        ])
         mock_get_skills.return_value = mock_skills
         
         result = skill_search("test", category="file")
@@ -293,11 +299,13 @@ class TestSkillSearchToolMain(unittest.TestCase):
         # Should have at least one result
         self.assertGreaterEqual(data["results_count"], 1)
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_search_exact_match(self, mock_get_skills):
         """Test search with exact match."""
-        mock_skills = "[{'name': 'file', 'description': 'File operations'}, " \
-                      "{'name': 'file_reader', 'description': 'Reads files'}]"
+        mock_skills = json.dumps([
+            {'name': 'file', 'description': 'File operations'},
+            {'name': 'file_reader', 'description': 'Reads files'},
+        ])
         mock_get_skills.return_value = mock_skills
         
         result = skill_search("file", exact_match=True)
@@ -312,10 +320,10 @@ class TestSkillSearchToolMain(unittest.TestCase):
             # The exact match "file" should have higher score
             self.assertEqual(first_result["name"], "file")
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_search_include_content(self, mock_get_skills):
         """Test search with content snippets."""
-        mock_skills = "[{'name': 'file_reader', 'description': 'Reads files'}]"
+        mock_skills = json.dumps([{'name': 'file_reader', 'description': 'Reads files'}])
         mock_get_skills.return_value = mock_skills
         
         with patch('skill.skill_search_tool.load_skill_by_name') as mock_load:
@@ -333,14 +341,13 @@ class TestSkillSearchToolMain(unittest.TestCase):
                 self.assertIn("content_snippet", first_result)
                 self.assertLessEqual(len(first_result["content_snippet"]), 103)  # 100 + "..."
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_search_limit(self, mock_get_skills):
         """Test search with limit."""
         # Create more skills than limit
-        mock_skills = "[" + ", ".join(
-            [f"{{'name': 'skill_{i}', 'description': 'Skill {i}'}}" 
-             for i in range(15)]
-        ) + "]"
+        mock_skills = json.dumps(
+            [{'name': f'skill_{i}', 'description': f'Skill {i}'} for i in range(15)]
+        )
         mock_get_skills.return_value = mock_skills
         
         result = skill_search("skill", limit=5)
@@ -351,11 +358,13 @@ class TestSkillSearchToolMain(unittest.TestCase):
         self.assertEqual(len(data["results"]), 5)
         self.assertEqual(data["_metadata"]["limit_applied"], 5)
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_search_no_matches(self, mock_get_skills):
         """Test search with no matches."""
-        mock_skills = "[{'name': 'file_reader', 'description': 'Reads files'}, " \
-                      "{'name': 'web_fetcher', 'description': 'Fetches web content'}]"
+        mock_skills = json.dumps([
+            {'name': 'file_reader', 'description': 'Reads files'},
+            {'name': 'web_fetcher', 'description': 'Fetches web content'},
+        ])
         mock_get_skills.return_value = mock_skills
         
         result = skill_search("nonexistent_term")
@@ -368,10 +377,10 @@ class TestSkillSearchToolMain(unittest.TestCase):
         for result_item in data["results"]:
             self.assertEqual(result_item["score"], 0)
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_search_exact_match_no_matches(self, mock_get_skills):
         """Test exact match search with no matches."""
-        mock_skills = "[{'name': 'file_reader', 'description': 'Reads files'}]"
+        mock_skills = json.dumps([{'name': 'file_reader', 'description': 'Reads files'}])
         mock_get_skills.return_value = mock_skills
         
         result = skill_search("nonexistent", exact_match=True)
@@ -381,7 +390,7 @@ class TestSkillSearchToolMain(unittest.TestCase):
         # In exact mode with no matches, should return empty results
         self.assertEqual(data["results_count"], 0)
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_search_error_handling(self, mock_get_skills):
         """Test error handling during search."""
         mock_get_skills.side_effect = Exception("Skills fetch failed")
@@ -393,10 +402,10 @@ class TestSkillSearchToolMain(unittest.TestCase):
         self.assertIn("error", data)
         self.assertIn("Skill search failed", data["error"])
     
-    @patch('skill.skill_search_tool.get_skills_list')
+    @patch('skill.skill_search_tool.scan_skills')
     def test_search_json_structure(self, mock_get_skills):
         """Test JSON response structure."""
-        mock_skills = "[{'name': 'test_skill', 'description': 'A test skill'}]"
+        mock_skills = json.dumps([{'name': 'test_skill', 'description': 'A test skill'}])
         mock_get_skills.return_value = mock_skills
         
         result = skill_search("test")
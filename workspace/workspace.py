@@ -7,6 +7,7 @@ import venv
 import json
 import shutil
 from pathlib import Path
+from itertools import islice
 
 __WORKSPACE_PROPERTY_ONE__ = property_param(
     name="workspace_path",
@@ -944,7 +945,7 @@ def check_virtualenv(venv_path: str) -> str:
             result.append(f"  ✓ Configuration file: {pyvenv_cfg}")
             # Read and display some config
             with open(pyvenv_cfg, "r") as f:
-                for line in f.readlines()[:3]:  # First 3 lines
+                for line in islice(f, 3):  # First 3 lines
                     result.append(f"    {line.strip()}")
         else:
             result.append("  ✗ Configuration file: NOT FOUND")